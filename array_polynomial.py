@@ -0,0 +1,239 @@
+from __future__ import annotations
+from typing import Iterable, Tuple
+from weakref import WeakKeyDictionary
+from polynomial import Polynomial
+from quiver import Quiver, _Path, _PathDictionary
+from linalg.Fp import GF, FpScalar, _scalarClass
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional.
+    np = None
+
+# Sort keys of the paths of a path dictionary as a NumPy array, extended when
+# the dictionary grows. Keys that do not fit in int64 are stored as objects.
+_keyArrays: WeakKeyDictionary = WeakKeyDictionary()
+
+
+class ArrayPolynomial:
+    """A polynomial over GF(p) stored as two NumPy arrays of equal length: the
+    ids of the paths in its support, in increasing order, and their non-zero
+    coefficients as int64 in range(p). Path ids are taken from the dictionary of
+    the quiver, so polynomials over the same quiver can be added and reduced by
+    vectorized operations on their arrays. Requires NumPy."""
+
+    __slots__ = ("quiver", "p", "ids", "coefficients")
+
+    def __init__(
+        self,
+        quiver: Quiver,
+        p: int,
+        terms: Iterable[Tuple[_Path, int | FpScalar]] = (),
+    ) -> None:
+        assert np is not None, ImportError("ArrayPolynomial requires NumPy.")
+        GF(p)  # Checks that p is prime, once per prime.
+        dictionary = quiver._pathDictionary()
+        accumulated: dict[int, int] = {}
+        for path, c in terms:
+            i = dictionary.id(path)
+            accumulated[i] = (accumulated.get(i, 0) + int(c)) % p
+        ids = np.array(sorted(accumulated), dtype=np.int64)
+        coefficients = np.array([accumulated[i] for i in ids.tolist()], np.int64)
+        mask = coefficients != 0
+        self.quiver = quiver
+        self.p = p
+        self.ids = ids[mask]
+        self.coefficients = coefficients[mask]
+
+    @classmethod
+    def _fromArrays(
+        cls, quiver: Quiver, p: int, ids: np.ndarray, coefficients: np.ndarray
+    ) -> ArrayPolynomial:
+        """Build a polynomial from sorted ids and coefficients in range(p),
+        dropping zero coefficients."""
+        polynomial = cls.__new__(cls)
+        polynomial.quiver = quiver
+        polynomial.p = p
+        mask = coefficients != 0
+        if mask.all():
+            polynomial.ids = ids
+            polynomial.coefficients = coefficients
+        else:
+            polynomial.ids = ids[mask]
+            polynomial.coefficients = coefficients[mask]
+        return polynomial
+
+    @classmethod
+    def fromPolynomial(
+        cls, polynomial: Polynomial, quiver: Quiver, p: int
+    ) -> ArrayPolynomial:
+        """Convert a polynomial with coefficients in GF(p), or integers."""
+        return cls(quiver, p, polynomial.terms.items())
+
+    def toPolynomial(self) -> Polynomial:
+        """Convert to a polynomial with coefficients in GF(p)."""
+        return Polynomial(list(self.terms.items()))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def terms(self) -> dict[_Path, FpScalar]:
+        """The terms of the polynomial as a dictionary, built on each access."""
+        scalar = _scalarClass(self.p)._make
+        paths = self.quiver._pathDictionary().paths
+        return {
+            paths[i]: scalar(c)
+            for i, c in zip(self.ids.tolist(), self.coefficients.tolist())
+        }
+
+    def _paths(self) -> list[_Path]:
+        """The paths with non-zero coefficient, in increasing order of id. Unlike
+        terms, this does not build the coefficients."""
+        paths = self.quiver._pathDictionary().paths
+        return [paths[i] for i in self.ids.tolist()]
+
+    @property
+    def support(self) -> list[_Path]:
+        """The paths with non-zero coefficient, from the largest to the smallest."""
+        paths = self.quiver._pathDictionary().paths
+        order = np.argsort(self._keys(), kind="stable")
+        return [paths[i] for i in self.ids[order].tolist()]
+
+    def coefficient(self, path: _Path) -> FpScalar | None:
+        """Return the coefficient of a path in the polynomial, or None if the
+        path is not in the support."""
+        i = self.quiver._pathDictionary().ids.get(path)
+        position = self._position(i) if i is not None else None
+        if position is None:
+            return None
+        return _scalarClass(self.p)._make(int(self.coefficients[position]))
+
+    def _position(self, i: int) -> int | None:
+        """Return the index of a path id in self.ids, or None."""
+        position = int(np.searchsorted(self.ids, i))
+        if position < len(self.ids) and self.ids[position] == i:
+            return position
+        return None
+
+    def _keys(self) -> np.ndarray:
+        return _keyArray(self.quiver._pathDictionary())[self.ids]
+
+    def _leadingPosition(self) -> int:
+        assert len(self.ids), ValueError("The zero polynomial has no leading term.")
+        return int(np.argmin(self._keys()))
+
+    def LT(self) -> Tuple[_Path, FpScalar]:
+        """Return the pair (leading monomial, leading coefficient)."""
+        return self.LM(), self.LC()
+
+    def LM(self) -> _Path:
+        """Return the largest path in the support."""
+        i = int(self.ids[self._leadingPosition()])
+        return self.quiver._pathDictionary().paths[i]
+
+    def LC(self) -> FpScalar:
+        """Return the coefficient of the largest path in the support."""
+        c = int(self.coefficients[self._leadingPosition()])
+        return _scalarClass(self.p)._make(c)
+
+    def __str__(self) -> str:
+        return str(self.toPolynomial())
+
+    def __eq__(self, other: ArrayPolynomial) -> bool:
+        return (
+            self.p == other.p
+            and np.array_equal(self.ids, other.ids)
+            and np.array_equal(self.coefficients, other.coefficients)
+        )
+
+    __hash__ = None
+
+    def _combine(self, other: ArrayPolynomial, factor: int) -> ArrayPolynomial:
+        """Return self + factor * other, for 0 <= factor < p."""
+        assert self.p == other.p, ValueError("Polynomials over different fields.")
+        p = self.p
+        if np.array_equal(self.ids, other.ids):  # Aligned supports.
+            ids = self.ids
+            coefficients = (self.coefficients + factor * other.coefficients) % p
+        else:
+            ids = np.union1d(self.ids, other.ids)
+            coefficients = np.zeros(len(ids), dtype=np.int64)
+            coefficients[np.searchsorted(ids, self.ids)] = self.coefficients
+            positions = np.searchsorted(ids, other.ids)
+            coefficients[positions] += factor * other.coefficients
+            coefficients %= p
+        return ArrayPolynomial._fromArrays(self.quiver, p, ids, coefficients)
+
+    def __add__(self, other: ArrayPolynomial) -> ArrayPolynomial:
+        return self._combine(other, 1)
+
+    def __sub__(self, other: ArrayPolynomial) -> ArrayPolynomial:
+        return self._combine(other, self.p - 1)
+
+    def __neg__(self) -> ArrayPolynomial:
+        return ArrayPolynomial._fromArrays(
+            self.quiver, self.p, self.ids, (self.p - self.coefficients) % self.p
+        )
+
+    def __mul__(self, scalar: int | FpScalar) -> ArrayPolynomial:
+        """Multiplication by a scalar of GF(p)."""
+        c = int(scalar) % self.p
+        return ArrayPolynomial._fromArrays(
+            self.quiver, self.p, self.ids, self.coefficients * c % self.p
+        )
+
+    def _makeMonic(self) -> ArrayPolynomial:
+        """Given a non-zero polynomial f, divide it by its leading coefficient."""
+        return self * pow(int(self.LC()), -1, self.p)
+
+    def _subMultiple(self, q: ArrayPolynomial, c: int | FpScalar) -> ArrayPolynomial:
+        """Return self - c * q."""
+        return self._combine(q, -int(c) % self.p)
+
+    def _copy(self) -> ArrayPolynomial:
+        # The arrays are never written to, so they can be shared.
+        return ArrayPolynomial._fromArrays(
+            self.quiver, self.p, self.ids, self.coefficients
+        )
+
+    def _isubMultiple(self, q: ArrayPolynomial, c: int | FpScalar) -> ArrayPolynomial:
+        """Replace self by self - c * q in place and return it."""
+        result = self._subMultiple(q, c)
+        self.ids = result.ids
+        self.coefficients = result.coefficients
+        return self
+
+    def _linearReduceWithRespectTo(self, q: ArrayPolynomial) -> ArrayPolynomial:
+        """If LM(q) appears in the polynomial p with coefficient c, return
+        p - c / LC(q) * q. If not, return p."""
+        leading = q._leadingPosition()
+        position = self._position(int(q.ids[leading]))
+        if position is None:
+            return self
+        c = int(self.coefficients[position])
+        return self._subMultiple(q, c * pow(int(q.coefficients[leading]), -1, self.p))
+
+    def _isLinearlyReducedWithRespectTo(self, ps: list[ArrayPolynomial]) -> bool:
+        """Check that no path in the support of self is the leading term of a
+        polynomial of ps."""
+        return not any(
+            self._position(int(q.ids[q._leadingPosition()])) is not None for q in ps
+        )
+
+
+def _keyArray(dictionary: _PathDictionary) -> np.ndarray:
+    """Return the sort keys of the paths of a dictionary, indexed by path id."""
+    keys = _keyArrays.get(dictionary)
+    size = 0 if keys is None else len(keys)
+    if size < len(dictionary):
+        new = dictionary.keys[size:]
+        if keys is not None and keys.dtype == object:
+            dtype = object
+        else:
+            fits = all(-(2**63) <= key < 2**63 for key in new)
+            dtype = np.int64 if fits else object
+        new = np.array(new, dtype=dtype)
+        keys = new if keys is None else np.concatenate([keys.astype(dtype), new])
+        _keyArrays[dictionary] = keys
+    return keys
@@ -0,0 +1,196 @@
+from __future__ import annotations
+from typing import Iterable, Iterator, Tuple, TYPE_CHECKING
+import quiver
+
+if TYPE_CHECKING:
+    from rewriting import RewritingRule
+
+# An Aho-Corasick automaton over the arrows of a quiver, whose patterns are the
+# leading terms of rewriting rules. The trie is updated in place when rules are
+# added or removed. Failure links depend on the whole trie, so every update bumps
+# a version number and the links of a node are recomputed lazily, only when a
+# scan visits the node with a stale version.
+
+
+class _Node:
+    __slots__ = (
+        "parent",
+        "arrow",
+        "depth",
+        "children",
+        "rules",
+        "_fail",
+        "_output",
+        "_version",
+    )
+
+    def __init__(self, parent: _Node | None, arrow: int | None) -> None:
+        self.parent = parent
+        self.arrow = arrow
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.children: dict[int, _Node] = {}
+        self.rules: list[Tuple[int, RewritingRule]] = []  # Pairs (priority, rule).
+        self._fail: _Node | None = None
+        self._output: _Node | None = None
+        self._version = -1
+
+
+class DivisorIndex:
+    """Index of the leading terms of a collection of rewriting rules, which
+    finds all occurrences of leading terms in a path in a single scan.
+
+    Rules are prioritized by insertion order: among matches starting at the same
+    position, the rule that was added first wins."""
+
+    def __init__(self, rules: Iterable[RewritingRule] = ()) -> None:
+        self._root = _Node(None, None)
+        self._stationary: dict[int, list[Tuple[int, RewritingRule]]] = {}
+        self._version = 0
+        self._counter = 0
+        self._maxDepth = 0
+        for rule in rules:
+            self.add(rule)
+
+    def add(self, rule: RewritingRule) -> None:
+        """Insert the leading term of a rewriting rule in the index."""
+        self._counter += 1
+        path = rule.leading_term
+        if not path.monomial:
+            self._stationary.setdefault(path.source, []).append((self._counter, rule))
+            return
+
+        node = self._root
+        for arrow in path.monomial:
+            child = node.children.get(arrow)
+            if child is None:
+                child = node.children[arrow] = _Node(node, arrow)
+            node = child
+        node.rules.append((self._counter, rule))
+        self._maxDepth = max(self._maxDepth, node.depth)
+        self._version += 1
+
+    def remove(self, rule: RewritingRule) -> None:
+        """Remove a rewriting rule from the index. Trie nodes that no longer
+        lead to any leading term are pruned."""
+        path = rule.leading_term
+        if not path.monomial:
+            rules = self._stationary.get(path.source, [])
+            rules[:] = [pair for pair in rules if pair[1] is not rule]
+            return
+
+        node = self._root
+        for arrow in path.monomial:
+            node = node.children.get(arrow)
+            assert node is not None, ValueError(f"Rule {rule} is not in the index.")
+        before = len(node.rules)
+        node.rules = [pair for pair in node.rules if pair[1] is not rule]
+        assert len(node.rules) < before, ValueError(f"Rule {rule} is not in the index.")
+
+        while node.parent is not None and not node.rules and not node.children:
+            del node.parent.children[node.arrow]
+            node = node.parent
+        self._version += 1
+
+    def _fail(self, node: _Node) -> _Node:
+        """Return the node of the longest proper suffix of the word of node
+        that is in the trie."""
+        if node._version != self._version:
+            self._refresh(node)
+        return node._fail
+
+    def _output(self, node: _Node) -> _Node | None:
+        """Return the node of the longest proper suffix of the word of node
+        that is a leading term, or None if there is no such suffix."""
+        if node._version != self._version:
+            self._refresh(node)
+        return node._output
+
+    def _refresh(self, node: _Node) -> None:
+        if node.depth <= 1:
+            node._fail = self._root
+        else:
+            node._fail = self._goto(self._fail(node.parent), node.arrow)
+        fail = node._fail
+        if fail is self._root:
+            node._output = None
+        else:
+            node._output = fail if fail.rules else self._output(fail)
+        node._version = self._version
+
+    def _goto(self, node: _Node, arrow: int) -> _Node:
+        while True:
+            child = node.children.get(arrow)
+            if child is not None:
+                return child
+            if node is self._root:
+                return node
+            node = self._fail(node)
+
+    def occurrences(self, path: quiver._Path) -> Iterator[Tuple[int, RewritingRule]]:
+        """Yield all pairs (i, rule) such that the leading term of rule appears
+        in path starting at position i. Occurrences are reported by increasing
+        end position."""
+        for start, _, rule in self._matches(path):
+            yield start, rule
+
+    def _matches(self, path: quiver._Path) -> Iterator[Tuple[int, int, RewritingRule]]:
+        stationary = self._stationary
+        if stationary:
+            targets = path.quiver.target
+            for i, vertex in enumerate(
+                [path.source] + [targets[arrow] for arrow in path.monomial]
+            ):
+                for priority, rule in stationary.get(vertex, ()):
+                    yield i, priority, rule
+
+        node = self._root
+        for end, arrow in enumerate(path.monomial):
+            node = self._goto(node, arrow)
+            match = node if node.rules else self._output(node)
+            while match is not None:
+                for priority, rule in match.rules:
+                    yield end - match.depth + 1, priority, rule
+                match = self._output(match)
+
+    def leftmostMatch(self, path: quiver._Path) -> Tuple[RewritingRule, int] | None:
+        """Return a pair (rule, i) such that the leading term of rule appears in
+        path starting at position i, with i as small as possible and ties broken
+        by priority, or None if path is not divisible by any leading term."""
+        best = None  # Triple (start, priority, rule).
+
+        stationary = self._stationary
+        if stationary:
+            targets = path.quiver.target
+            for i, vertex in enumerate(
+                [path.source] + [targets[arrow] for arrow in path.monomial]
+            ):
+                if stationary.get(vertex):
+                    priority, rule = min(stationary[vertex], key=lambda p: p[0])
+                    best = (i, priority, rule)
+                    break
+
+        node = self._root
+        for end, arrow in enumerate(path.monomial):
+            if best is not None and end - self._maxDepth + 1 > best[0]:
+                break  # No later match can start before the best one.
+            node = self._goto(node, arrow)
+            match = node if node.rules else self._output(node)
+            while match is not None:
+                start = end - match.depth + 1
+                for priority, rule in match.rules:
+                    if best is None or (start, priority) < best[:2]:
+                        best = (start, priority, rule)
+                match = self._output(match)
+
+        return None if best is None else (best[2], best[0])
+
+    def priorityMatch(self, path: quiver._Path) -> Tuple[RewritingRule, int] | None:
+        """Return a pair (rule, i) where rule is the rule of highest priority
+        whose leading term divides path and i is its leftmost occurrence, or
+        None if path is not divisible by any leading term."""
+        best = min(
+            ((priority, start, rule) for start, priority, rule in self._matches(path)),
+            key=lambda match: match[:2],
+            default=None,
+        )
+        return None if best is None else (best[2], best[1])
@@ -0,0 +1,94 @@
+from __future__ import annotations
+from typing import Sequence, Tuple
+
+# Generating functions of walks in a directed graph with integer adjacency
+# matrix A. The number of walks of length k from i to j is the entry (i, j) of
+# A^k, so their generating function is (I - tA)^-1, a matrix of rational
+# functions with denominator det(I - tA). Polynomials in t are lists of integer
+# coefficients by increasing degree.
+
+Matrix = list[list[int]]
+
+
+def faddeevLeVerrier(matrix: Matrix) -> Tuple[list[int], list[Matrix]]:
+    """Return the coefficients c_0, ..., c_n of the characteristic polynomial
+    det(xI - A) of an n x n integer matrix, by increasing degree, and the
+    matrices M_1, ..., M_n with adj(xI - A) = sum of M_k x^(n - k). All
+    arithmetic is exact: the divisions of the recurrence are exact."""
+    n = len(matrix)
+    coefficients = [0] * n + [1]
+    adjugate: list[Matrix] = []
+    m = [[0] * n for _ in range(n)]  # M_0 = 0.
+    for k in range(1, n + 1):
+        # M_k = A M_(k - 1) + c_(n - k + 1) I.
+        m = _product(matrix, m)
+        for i in range(n):
+            m[i][i] += coefficients[n - k + 1]
+        adjugate.append(m)
+        # c_(n - k) = -tr(A M_k) / k.
+        trace = sum(
+            matrix[i][j] * m[j][i] for i in range(n) for j in range(n) if matrix[i][j]
+        )
+        assert trace % k == 0
+        coefficients[n - k] = -trace // k
+    return coefficients, adjugate
+
+
+def walkSeries(
+    matrix: Matrix, left: Sequence[int], right: Sequence[int]
+) -> Tuple[list[int], list[int]]:
+    """Return polynomials (numerator, denominator) such that the generating
+    function of the numbers left^T A^k right is numerator / denominator, with
+    denominator = det(I - tA). The fraction is not reduced."""
+    n = len(matrix)
+    coefficients, adjugate = faddeevLeVerrier(matrix)
+    # With x = 1 / t, (I - tA)^-1 = x adj(xI - A) / det(xI - A). Multiplying by
+    # t^n, the denominator is det(I - tA) and M_k contributes to t^(k - 1).
+    denominator = coefficients[::-1]
+    numerator = [0] * n
+    for k, m in enumerate(adjugate, 1):
+        numerator[k - 1] = sum(
+            left[i] * m[i][j] * right[j]
+            for i in range(n)
+            if left[i]
+            for j in range(n)
+            if right[j]
+        )
+    return _trim(numerator), _trim(denominator)
+
+
+def seriesExpansion(
+    numerator: Sequence[int], denominator: Sequence[int], n: int
+) -> list[int]:
+    """Return the coefficients of t^0, ..., t^n of numerator / denominator, for
+    a denominator with constant term 1 or -1."""
+    assert denominator[0] in (1, -1), ValueError("Constant term must be a unit.")
+    result: list[int] = []
+    for k in range(n + 1):
+        c = numerator[k] if k < len(numerator) else 0
+        c -= sum(
+            denominator[i] * result[k - i]
+            for i in range(1, min(k, len(denominator) - 1) + 1)
+        )
+        result.append(c * denominator[0])
+    return result
+
+
+def _product(a: Matrix, b: Matrix) -> Matrix:
+    n = len(a)
+    result = [[0] * n for _ in range(n)]
+    for i in range(n):
+        row = result[i]
+        for k, c in enumerate(a[i]):
+            if c:
+                other = b[k]
+                for j in range(n):
+                    row[j] += c * other[j]
+    return result
+
+
+def _trim(polynomial: list[int]) -> list[int]:
+    """Remove the zero coefficients of highest degree."""
+    while len(polynomial) > 1 and polynomial[-1] == 0:
+        polynomial.pop()
+    return polynomial
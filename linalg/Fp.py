@@ -0,0 +1,161 @@
+from __future__ import annotations
+from .field import Field, FieldScalar
+
+# Elements of a prime field are ints in range(p), subclassing int so that
+# arithmetic and hashing run at machine speed. Each prime gets its own scalar
+# class, which holds the prime and, for small primes, tables of all elements and
+# of their inverses.
+
+_MAX_CHARACTERISTIC = 2**31
+_TABLE_LIMIT = 2**16
+_scalarClasses: dict[int, type] = {}
+
+
+class FpScalar(int, FieldScalar):
+    """Element of the prime field GF(p). Use GF(p).scalars to get the class of
+    the elements of a given prime field."""
+
+    __slots__ = ()
+    p: int
+    _elements: list[FpScalar] | None = None
+    _inverses: list[int] | None = None
+
+    def __new__(cls, value: int = 0) -> FpScalar:
+        return int.__new__(cls, value % cls.p)
+
+    @classmethod
+    def _make(cls, value: int) -> FpScalar:
+        """Return the element of a value in range(p)."""
+        elements = cls._elements
+        if elements is not None:
+            return elements[value]
+        return int.__new__(cls, value)
+
+    def __reduce__(self):
+        return _element, (self.p, int(self))
+
+    def __eq__(self, other) -> bool:
+        return int.__eq__(self, other)
+
+    def __hash__(self) -> int:
+        return int.__hash__(self)
+
+    def __str__(self) -> str:
+        return int.__repr__(self)
+
+    def __repr__(self) -> str:
+        return f"{int.__repr__(self)} mod {self.p}"
+
+    def __add__(self, other) -> FpScalar:
+        return self._make(int.__add__(self, other) % self.p)
+
+    __radd__ = __add__
+
+    def __mul__(self, other) -> FpScalar:
+        return self._make(int.__mul__(self, other) % self.p)
+
+    __rmul__ = __mul__
+
+    def __sub__(self, other) -> FpScalar:
+        return self._make(int.__sub__(self, other) % self.p)
+
+    def __rsub__(self, other) -> FpScalar:
+        return self._make(int.__rsub__(self, other) % self.p)
+
+    def _addMul(self, c: FpScalar, b: FpScalar) -> FpScalar:
+        return self._make(int.__add__(self, int.__mul__(c, b)) % self.p)
+
+    def _subMul(self, c: FpScalar, b: FpScalar) -> FpScalar:
+        return self._make(int.__sub__(self, int.__mul__(c, b)) % self.p)
+
+    def __neg__(self) -> FpScalar:
+        return self._make(-int(self) % self.p)
+
+    def __invert__(self) -> FpScalar:
+        """Return the inverse of an element."""
+        assert self, "Cannot invert the zero element."
+        inverses = self._inverses
+        if inverses is not None:
+            return self._make(inverses[self])
+        return self._make(pow(int(self), -1, self.p))
+
+    def __truediv__(self, other) -> FpScalar:
+        assert other % self.p, "Cannot divide by zero."
+        return self * ~self._make(other % self.p)
+
+    def __pow__(self, exponent: int) -> FpScalar:
+        assert self or exponent >= 0, "Cannot invert the zero element."
+        return self._make(pow(int(self), exponent, self.p))
+
+    def _getFieldZero(self) -> FpScalar:
+        return self._make(0)
+
+    def _getFieldOne(self) -> FpScalar:
+        return self._make(1)
+
+
+class GF(Field):
+    """The prime field with p elements, for a prime p < 2^31."""
+
+    def __init__(self, char: int) -> None:
+        # Primes whose scalar class exists have already been checked.
+        assert char in _scalarClasses or (
+            2 <= char < _MAX_CHARACTERISTIC and isPrime(char)
+        ), ValueError(f"{char} is not a prime below 2^31.")
+        self.char = char
+        self.scalars = _scalarClass(char)
+
+    def getOne(self) -> FieldScalar:
+        return self.scalars._make(1)
+
+    def getZero(self) -> FieldScalar:
+        return self.scalars._make(0)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, GF) and self.char == other.char
+
+    def __hash__(self) -> int:
+        return hash(("GF", self.char))
+
+    def __str__(self) -> str:
+        return f"GF({self.char})"
+
+
+def _scalarClass(p: int) -> type:
+    """Return the class of the elements of GF(p), creating it on first use."""
+    cls = _scalarClasses.get(p)
+    if cls is None:
+        cls = type(f"GF{p}Scalar", (FpScalar,), {"__slots__": (), "p": p})
+        if p <= _TABLE_LIMIT:
+            cls._elements = [int.__new__(cls, value) for value in range(p)]
+            cls._inverses = _inverseTable(p)
+        _scalarClasses[p] = cls
+    return cls
+
+
+def _element(p: int, value: int) -> FpScalar:
+    """Unpickle an element of GF(p)."""
+    return _scalarClass(p)(value)
+
+
+def _inverseTable(p: int) -> list[int]:
+    """Return the list of the inverses of 0 < i < p modulo p, with 0 at index 0,
+    using inv(i) = -(p // i) * inv(p % i)."""
+    inverses = [0, 1] + [0] * (p - 2)
+    for i in range(2, p):
+        inverses[i] = -(p // i) * inverses[p % i] % p
+    return inverses
+
+
+def isPrime(n: int) -> bool:
+    """Check whether n is prime, by trial division."""
+    if n < 4:
+        return n >= 2
+    if n % 2 == 0:
+        return False
+    d = 3
+    while d * d <= n:
+        if n % d == 0:
+            return False
+        d += 2
+    return True
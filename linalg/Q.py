@@ -1,19 +1,40 @@
 from __future__ import annotations
 from .field import Field, FieldScalar
+from math import gcd
 from typing import Tuple
 
 
 class Rational(FieldScalar):
+    __slots__ = ("numerator", "denominator")
+
     def __init__(self, numerator: int, denominator: int = 1) -> None:
         d = gcd(numerator, denominator)
 
         if denominator < 0:
-            numerator = -numerator
-            denominator = -denominator
+            d = -d
 
         self.numerator = numerator // d
         self.denominator = denominator // d
 
+    @staticmethod
+    def _make(numerator: int, denominator: int) -> Rational:
+        """Return numerator / denominator for coprime integers with denominator
+        > 0, without normalizing."""
+        result = object.__new__(Rational)
+        result.numerator = numerator
+        result.denominator = denominator
+        return result
+
+    @staticmethod
+    def _reduced(numerator: int, denominator: int) -> Rational:
+        """Return numerator / denominator for integers with denominator > 0."""
+        if denominator == 1:
+            return Rational._make(numerator, 1)
+        d = gcd(numerator, denominator)
+        if d == 1:
+            return Rational._make(numerator, denominator)
+        return Rational._make(numerator // d, denominator // d)
+
     def __lt__(self, other) -> bool:
         assert isinstance(other, Rational)
         return self.numerator * other.denominator < self.denominator * other.numerator
@@ -27,6 +48,12 @@ class Rational(FieldScalar):
             self.denominator == other.denominator
         )
 
+    def __hash__(self) -> int:
+        return hash((self.numerator, self.denominator))
+
+    def __bool__(self) -> bool:
+        return self.numerator != 0
+
     def __str__(self) -> str:
         return f"{self.numerator}" + ("╱" + str(self.denominator)) * (
             self.denominator != 1
@@ -34,40 +61,67 @@ class Rational(FieldScalar):
 
     def __add__(self, other) -> Rational:
         assert isinstance(other, Rational)
-        return Rational(
-            self.numerator * other.denominator + self.denominator * other.numerator,
-            self.denominator * other.denominator,
-        )
+        b, d = self.denominator, other.denominator
+        if b == d:
+            return Rational._reduced(self.numerator + other.numerator, b)
+        return Rational._reduced(self.numerator * d + b * other.numerator, b * d)
 
     def __mul__(self, other) -> Rational:
         return other.__rmul__(self)
 
     def __rmul__(self, other) -> Rational:
-        return Rational(
-            self.numerator * other.numerator, self.denominator * other.denominator
-        )
+        a, b = other.numerator, other.denominator
+        c, d = self.numerator, self.denominator
+        if b == 1 and d == 1:
+            return Rational._make(a * c, 1)
+        # Cross cancellation keeps the products small.
+        g1, g2 = gcd(a, d), gcd(c, b)
+        return Rational._make((a // g1) * (c // g2), (b // g2) * (d // g1))
 
     def __neg__(self) -> Rational:
-        return Rational(-self.numerator, self.denominator)
+        return Rational._make(-self.numerator, self.denominator)
 
     def __sub__(self, other) -> Rational:
         assert isinstance(other, Rational)
-        return self + (-other)
+        b, d = self.denominator, other.denominator
+        if b == d:
+            return Rational._reduced(self.numerator - other.numerator, b)
+        return Rational._reduced(self.numerator * d - b * other.numerator, b * d)
+
+    def _addMul(self, c: Rational, b: Rational) -> Rational:
+        """Return self + c * b, normalizing once."""
+        numerator = c.numerator * b.numerator
+        denominator = c.denominator * b.denominator
+        return Rational._reduced(
+            self.numerator * denominator + self.denominator * numerator,
+            self.denominator * denominator,
+        )
+
+    def _subMul(self, c: Rational, b: Rational) -> Rational:
+        """Return self - c * b, normalizing once."""
+        numerator = c.numerator * b.numerator
+        denominator = c.denominator * b.denominator
+        return Rational._reduced(
+            self.numerator * denominator - self.denominator * numerator,
+            self.denominator * denominator,
+        )
 
     def __invert__(self) -> Rational:
         """Return the inverse of an element."""
-        assert self != self._getFieldZero(), "Cannot invert the zero element."
-        return Rational(self.denominator, self.numerator)
+        assert self.numerator, "Cannot invert the zero element."
+        if self.numerator < 0:
+            return Rational._make(-self.denominator, -self.numerator)
+        return Rational._make(self.denominator, self.numerator)
 
     def __truediv__(self, other) -> Rational:
-        assert other != self._getFieldZero(), "Cannot divide by zero."
+        assert other.numerator, "Cannot divide by zero."
         return self * ~other
 
     def _getFieldZero(self) -> Rational:
-        return Rational(0)
+        return _ZERO
 
     def _getFieldOne(self) -> Rational:
-        return Rational(1)
+        return _ONE
 
     def evaluate(self, digits=10):
         return round(self.numerator / self.denominator, digits)
@@ -109,10 +163,10 @@ class QQ(Field):
         self.scalars = Rational
 
     def getOne(self) -> FieldScalar:
-        return Rational(1)
+        return _ONE
 
     def getZero(self) -> FieldScalar:
-        return Rational(0)
+        return _ZERO
 
 
 def regular_continued(array) -> Rational:
@@ -144,7 +198,5 @@ def sqrt(n: int, approx: int = 10) -> Rational:
     return result
 
 
-def gcd(m: int, n: int) -> int:
-    while abs(n) > 0:
-        m, n = n, m % n
-    return abs(m)
+_ZERO = Rational(0)
+_ONE = Rational(1)
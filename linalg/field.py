@@ -3,10 +3,16 @@ from abc import ABC, abstractmethod
 
 
 class FieldScalar(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def __eq__(self, other) -> bool:
         pass
 
+    @abstractmethod
+    def __hash__(self) -> int:
+        pass
+
     @abstractmethod
     def __str__(self) -> str:
         pass
@@ -33,6 +39,18 @@ class FieldScalar(ABC):
     def __neg__(self) -> FieldScalar:
         pass
 
+    def __bool__(self) -> bool:
+        """Check whether the element is non-zero."""
+        return self != self._getFieldZero()
+
+    def _addMul(self, c: FieldScalar, b: FieldScalar) -> FieldScalar:
+        """Return self + c * b. Subclasses may fuse the two operations."""
+        return self + c * b
+
+    def _subMul(self, c: FieldScalar, b: FieldScalar) -> FieldScalar:
+        """Return self - c * b. Subclasses may fuse the two operations."""
+        return self - c * b
+
     @abstractmethod
     def __invert__(self) -> FieldScalar:
         assert self != self._getFieldZero(), "Cannot invert the zero element."
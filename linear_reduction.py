@@ -1,9 +1,7 @@
+from __future__ import annotations
+from typing import Iterable
 from polynomial import Polynomial
-import polynomial
-
-
-def _cleanZeros(ps: list[Polynomial]) -> list[Polynomial]:
-    return [p for p in ps if p.support != []]
+from quiver import _Path
 
 
 def isLinearlySelfReduced(listPolynomials: list[Polynomial]) -> bool:
@@ -13,12 +11,14 @@ def isLinearlySelfReduced(listPolynomials: list[Polynomial]) -> bool:
     polynomials are in echelon form (except possibly that they may not be
     monic)."""
 
+    leading: dict[_Path, list[Polynomial]] = {}
+    for p in listPolynomials:
+        leading.setdefault(p.LM(), []).append(p)
+
     for p in listPolynomials:
-        others_p = [q for q in listPolynomials if p != q]
-        if p._isLinearlyReducedWithRespectTo(others_p):
-            continue
-        else:
-            return False
+        for path in p._paths():
+            if any(p != q for q in leading.get(path, ())):
+                return False
     return True
 
 
@@ -28,25 +28,85 @@ def linearSelfReduce(ps: list[Polynomial]) -> list[Polynomial]:
     corresponding to these polynomials with respect to the ordered basis of
     paths given by the chosen monomial order.
     """
-    processed: list[Polynomial] = []
-
-    if len(ps) == 1:
-        return [p * ~(p.LC()) for p in ps]
-
-    while len(ps) > 0:
-        maxes, rests = polynomial._filterPolynomialsMaximumLT(ps)
-        pivot = maxes.pop()  # Get the one with max LT that was listed last.
-        processed.append(pivot * ~(pivot.LC()))  # Make it monic.
-        rest = _cleanZeros([g._linearReduceWithRespectTo(pivot) for g in maxes])
-        ps = rest + rests
-
-    result = []
-    counter = len(processed) - 1
-
-    while counter >= 0:
-        pivot = processed.pop()
-        result.append(pivot)
-        for i in range(counter):
-            processed[i] = processed[i]._linearReduceWithRespectTo(pivot)
-        counter -= 1
-    return result[::-1]
+    ps = [p for p in ps if len(p)]
+    if not ps:
+        return []
+    key = ps[0].LM().quiver.order.key
+    # Adding rows by increasing leading term, new pivots are larger than every
+    # path of the previous rows, so back substitution is rarely needed.
+    ps.sort(key=lambda p: key(p.LM()), reverse=True)
+    return EchelonForm(ps).rows()
+
+
+class EchelonForm:
+    """Reduced row echelon form of a growing list of polynomials, with respect
+    to the ordered basis of paths given by the monomial order.
+
+    Rows are monic and indexed by their leading term (the pivot). No pivot
+    appears in any other row. For every path, the pivots of the rows containing
+    it are indexed too, so that adding a row only updates the rows that contain
+    its pivot."""
+
+    def __init__(self, ps: Iterable[Polynomial] = ()) -> None:
+        self.pivots: dict[_Path, Polynomial] = {}
+        self._columns: dict[_Path, set[_Path]] = {}
+        for p in ps:
+            self.add(p)
+
+    def __len__(self) -> int:
+        return len(self.pivots)
+
+    def reduce(self, p: Polynomial) -> Polynomial:
+        """Return the reduction of p by the rows, which contains no pivot.
+
+        Since a row contains a single pivot, subtracting it from p only creates
+        paths that are not pivots, so a single pass over p suffices. p is copied
+        once and then updated in place, so each step costs the size of a row."""
+        pivots = self.pivots
+        paths = [path for path in p._paths() if path in pivots]
+        if paths:
+            p = p._copy()
+        for path in paths:
+            p._isubMultiple(pivots[path], p.coefficient(path))
+        return p
+
+    def add(self, p: Polynomial) -> Polynomial | None:
+        """Add a polynomial to the rows. Return the new row, or None if p is a
+        linear combination of the rows."""
+        row = self.reduce(p)
+        if not len(row):
+            return None
+        row = row._makeMonic()
+        pivot = row.LM()
+
+        for other in self._columns.pop(pivot, set()):
+            old = self.pivots[other]
+            new = old._subMultiple(row, old.coefficient(pivot))
+            self._index(other, old, remove=True)
+            self._index(other, new)
+            self.pivots[other] = new
+
+        self.pivots[pivot] = row
+        self._index(pivot, row)
+        return row
+
+    def _index(self, pivot: _Path, row: Polynomial, remove: bool = False) -> None:
+        columns = self._columns
+        for path in row._paths():
+            if path == pivot:
+                continue
+            if remove:
+                rows = columns.get(path)
+                if rows is not None:
+                    rows.discard(pivot)
+                    if not rows:
+                        del columns[path]
+            else:
+                columns.setdefault(path, set()).add(pivot)
+
+    def rows(self) -> list[Polynomial]:
+        """Return the rows, from the largest pivot to the smallest."""
+        if not self.pivots:
+            return []
+        key = next(iter(self.pivots)).quiver.order.key
+        return [self.pivots[pivot] for pivot in sorted(self.pivots, key=key)]
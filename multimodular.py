@@ -0,0 +1,202 @@
+from __future__ import annotations
+from math import gcd, isqrt
+from typing import Callable, Iterator, Tuple
+import linear_reduction
+import polynomial as poly
+import quiver
+import rewriting
+from linalg.Fp import GF, isPrime
+from linalg.Q import Rational
+
+# Multi-modular computations over QQ. The computation is run over GF(p) for
+# several primes p. The results for primes with the same leading monomials are
+# combined by the Chinese remainder theorem, and rational coefficients are
+# recovered by rational reconstruction. Primes dividing a denominator of the
+# input are skipped, and primes giving other leading monomials than the majority
+# are discarded as unlucky. Once the reconstruction is stable under one more
+# prime, the result is verified over QQ.
+
+# A result modulo p: a list of pairs (leading monomial, polynomial).
+_Result = list[Tuple[quiver._Path, poly.Polynomial]]
+
+
+def completeMultimodular(
+    system: rewriting.RewritingSystem,
+    strategy: rewriting.PairSelectionStrategy | None = None,
+    criteria: bool = True,
+    batched: bool = False,
+    maxPrimes: int = 64,
+) -> rewriting.RewritingSystem:
+    """Return the reduced confluent rewriting system generating the same ideal
+    as a system over QQ, computed by completions over prime fields. The result
+    is checked to be confluent and to reduce the relations of system to zero,
+    so its ideal contains the one of system. That it is not larger is only
+    guaranteed with high probability, as for any multi-modular algorithm."""
+
+    def complete(p: int) -> _Result | None:
+        rules = []
+        for rule in system.rules:
+            tail = _reduceModulo(rule.polynomial, p)
+            if tail is None:
+                return None
+            rules.append(rewriting.RewritingRule(rule.leading_term, tail))
+        completed = rewriting.RewritingSystem(rules).complete(
+            strategy, criteria, batched
+        )
+        return [(rule.leading_term, rule.polynomial) for rule in completed.rules]
+
+    def verify(result: _Result) -> rewriting.RewritingSystem | None:
+        completed = rewriting.RewritingSystem(
+            [rewriting.RewritingRule(path, tail) for path, tail in result]
+        )
+        for rule in system.rules:
+            relation = poly.Polynomial([(rule.leading_term, Rational(1))])
+            if completed.normalForm(relation - rule.polynomial).terms:
+                return None
+        return completed if completed.isConfluent() else None
+
+    return _multimodular(complete, verify, maxPrimes)
+
+
+def linearSelfReduceMultimodular(
+    ps: list[poly.Polynomial], maxPrimes: int = 64
+) -> list[poly.Polynomial]:
+    """Return linear_reduction.linearSelfReduce(ps) for polynomials over QQ,
+    computed by linear self-reductions over prime fields. The result is checked
+    to be in echelon form and to span the polynomials of ps."""
+
+    def reduce(p: int) -> _Result | None:
+        reduced = [_reduceModulo(q, p) for q in ps]
+        if any(q is None for q in reduced):
+            return None
+        return [(q.LM(), q) for q in linear_reduction.linearSelfReduce(reduced)]
+
+    def verify(result: _Result) -> list[poly.Polynomial] | None:
+        rows = [q for _, q in result]
+        for row in rows:
+            if row.LC() != Rational(1) or not row._isLinearlyReducedWithRespectTo(
+                [other for other in rows if other is not row]
+            ):
+                return None
+        for q in ps:
+            for row in rows:
+                q = q._linearReduceWithRespectTo(row)
+            if q.terms:
+                return None
+        # The rank of ps over QQ is at least its rank modulo p, so the rows span
+        # exactly the polynomials of ps.
+        return rows
+
+    return _multimodular(reduce, verify, maxPrimes)
+
+
+def _multimodular(
+    compute: Callable[[int], _Result | None],
+    verify: Callable[[_Result], object | None],
+    maxPrimes: int,
+):
+    """Run compute modulo primes until the rational reconstruction of the
+    results of the primes agreeing with the majority is stable and accepted by
+    verify, and return the output of verify."""
+    groups: dict[tuple, _Lift] = {}
+    previous = None
+    for count, p in enumerate(_primes()):
+        assert count < maxPrimes, ValueError(
+            f"No verified reconstruction after {maxPrimes} primes."
+        )
+        result = compute(p)
+        if result is None:
+            continue  # p divides a denominator of the input.
+
+        signature = tuple(path for path, _ in result)
+        lift = groups.setdefault(signature, _Lift(signature))
+        lift.add(result, p)
+        if max(groups.values(), key=lambda g: g.count) is not lift:
+            continue
+
+        candidate = lift.reconstruct()
+        if candidate is None:
+            continue
+        if candidate == previous:
+            verified = verify(candidate)
+            if verified is not None:
+                return verified
+        previous = candidate
+
+
+class _Lift:
+    """Coefficients of results with the same leading monomials, combined by the
+    Chinese remainder theorem."""
+
+    def __init__(self, signature: tuple) -> None:
+        self.signature = signature
+        self.modulus = 1
+        self.count = 0
+        # Residues modulo self.modulus, indexed by (position, path).
+        self.residues: dict[Tuple[int, quiver._Path], int] = {}
+
+    def add(self, result: _Result, p: int) -> None:
+        modulus = self.modulus
+        inverse = pow(modulus, -1, p)
+        values = {
+            (i, path): int(c)
+            for i, (_, q) in enumerate(result)
+            for path, c in q.terms.items()
+        }
+        for key in self.residues.keys() | values.keys():
+            a = self.residues.get(key, 0)
+            b = values.get(key, 0)
+            self.residues[key] = a + modulus * ((b - a) * inverse % p)
+        self.modulus = modulus * p
+        self.count += 1
+
+    def reconstruct(self) -> _Result | None:
+        """Return the result over QQ, or None if some coefficient has no
+        rational reconstruction yet."""
+        terms: list[dict] = [{} for _ in self.signature]
+        for (i, path), residue in self.residues.items():
+            c = rationalReconstruction(residue, self.modulus)
+            if c is None:
+                return None
+            if c.numerator:
+                terms[i][path] = c
+        return [
+            (path, poly.Polynomial(list(ts.items())))
+            for path, ts in zip(self.signature, terms)
+        ]
+
+
+def _reduceModulo(polynomial: poly.Polynomial, p: int) -> poly.Polynomial | None:
+    """Return the image of a polynomial over QQ in GF(p), or None if p divides
+    the denominator of a coefficient."""
+    scalar = GF(p).scalars
+    terms = []
+    for path, c in polynomial.terms.items():
+        if c.denominator % p == 0:
+            return None
+        terms.append((path, scalar(c.numerator) / scalar(c.denominator)))
+    return poly.Polynomial(terms)
+
+
+def rationalReconstruction(a: int, m: int) -> Rational | None:
+    """Return the fraction r / s with |r|, |s| <= sqrt(m / 2) and r = a s mod m,
+    or None if there is none (Wang's algorithm)."""
+    bound = isqrt(m // 2)
+    r0, r1 = m, a % m
+    s0, s1 = 0, 1
+    while r1 > bound:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        s0, s1 = s1, s0 - q * s1
+    if s1 == 0 or abs(s1) > bound or gcd(r1, s1) != 1:
+        return None
+    return Rational(r1, s1)
+
+
+def _primes() -> Iterator[int]:
+    """Yield the primes below 2^31 in decreasing order."""
+    n = 2**31 - 1
+    while n > 2:
+        if isPrime(n):
+            yield n
+        n -= 2
@@ -0,0 +1,102 @@
+from __future__ import annotations
+from typing import Iterator
+from quiver import Quiver, _Path
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional.
+    np = None
+
+
+class PathArray:
+    """All paths of a given length in a quiver, stored as NumPy arrays instead
+    of path objects: a 2-D int32 array with one row of arrow ids per path, and
+    the vertex ids of their sources and targets. Ids are the dense ids of the
+    compiled quiver. Path objects are only built when the array is indexed or
+    iterated over. Requires NumPy."""
+
+    __slots__ = ("quiver", "arrows", "sources", "targets")
+
+    def __init__(
+        self,
+        quiver: Quiver,
+        arrows: np.ndarray,
+        sources: np.ndarray,
+        targets: np.ndarray,
+    ) -> None:
+        assert np is not None, ImportError("PathArray requires NumPy.")
+        self.quiver = quiver
+        self.arrows = arrows
+        self.sources = sources
+        self.targets = targets
+
+    @classmethod
+    def stationary(cls, quiver: Quiver, vertices: list[int] | None = None) -> PathArray:
+        """Return the stationary paths at the given vertices (all by default)."""
+        assert np is not None, ImportError("PathArray requires NumPy.")
+        index = quiver._compiled().vertexIndex
+        ids = (
+            sorted(index.values()) if vertices is None else [index[v] for v in vertices]
+        )
+        sources = np.array(ids, dtype=np.int32)
+        return cls(quiver, np.zeros((len(ids), 0), dtype=np.int32), sources, sources)
+
+    @property
+    def length(self) -> int:
+        return self.arrows.shape[1]
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def __getitem__(self, item: int | slice | np.ndarray) -> _Path | PathArray:
+        """Return the path of a row, or a PathArray of the selected rows."""
+        if isinstance(item, (int, np.integer)):
+            compiled = self.quiver._compiled()
+            labels, vertices = compiled.arrowLabels, compiled.vertexLabels
+            return self.quiver._path(
+                vertices[self.sources[item]],
+                tuple(labels[a] for a in self.arrows[item].tolist()),
+                vertices[self.targets[item]],
+            )
+        return PathArray(
+            self.quiver, self.arrows[item], self.sources[item], self.targets[item]
+        )
+
+    def __iter__(self) -> Iterator[_Path]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def monomials(self) -> np.ndarray:
+        """Return the array of arrow labels of the paths, one row per path."""
+        labels = np.array(self.quiver._compiled().arrowLabels)
+        return labels[self.arrows]
+
+    def extend(self) -> PathArray:
+        """Return the paths p * a for all paths p of self and arrows a outgoing
+        at the target of p, ordered by p and then by a."""
+        compiled = self.quiver._compiled()
+        outStart = np.array(compiled.outStart, dtype=np.int64)
+        outArrows = np.array(compiled.outArrows, dtype=np.int32)
+        target = np.array(compiled.target, dtype=np.int32)
+
+        first = outStart[self.targets]
+        counts = outStart[self.targets + 1] - first
+        rows = np.repeat(np.arange(len(self)), counts)
+        # Position of each new path among the arrows outgoing at its target.
+        offsets = np.arange(len(rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+        new = outArrows[first[rows] + offsets]
+        arrows = np.concatenate([self.arrows[rows], new[:, None]], axis=1)
+        return PathArray(self.quiver, arrows, self.sources[rows], target[new])
+
+
+def pathsOfLength(
+    quiver: Quiver, length: int, vertices: list[int] | None = None
+) -> PathArray:
+    """Return the paths of a given length in a quiver, starting at the given
+    vertices (all by default), ordered by source and then lexicographically by
+    arrows."""
+    assert length > -1, ValueError("Length must be non-negative.")
+    paths = PathArray.stationary(quiver, vertices)
+    for _ in range(length):
+        paths = paths.extend()
+    return paths
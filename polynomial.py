@@ -1,47 +1,130 @@
 from __future__ import annotations
 from quiver import _Path
-import heapq
-from typing import Tuple
+from typing import Iterable, Tuple
 from linalg import field
 from itertools import product
 
 
 class Polynomial:
     """A polynomial is a linear combination of paths with coefficients
-    in a field."""
+    in a field.
+
+    The terms are stored sparsely in the dictionary self.terms, mapping each
+    path in the support to its (non-zero) coefficient. The terms sorted by the
+    path order, and the leading term, are only computed when needed.
+
+    Polynomials are not modified after creation, except by _isubMultiple on a
+    polynomial its caller has just created. Their hash is a sum of hashes of
+    terms, which does not depend on the order of the terms and is updated term
+    by term under addition, so equal polynomials have equal hashes and unequal
+    hashes decide inequality immediately."""
 
     def __init__(self, xs: list[Tuple[_Path, field.FieldScalar]]) -> None:
-        xs = _preProcess(xs)  # Paths are a totally ordered basis of kQ.
-        self.support = [path for path, _ in xs]
-        self.polynomial = xs
+        terms: dict[_Path, field.FieldScalar] = {}
+        for path, coefficient in xs:
+            if path in terms:
+                terms[path] = terms[path] + coefficient
+            else:
+                terms[path] = coefficient
+        self.terms = {path: c for path, c in terms.items() if not _isZero(c)}
+        self._sorted: list[Tuple[_Path, field.FieldScalar]] | None = None
+        self._leading: Tuple[_Path, field.FieldScalar] | None = None
+        self._hash: int | None = sum(map(hash, self.terms.items())) & _HASH_MASK
+
+    @classmethod
+    def _fromTerms(
+        cls,
+        terms: dict[_Path, field.FieldScalar],
+        contentHash: int | None = None,
+    ) -> Polynomial:
+        """Wrap a dictionary of terms with non-zero coefficients, without
+        copying it. If known, contentHash must be the hash of the terms."""
+        polynomial = cls.__new__(cls)
+        polynomial.terms = terms
+        polynomial._sorted = None
+        polynomial._leading = None
+        polynomial._hash = contentHash
+        return polynomial
+
+    @property
+    def polynomial(self) -> list[Tuple[_Path, field.FieldScalar]]:
+        """The list of terms of the polynomial, sorted from the largest path
+        to the smallest one."""
+        if self._sorted is None:
+            terms = list(self.terms.items())
+            if terms:
+                key = terms[0][0].quiver.order.key
+                terms.sort(key=lambda term: key(term[0]))
+            self._sorted = terms
+        return self._sorted
+
+    @property
+    def support(self) -> list[_Path]:
+        """The paths with non-zero coefficient, from the largest to the smallest."""
+        return [path for path, _ in self.polynomial]
+
+    def __len__(self) -> int:
+        """The number of terms of the polynomial."""
+        return len(self.terms)
+
+    def _paths(self) -> Iterable[_Path]:
+        """The paths with non-zero coefficient, in no particular order."""
+        return self.terms.keys()
+
+    def coefficient(self, path: _Path) -> field.FieldScalar | None:
+        """Return the coefficient of a path in the polynomial, or None if the
+        path is not in the support."""
+        return self.terms.get(path)
 
     def __str__(self) -> str:
-        copy = self.polynomial[::]
+        terms = iter(self.polynomial)
         result = ""
-        if copy:
-            path, coeff = heapq.heappop(copy)
+        for path, coeff in terms:
             if coeff == coeff._getFieldOne():
                 result = str(path)
             elif coeff == -coeff._getFieldOne():
                 result = "- " + str(path)
             else:
                 result += str(coeff) + " · " + str(path)
-            while copy:
-                path, coeff = heapq.heappop(copy)
-                if coeff == coeff._getFieldOne():
-                    result += " + " + str(path)
-                elif coeff == -coeff._getFieldOne():
-                    result += " - " + str(path)
-                else:
-                    result += " + " + str(coeff) + " · " + str(path)
+            break
+        for path, coeff in terms:
+            if coeff == coeff._getFieldOne():
+                result += " + " + str(path)
+            elif coeff == -coeff._getFieldOne():
+                result += " - " + str(path)
+            else:
+                result += " + " + str(coeff) + " · " + str(path)
 
         return result if result else "0"
 
     def _copy(self) -> Polynomial:
-        return Polynomial(self.polynomial[::])
+        return Polynomial._fromTerms(self.terms.copy(), self._hash)
 
     def __add__(self, other: Polynomial) -> Polynomial:
-        return Polynomial(self.polynomial + other.polynomial)
+        """Return the sum of two polynomials. The dictionary of the larger
+        operand is copied, so this costs O(size of the larger operand); use
+        _isubMultiple to update a polynomial one owns in O(size of the other)."""
+        if len(self.terms) < len(other.terms):
+            self, other = other, self
+        terms = self.terms.copy()
+        h = self._hash
+        for path, coefficient in other.terms.items():
+            old = terms.get(path)
+            if old is None:
+                terms[path] = coefficient
+                if h is not None:
+                    h += hash((path, coefficient))
+            else:
+                new = old + coefficient
+                if h is not None:
+                    h -= hash((path, old))
+                if _isZero(new):
+                    del terms[path]
+                else:
+                    terms[path] = new
+                    if h is not None:
+                        h += hash((path, new))
+        return Polynomial._fromTerms(terms, None if h is None else h & _HASH_MASK)
 
     def __mul__(self, other: Polynomial | field.FieldScalar) -> Polynomial:
         """Multiplication of a polynomial by polynomials or a scalar. Returns
@@ -49,19 +132,54 @@ class Polynomial:
         if isinstance(other, Polynomial):
             x3 = [
                 (p + q, c * d)
-                for (p, c), (q, d) in product(self.polynomial, other.polynomial)
+                for (p, c), (q, d) in product(self.terms.items(), other.terms.items())
                 if p.target == q.source  # Guarantees * never returns NonePath.
             ]
-        else:
-            x3 = [(p, c * other) for (p, c) in self.polynomial]
-        return Polynomial(x3)
+            return Polynomial(x3)
+        if _isZero(other):
+            return Polynomial._fromTerms({})
+        return Polynomial._fromTerms({p: c * other for p, c in self.terms.items()})
+
+    def __neg__(self) -> Polynomial:
+        return Polynomial._fromTerms({p: -c for p, c in self.terms.items()})
 
     def __sub__(self, other: Polynomial) -> Polynomial:
-        one = self.LC()._getFieldOne()
-        return self + other * (-one)
+        if len(self.terms) < len(other.terms):
+            return -(other - self)
+        terms = self.terms.copy()
+        h = self._hash
+        for path, coefficient in other.terms.items():
+            old = terms.get(path)
+            if old is None:
+                new = terms[path] = -coefficient
+                if h is not None:
+                    h += hash((path, new))
+            else:
+                new = old - coefficient
+                if h is not None:
+                    h -= hash((path, old))
+                if _isZero(new):
+                    del terms[path]
+                else:
+                    terms[path] = new
+                    if h is not None:
+                        h += hash((path, new))
+        return Polynomial._fromTerms(terms, None if h is None else h & _HASH_MASK)
 
     def __eq__(self, other: Polynomial) -> bool:
-        return self.polynomial == other.polynomial
+        if self is other:
+            return True
+        if len(self.terms) != len(other.terms):
+            return False
+        if self._hash is not None and other._hash is not None:
+            if self._hash != other._hash:
+                return False
+        return self.terms == other.terms
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = sum(map(hash, self.terms.items())) & _HASH_MASK
+        return self._hash
 
     def _makeMonic(self) -> Polynomial:
         """Given a non-zero polynomial f, divide it by its
@@ -73,54 +191,81 @@ class Polynomial:
         (path.leadingMonomial(), path.leadingCoefficient()). Raises
         ValueError if the zero polynomial is input."""
 
-        assert self.polynomial, ValueError(
+        assert self.terms, ValueError(
             "Zero polynomial has no leading monomial nor leading coefficient."
         )
-        return self.polynomial[:][0]
+        if self._leading is None:
+            if self._sorted is not None:
+                self._leading = self._sorted[0]
+            else:
+                path = min(self.terms, key=next(iter(self.terms)).quiver.order.key)
+                self._leading = (path, self.terms[path])
+        return self._leading
 
     def LM(self) -> _Path:
         """Returns the largest monomial in the support of the polynomial. Raises
         ValueError if the zero polynomial is input."""
 
-        assert self.polynomial, ValueError("Zero polynomial has no leading monomial.")
-        return self.polynomial[:][0][0]
+        assert self.terms, ValueError("Zero polynomial has no leading monomial.")
+        return self.LT()[0]
 
     def LC(self) -> field.FieldScalar:
         """Return the leading coefficient of a non-zero polynomial. Raises
         ValueError if the zero polynomial is input."""
 
-        assert self.polynomial, ValueError(
-            "Zero polynomial has no leading coefficient."
-        )
-        return self.polynomial[:][0][1]
+        assert self.terms, ValueError("Zero polynomial has no leading coefficient.")
+        return self.LT()[1]
 
     def _linearReduceWithRespectTo(self, q: Polynomial) -> Polynomial:
         """If LM(q) appears in the polynomial p with coefficient c, return
         p - c / LC(q) * q. If not, return p."""
 
         lm, lc = q.LT()
-        xs = [(m, c) for m, c in self.polynomial if m == lm]
+        coeff = self.terms.get(lm)
 
-        if xs:
-            assert len(xs) == 1
-            coeff = xs[0][1]
-            return self - q * (coeff / lc)
+        if coeff is not None:
+            return self._subMultiple(q, coeff / lc)
         else:
             return self
 
+    def _subMultiple(self, q: Polynomial, c: field.FieldScalar) -> Polynomial:
+        """Return self - c * q, with one fused operation per common path."""
+        return self._copy()._isubMultiple(q, c)
+
+    def _isubMultiple(self, q: Polynomial, c: field.FieldScalar) -> Polynomial:
+        """Replace self by self - c * q in place and return it. This costs
+        O(size of q), so it must only be called on a polynomial that is not
+        shared, for instance one returned by _copy."""
+        terms = self.terms
+        h = self._hash
+        for path, coefficient in q.terms.items():
+            old = terms.get(path)
+            if old is None:
+                new = terms[path] = -(c * coefficient)
+                if h is not None:
+                    h += hash((path, new))
+            else:
+                new = old._subMul(c, coefficient)
+                if h is not None:
+                    h -= hash((path, old))
+                if _isZero(new):
+                    del terms[path]
+                else:
+                    terms[path] = new
+                    if h is not None:
+                        h += hash((path, new))
+        self._hash = None if h is None else h & _HASH_MASK
+        self._sorted = None
+        self._leading = None
+        return self
+
     def _isLinearlyReducedWithRespectTo(self: Polynomial, ps: list[Polynomial]) -> bool:
         """Check that a polynomial is linearly reduced with respect to a list of
         polynomials. This means that no paths in the support of self is equal to
         the leading term of any of the q in ps."""
 
-        support = self.support
-
-        for q in ps:
-            lm = q.LM()
-            for path in support:
-                if path == lm:
-                    return False
-        return True
+        terms = self.terms
+        return not any(q.LM() in terms for q in ps)
 
 
 def _pathToMonomial(path: _Path, scalar: field.FieldScalar) -> Polynomial:
@@ -128,46 +273,8 @@ def _pathToMonomial(path: _Path, scalar: field.FieldScalar) -> Polynomial:
     return Polynomial([(path, scalar)])
 
 
-def _filterPolynomialsMaximumLT(
-    ps: list[Polynomial],
-) -> Tuple[list[Polynomial], list[Polynomial]]:
-    """Returns a pair M, O where M is the list of polynomials
-    with maximal leading term and O are the other (remaining) polynomials."""
+_HASH_MASK = (1 << 64) - 1
 
-    max_LT = min([p.LM() for p in ps])  # NOTE: recall order is reversed.
-    maximizers, others = [], []
-    for p in ps:
-        if p.LM() == max_LT:
-            maximizers.append(p)
-        else:
-            others.append(p)
-    return maximizers, others
-
-
-def _preProcess(
-    xs: list[Tuple[_Path, field.FieldScalar]]
-) -> list[Tuple[_Path, field.FieldScalar]]:
-
-    heapq.heapify(xs)
-    ys = []
-    if xs:
-        current_path, current_coefficient = heapq.heappop(xs)
-        while xs:
-            new_path, new_coefficient = heapq.heappop(xs)
-            if new_path == current_path:
-                current_coefficient += new_coefficient
-            else:
-                if current_coefficient != current_coefficient._getFieldZero():
-                    heapq.heappush(ys, (current_path, current_coefficient))
-                current_coefficient = new_coefficient
-                current_path = new_path
-        if current_coefficient != current_coefficient._getFieldZero():
-            heapq.heappush(ys, (current_path, current_coefficient))
-
-    # Result:
-    #   1. If (path, coeff) appears in ys, then coeff is non-zero.
-    #   2. If (path, coeff) appears in ys, this is the unique tuple
-    #      in ys with first entry equal to path.
-    #   3. Heap invariant preserved.
-
-    return ys
+
+def _isZero(scalar: field.FieldScalar) -> bool:
+    return not scalar
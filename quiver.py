@@ -1,16 +1,42 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from functools import total_ordering
-from itertools import product
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import heapq
+from typing import Iterable, Iterator, Sequence
+from weakref import WeakValueDictionary
+import hilbert
 import printing
 
 # IMPORTANT NOTE: heapq implements a min-heap, so all orders below are implemented
-# in their reversed version: __lt__ is actually __gt__.
+# in their reversed version: __lt__ is actually __gt__. In the same way, sort keys
+# are smaller for larger paths, so that sorting puts the largest path first.
 
 
 class PathOrder(ABC):
-    @abstractmethod
+    # Graded orders comparing paths of equal length lexicographically by arrow
+    # labels, read from the source (1) or from the target (-1), so that paths
+    # can be enumerated in order by depth-first search. None for other orders.
+    _lexDirection: int | None = None
+
+    def key(self, path: _Path) -> int:
+        """Return the sort key of a path: path1 < path2 (in the reversed sense
+        above) if and only if key(path1) < key(path2). Keys of paths in the
+        quiver ordered by self are computed once and cached on the path."""
+        key = path._key
+        if key is None:
+            key = self._computeKey(path)
+            if path.quiver.order is self:
+                path._key = key
+        return key
+
     def _isLessThan(self, path1: _Path, path2: _Path) -> bool:
+        return self.key(path1) < self.key(path2)
+
+    @abstractmethod
+    def _computeKey(self, path: _Path) -> int:
         pass
 
     @abstractmethod
@@ -23,11 +49,10 @@ class GradedLex(PathOrder):
     are smaller) and if equal compares entries lexicographically using the usual
     order on natural numbers."""
 
-    def _isLessThan(self, path1: _Path, path2: _Path) -> bool:
-        if len(path1) == len(path2):
-            return path1.monomial > path2.monomial
-        else:
-            return len(path1) > len(path2)
+    _lexDirection = 1
+
+    def _computeKey(self, path: _Path) -> int:
+        return -path.quiver._compiled().gradedRank(path, path.monomial)
 
     def __str__(self) -> str:
         return "DegLex"
@@ -38,11 +63,10 @@ class GradedRevLex(PathOrder):
     are smaller) and if equal compares entries lexicographically using the usual
     order on natural numbers."""
 
-    def _isLessThan(self, path1: _Path, path2: _Path) -> bool:
-        if len(path1) == len(path2):
-            return path1.monomial[::-1] > path2.monomial[::-1]
-        else:
-            return len(path1) > len(path2)
+    _lexDirection = -1
+
+    def _computeKey(self, path: _Path) -> int:
+        return -path.quiver._compiled().gradedRank(path, path.monomial[::-1])
 
     def __str__(self) -> str:
         return "DegRevLex"
@@ -50,15 +74,30 @@ class GradedRevLex(PathOrder):
 
 @total_ordering
 class _Path:
+    """A path in a quiver. Paths are immutable: the monomial is stored as a
+    tuple of arrows and the hash is computed once on creation, so paths can
+    be used in sets and as dictionary keys."""
+
+    __slots__ = (
+        "source",
+        "target",
+        "quiver",
+        "monomial",
+        "nonePath",
+        "_hash",
+        "_key",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         source: int,
-        vars: list[int],
+        vars: Sequence[int],
         target: int,
         quiver: Quiver,
         isEmpty: bool = False,
     ) -> None:
-
+        vars = tuple(vars)
         if vars:
             assert source == quiver.source[vars[0]], ValueError(
                 f"""Vertex {source} is not the source {quiver.source[vars[0]]} of arrow {vars[0]}."""
@@ -73,6 +112,28 @@ class _Path:
         self.quiver = quiver
         self.monomial = vars
         self.nonePath = isEmpty
+        self._hash = hash((source, vars, target))
+        self._key: int | None = None
+
+    @classmethod
+    def _unchecked(
+        cls,
+        source: int,
+        monomial: tuple[int, ...],
+        target: int,
+        quiver: Quiver,
+    ) -> _Path:
+        """Create a path without validating that its arrows are composable.
+        Only to be used with monomials that are known to be paths in quiver."""
+        path = object.__new__(cls)
+        path.source = source
+        path.target = target
+        path.quiver = quiver
+        path.monomial = monomial
+        path.nonePath = False
+        path._hash = hash((source, monomial, target))
+        path._key = None
+        return path
 
     def __len__(self) -> int:
         return len(self.monomial)
@@ -83,7 +144,9 @@ class _Path:
             t = subscript.stop
 
             if not s and not t:  # Make a copy.
-                return _Path(self.source, self.monomial[:], self.target, self.quiver)
+                return _Path._unchecked(
+                    self.source, self.monomial, self.target, self.quiver
+                )
 
             if s == t:  # Empty slice creates NonePath.
                 return self.quiver.createNonePath()
@@ -92,13 +155,13 @@ class _Path:
                 new_mon = self.monomial.__getitem__(subscript)
                 new_source = self.quiver.source[new_mon[0]]
                 new_target = self.quiver.target[new_mon[-1]]
-                return _Path(new_source, new_mon, new_target, self.quiver)
+                return self.quiver._path(new_source, new_mon, new_target)
         else:
             # Return item as path of length one.
             new_arrow = self.monomial.__getitem__(subscript)
             new_source = self.quiver.source[new_arrow]
             new_target = self.quiver.target[new_arrow]
-            return _Path(new_source, [new_arrow], new_target, self.quiver)
+            return self.quiver._path(new_source, (new_arrow,), new_target)
 
     def __str__(self) -> str:
         result = ""
@@ -131,7 +194,7 @@ class _Path:
             "Cannot concatenate paths from different quivers."
         )
         if self.target == other.source:
-            return self.quiver.createPath(
+            return self.quiver._path(
                 self.source,
                 self.monomial + other.monomial,
                 other.target,
@@ -146,30 +209,25 @@ class _Path:
 
         quiver = ~(self.quiver)
         monomial = self.monomial[::-1]
-        return _Path(self.target, monomial, self.source, quiver)
+        return quiver._path(self.target, monomial, self.source)
 
     def __eq__(self, other: _Path) -> bool:
-        return all(
-            [
-                self.source == other.source,
-                self.target == other.target,
-                self.monomial == other.monomial,
-                self.quiver == other.quiver,
-            ]
+        if self is other:  # Always the case for equal interned paths.
+            return True
+        return (
+            self._hash == other._hash
+            and self.monomial == other.monomial
+            and self.source == other.source
+            and self.target == other.target
+            and (self.quiver is other.quiver or self.quiver == other.quiver)
         )
 
-    def __hash__(self):
-        return hash(
-            (
-                self.source,
-                self.monomial,
-                self.target,
-                self.quiver,
-            )
-        )
+    def __hash__(self) -> int:
+        return self._hash
 
     def __lt__(self, other: _Path) -> bool:
-        return self.quiver.order._isLessThan(self, other)
+        key = self.quiver.order.key
+        return key(self) < key(other)
 
     def _find(self, other: _Path) -> int:
         """Check if the path is divisible by another path. If it is,
@@ -194,7 +252,9 @@ class _Path:
         old_path_length: int,
     ) -> _Path:
         """Replace the subpath of self starting at position i
-        and ending at position j with the other path."""
+        and ending at position j with the other path, which must be
+        parallel to it. The result is parallel to self, and may be a
+        stationary path."""
         assert position_found > -1
 
         new_monomial = (
@@ -202,11 +262,7 @@ class _Path:
             + new_path.monomial
             + self.monomial[position_found + old_path_length :]
         )
-        return self.quiver.createPath(
-            self.quiver.source[new_monomial[0]],
-            new_monomial,
-            self.quiver.target[new_monomial[-1]],
-        )
+        return self.quiver.createPath(self.source, new_monomial, self.target)
 
     def _isLeftDivisibleBy(self, path: _Path) -> int:
         """Returns the unique integer i such that self[:i+1] == path
@@ -241,6 +297,7 @@ class Quiver:
         t: dict[int, int],
         order: PathOrder = GradedLex(),
         name: str = "QQ",
+        internPaths: bool = False,
     ) -> None:
         assert q0, ValueError("Cannot initialize quiver with no vertices.")
         assert set(s.keys()) == set(q1), ValueError(
@@ -262,21 +319,52 @@ class Quiver:
         self.target = t
         self.order = order
         self.name = name
+        self._opposite: Quiver | None = None
+        self._compiledQuiver: _CompiledQuiver | None = None
+        self._pathIds: _PathDictionary | None = None
+        # Optional intern table, so that equal paths share a single object.
+        self._internTable: WeakValueDictionary | None = (
+            WeakValueDictionary() if internPaths else None
+        )
 
     def __str__(self) -> str:
         return self.name
 
     def __invert__(self) -> Quiver:
         """Return the opposite of the quiver by interchanging the
-        source and target functions."""
-        return Quiver(
-            self.nodes,
-            self.arrows,
-            self.target,  # Target and source interchanged.
-            self.source,
-            self.order,
-            name=f"{self.name}-OP",
-        )
+        source and target functions. The opposite quiver is built once
+        and cached, so that ~~Q is Q."""
+        if self._opposite is None:
+            opposite = Quiver(
+                self.nodes,
+                self.arrows,
+                self.target,  # Target and source interchanged.
+                self.source,
+                self.order,
+                name=f"{self.name}-OP",
+                internPaths=self._internTable is not None,
+            )
+            opposite._opposite = self
+            self._opposite = opposite
+        return self._opposite
+
+    def _compiled(self) -> _CompiledQuiver:
+        """Return the compiled form of the quiver, building it on first use.
+
+        WARNING: The quiver must not be modified after it has been compiled."""
+        if self._compiledQuiver is None:
+            opposite = self._opposite
+            if opposite is not None and opposite._compiledQuiver is not None:
+                self._compiledQuiver = opposite._compiledQuiver._reversed()
+            else:
+                self._compiledQuiver = _CompiledQuiver(self)
+        return self._compiledQuiver
+
+    def _pathDictionary(self) -> _PathDictionary:
+        """Return the dictionary of path ids of the quiver, built on first use."""
+        if self._pathIds is None:
+            self._pathIds = _PathDictionary()
+        return self._pathIds
 
     def __eq__(self, other: Quiver) -> bool:
         """Check if two quivers are equal, by verifying that the
@@ -296,124 +384,692 @@ class Quiver:
     def _incomingArrows(self, v: int) -> list[_Path]:
         """Return the list of arrows in the quiver that are incoming at vertex v
         as Path objects."""
-        assert v in set(self.nodes), ValueError("Input vertex must be in the quiver.")
-
+        compiled = self._compiled()
+        assert v in compiled.vertexIndex, ValueError(
+            "Input vertex must be in the quiver."
+        )
         return [
-            _Path(
-                self.source[arrow],
-                [arrow],
-                self.target[arrow],
-                self,
-            )
-            for arrow in [u for u in set(self.target.keys()) if self.target[u] == v]
+            self._path(self.source[arrow], (arrow,), v)
+            for arrow in compiled.incomingLabels(compiled.vertexIndex[v])
         ]
 
     def _outgoingArrows(self, v: int) -> list[_Path]:
         """Return the list of arrows in the quiver that are outgoing at vertex
         v as Path objects."""
-        assert v in set(self.nodes), ValueError("Input vertex must be in the quiver.")
-        return [~path for path in (~self)._incomingArrows(v)]
+        compiled = self._compiled()
+        assert v in compiled.vertexIndex, ValueError(
+            "Input vertex must be in the quiver."
+        )
+        return [
+            self._path(v, (arrow,), self.target[arrow])
+            for arrow in compiled.outgoingLabels(compiled.vertexIndex[v])
+        ]
 
     def _extendPathByIncomingArrows(self, path: _Path) -> list[_Path]:
         """Given a path encoded as a list of integers, find all paths of the form
         arrow * path in the quiver where arrow is incoming at path."""
-        paths = [arrow + path for arrow in self._incomingArrows(path.source)]
-        return [path for path in paths if path]
+        compiled = self._compiled()
+        return [
+            self._path(self.source[arrow], (arrow,) + path.monomial, path.target)
+            for arrow in compiled.incomingLabels(compiled.vertexIndex[path.source])
+        ]
 
     def _extendPathByOutgoingArrows(self, path: _Path) -> list[_Path]:
         """Given a path encoded as a list of integers find all paths of the form
         path * arrow in the quiver where arrow is outgoing at path."""
-        return [~path for path in (~self)._extendPathByIncomingArrows(~path)]
+        compiled = self._compiled()
+        return [
+            self._path(path.source, path.monomial + (arrow,), self.target[arrow])
+            for arrow in compiled.outgoingLabels(compiled.vertexIndex[path.target])
+        ]
 
     def allPathsOutOf(self, v: int, length: int) -> list[_Path]:
         """Return the set of all paths in the quiver whose source is vertex v."""
-        result = []
         assert length > -1, ValueError("Length must be non-negative.")
 
         if length == 0:
-            return [_Path(v, [], v, self)]
+            return [self._path(v, (), v)]
 
-        if length == 1:
-            return self._outgoingArrows(v)
-        else:
-            new_paths = self.allPathsOutOf(v, 1)
-            result = new_paths[::]
-            counter = 1
-            while counter < length:
-                old_paths = new_paths[::]
-                new_paths = []
-                """Append all possible outgoing vertices"""
-                for path in old_paths:
-                    new = self._extendPathByOutgoingArrows(path)
-                    new_paths.extend(new)
-                    result.extend(new)
-                counter += 1
-        return result
+        compiled = self._compiled()
+        return [
+            self._path(v, monomial, compiled.vertexLabels[end])
+            for monomial, end in compiled.walksFrom(compiled.vertexIndex[v], length)
+        ]
 
     def allPathsInto(self, v: int, length: int) -> list[_Path]:
         """Return the set of all paths in the quiver whose target is v.
         The stationary path at v is always ignored."""
-        return [~path for path in (~self).allPathsOutOf(v, length)]
+        assert length > -1, ValueError("Length must be non-negative.")
+
+        if length == 0:
+            return [self._path(v, (), v)]
 
-    def pathsFromTo(self, v: int, w: int, length: int) -> list[_Path]:
-        """Return the set of all paths from v to w up to the given length."""
+        # Walks out of v in the opposite quiver are paths into v read backwards.
+        opposite = (~self)._compiled()
+        return [
+            self._path(opposite.vertexLabels[start], monomial[::-1], v)
+            for monomial, start in opposite.walksFrom(opposite.vertexIndex[v], length)
+        ]
+
+    def pathsFromTo(
+        self, v: int, w: int, length: int, meetInTheMiddle: bool = False
+    ) -> list[_Path]:
+        """Return the set of all paths from v to w up to the given length. See
+        _CompiledQuiver.walksBetween for meetInTheMiddle."""
         assert length > -1, ValueError("Length must be non-negative.")
 
         if length == 0:
             if v != w:
                 return []
             else:
-                return [_Path(v, [], v, self)]
-
-        if length == 1:
-            # TODO: Can optimize by picking v or w depending on size of out(v) or in(w).
-            # Can use {}^OP to easily change between v and w.
-            return [path for path in self._incomingArrows(w) if path.source == v]
+                return [self._path(v, (), v)]
 
-        else:
-            part1 = self.allPathsOutOf(v, 1)
-            part2 = self.allPathsInto(w, length - 1)
-            # TODO: optimize the size of |part1||part2|?
-            paths = [
-                a1 + a2 for a1, a2 in product(part1, part2) if a1.target == a2.source
-            ]
-            # The last IF already makes sure that no path in paths is None.
-            return [path for path in paths if path]
+        compiled = self._compiled()
+        index = compiled.vertexIndex
+        return [
+            self._path(v, monomial, w)
+            for monomial in compiled.walksBetween(
+                index[v], index[w], length, meetInTheMiddle
+            )
+        ]
 
-    def arrowIdeal(self, length: int, top=False) -> list[_Path]:
+    def arrowIdeal(
+        self, length: int, top=False, workers: int | None = None
+    ) -> list[_Path]:
         """Return a list of all Paths  in Q up to the specified length.
         Paths are listed according to the degree lexicographical order.
         If top is set to True, prints only the paths of maximal length
-        that are obtained."""
+        that are obtained.
 
-        result = []
-        for a, b in product(self.nodes, self.nodes):
-            result.extend(self.pathsFromTo(a, b, length))
-        result.sort()
+        If workers > 1, the paths are enumerated by a pool of that many
+        processes, each handling the paths out of some vertices, or starting
+        with some arrows for vertices of high out-degree. Workers send back
+        sorted arrays of arrow labels, which are merged in order. The result
+        does not depend on the number of workers."""
+        assert length > -1, ValueError("Length must be non-negative.")
 
-        if top:
-            return [path for path in result if len(path) == length]
+        if length == 0:
+            return [self._path(v, (), v) for v in self.nodes]
+        if workers is not None and workers > 1:
+            return self._parallelArrowIdeal(length, top, workers)
+
+        compiled = self._compiled()
+        result = [
+            self._path(
+                compiled.vertexLabels[start], monomial, compiled.vertexLabels[end]
+            )
+            for start in range(len(compiled.vertexLabels))
+            for monomial, end in compiled.walksFrom(start, length, top)
+        ]
+        result.sort(key=self.order.key)
+        return result
+
+    def _parallelArrowIdeal(self, length: int, top: bool, workers: int) -> list[_Path]:
+        compiled = self._compiled()
+        shards = _shards(compiled, workers)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initShardWorker,
+            initargs=(self, compiled),
+        ) as executor:
+            results = list(
+                executor.map(_enumerateShard, shards, repeat(length), repeat(top))
+            )
+
+        def entries(shard: int) -> Iterator[tuple[int, int, int]]:
+            keys, _, _ = results[shard]
+            return ((key, shard, i) for i, key in enumerate(keys))
+
+        source, target = self.source, self.target
+        paths = []
+        for _, shard, i in heapq.merge(*map(entries, range(len(shards)))):
+            _, arrows, offsets = results[shard]
+            monomial = tuple(arrows[offsets[i] : offsets[i + 1]])
+            paths.append(
+                self._path(source[monomial[0]], monomial, target[monomial[-1]])
+            )
+        return paths
+
+    def __getstate__(self) -> dict:
+        """Pickle the definition of the quiver, without its caches."""
+        state = self.__dict__.copy()
+        state["_internTable"] = self._internTable is not None
+        state["_opposite"] = None
+        state["_compiledQuiver"] = None
+        state["_pathIds"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._internTable = WeakValueDictionary() if state["_internTable"] else None
+
+    def iterPathsOutOf(self, v: int, length: int) -> Iterator[_Path]:
+        """Generate the paths of allPathsOutOf(v, length), from the largest to
+        the smallest."""
+        assert length > -1, ValueError("Length must be non-negative.")
+        if length == 0:
+            return iter([self._path(v, (), v)])
+        return self._iterPaths(range(length, 0, -1), source=v)
+
+    def iterPathsInto(self, v: int, length: int) -> Iterator[_Path]:
+        """Generate the paths of allPathsInto(v, length), from the largest to
+        the smallest."""
+        assert length > -1, ValueError("Length must be non-negative.")
+        if length == 0:
+            return iter([self._path(v, (), v)])
+        return self._iterPaths(range(length, 0, -1), target=v)
+
+    def iterPathsFromTo(self, v: int, w: int, length: int) -> Iterator[_Path]:
+        """Generate the paths of pathsFromTo(v, w, length), from the largest to
+        the smallest."""
+        assert length > -1, ValueError("Length must be non-negative.")
+        if length == 0:
+            return iter([self._path(v, (), v)] if v == w else [])
+        return self._iterPaths(range(length, 0, -1), source=v, target=w)
+
+    def iterArrowIdeal(self, length: int, top=False) -> Iterator[_Path]:
+        """Generate the paths of arrowIdeal(length, top), in the same order.
+
+        For the graded lexicographic orders, paths are produced by a depth-first
+        search whose memory is proportional to length, so that large path spaces
+        can be scanned without storing them. For other orders, all paths are
+        generated and sorted first."""
+        assert length > -1, ValueError("Length must be non-negative.")
+        if length == 0:
+            return iter([self._path(v, (), v) for v in self.nodes])
+        return self._iterPaths([length] if top else range(length, 0, -1))
+
+    def _iterPaths(
+        self,
+        lengths: Iterable[int],
+        source: int | None = None,
+        target: int | None = None,
+    ) -> Iterator[_Path]:
+        """Generate the paths of the given lengths from source to target (any
+        vertex if None), from the largest to the smallest. Lengths must be
+        decreasing."""
+        compiled = self._compiled()
+        index = compiled.vertexIndex
+        start = None if source is None else index[source]
+        end = None if target is None else index[target]
+        direction = self.order._lexDirection
+        labels, vertices = compiled.arrowLabels, compiled.vertexLabels
+        sources, targets = compiled.source, compiled.target
+
+        def paths(length: int, forward: bool) -> Iterator[_Path]:
+            for walk in compiled.iterWalks(length, forward, start, end):
+                yield self._path(
+                    vertices[sources[walk[0]]],
+                    tuple(labels[a] for a in walk),
+                    vertices[targets[walk[-1]]],
+                )
+
+        if direction is None:
+            result = [path for n in lengths for path in paths(n, True)]
+            result.sort(key=self.order.key)
+            yield from result
         else:
-            return result
+            for n in lengths:
+                yield from paths(n, direction == 1)
+
+    def pathArray(self, length: int, vertices: list[int] | None = None):
+        """Return the paths of a given length starting at the given vertices
+        (all by default) as a path_array.PathArray, which stores them as NumPy
+        arrays and builds path objects on demand. Requires NumPy."""
+        from path_array import pathsOfLength  # Optional NumPy dependency.
+
+        return pathsOfLength(self, length, vertices)
+
+    def pathCounts(self, length: int) -> list[dict[tuple[int, int], int]]:
+        """Return, for every degree 0 <= k <= length, the dictionary sending a
+        pair (v, w) of vertices to the number of paths of length k from v to w,
+        omitting zero counts. The paths are counted through powers of the
+        adjacency matrix, with exact integers, without being enumerated."""
+        assert length > -1, ValueError("Length must be non-negative.")
+        compiled = self._compiled()
+        labels = compiled.vertexLabels
+        outStart, outArrows, target = (
+            compiled.outStart,
+            compiled.outArrows,
+            compiled.target,
+        )
+
+        # rows[i][j] is the number of paths of the current length from i to j.
+        rows = [{i: 1} for i in range(len(labels))]
+        result = []
+        for degree in range(length + 1):
+            if degree:
+                extended = []
+                for row in rows:
+                    new: dict[int, int] = {}
+                    for j, count in row.items():
+                        for a in outArrows[outStart[j] : outStart[j + 1]]:
+                            new[target[a]] = new.get(target[a], 0) + count
+                    extended.append(new)
+                rows = extended
+            result.append(
+                {
+                    (labels[i], labels[j]): count
+                    for i, row in enumerate(rows)
+                    for j, count in row.items()
+                }
+            )
+        return result
+
+    def hilbertSeries(
+        self, sources: list[int] | None = None, targets: list[int] | None = None
+    ) -> tuple[list[int], list[int]]:
+        """Return the Hilbert series of the path algebra kQ, the generating
+        function of the number of paths of each length, as a pair of integer
+        polynomials (numerator, denominator) listed by increasing degree. The
+        denominator is det(I - tA), for A the adjacency matrix of the quiver,
+        and the fraction is not reduced. Only the paths from sources to targets
+        are counted, if given."""
+        compiled = self._compiled()
+        index = compiled.vertexIndex
+        left = [0] * len(compiled.vertexLabels)
+        right = [0] * len(compiled.vertexLabels)
+        for v in self.nodes if sources is None else sources:
+            left[index[v]] = 1
+        for w in self.nodes if targets is None else targets:
+            right[index[w]] = 1
+        return hilbert.walkSeries(compiled.adjacencyMatrix(), left, right)
 
     def createPath(
         self,
         source: int,
-        monomial: list[int],
+        monomial: Sequence[int],
         target: int,
-    ):
-        return _Path(source, monomial, target, self)
+    ) -> _Path:
+        path = _Path(source, monomial, target, self)
+        if self._internTable is None:
+            return path
+        return self._internTable.setdefault((source, path.monomial, target), path)
+
+    def _path(self, source: int, monomial: tuple[int, ...], target: int) -> _Path:
+        """Create (or look up in the intern table) the path with the given
+        source, monomial and target, without validating it."""
+        table = self._internTable
+        if table is None:
+            return _Path._unchecked(source, monomial, target, self)
+        key = (source, monomial, target)
+        path = table.get(key)
+        if path is None:
+            path = table[key] = _Path._unchecked(source, monomial, target, self)
+        return path
 
     def createNonePath(self):
         return _Path(0, [], 0, self, isEmpty=True)
 
 
-def _assertArrowsInQuiver(monomial: list[int], quiver: Quiver) -> None:
+class _PathDictionary:
+    """Dense integer ids for the paths of a quiver, assigned on first use. The
+    sort key of each path in the order of the quiver is stored with it."""
+
+    def __init__(self) -> None:
+        self.ids: dict[_Path, int] = {}
+        self.paths: list[_Path] = []
+        self.keys: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def id(self, path: _Path) -> int:
+        """Return the id of a path, assigning a new one if needed."""
+        i = self.ids.get(path)
+        if i is None:
+            i = self.ids[path] = len(self.paths)
+            self.paths.append(path)
+            self.keys.append(path.quiver.order.key(path))
+        return i
+
+
+class _CompiledQuiver:
+    """Frozen, array-backed form of a quiver used for path enumeration.
+
+    Vertices and arrows are relabelled by their rank among the labels of the
+    quiver, so that the dense ids 0, ..., n-1 respect the order of the labels.
+    Sources and targets are stored in flat arrays and the incoming and outgoing
+    arrows at each vertex in compressed sparse row form: the outgoing arrows at
+    vertex i are outArrows[outStart[i]:outStart[i + 1]]."""
+
+    def __init__(self, quiver: Quiver) -> None:
+        vertices = sorted(quiver.nodes)
+        arrows = sorted(quiver.arrows)
+
+        self.vertexLabels = tuple(vertices)
+        self.arrowLabels = tuple(arrows)
+        self.vertexIndex = {v: i for i, v in enumerate(vertices)}
+        self.arrowIndex = {a: i for i, a in enumerate(arrows)}
+        self.source = array("l", [self.vertexIndex[quiver.source[a]] for a in arrows])
+        self.target = array("l", [self.vertexIndex[quiver.target[a]] for a in arrows])
+        self.outStart, self.outArrows = _compressedAdjacency(self.source, len(vertices))
+        self.inStart, self.inArrows = _compressedAdjacency(self.target, len(vertices))
+        self._offsets = [0, len(vertices)]
+
+    def _reversed(self) -> _CompiledQuiver:
+        """Return the compiled form of the opposite quiver, sharing all arrays
+        with self."""
+        opposite = object.__new__(_CompiledQuiver)
+        opposite.__dict__.update(self.__dict__)
+        opposite.source, opposite.target = self.target, self.source
+        opposite.outStart, opposite.inStart = self.inStart, self.outStart
+        opposite.outArrows, opposite.inArrows = self.inArrows, self.outArrows
+        return opposite
+
+    def gradedRank(self, path: _Path, arrows: Sequence[int]) -> int:
+        """Return the position of a path among all paths of the quiver ordered
+        by length first and then lexicographically by arrows, which is the
+        sequence of arrows of path read in the order to be compared. Stationary
+        paths come first, with e_v larger than e_w if v < w."""
+        if path.nonePath:
+            return -1
+        if not arrows:
+            return len(self.vertexLabels) - 1 - self.vertexIndex[path.source]
+
+        m = len(self.arrowLabels)
+        offsets = self._offsets
+        while len(offsets) <= len(arrows):
+            offsets.append(offsets[-1] + m ** (len(offsets) - 1))
+
+        index = self.arrowIndex
+        rank = 0
+        for arrow in arrows:
+            rank = rank * m + index[arrow]
+        return offsets[len(arrows)] + rank
+
+    def adjacencyMatrix(self) -> list[list[int]]:
+        """Return the matrix whose entry (i, j) is the number of arrows from the
+        vertex with id i to the one with id j."""
+        n = len(self.vertexLabels)
+        matrix = [[0] * n for _ in range(n)]
+        for s, t in zip(self.source, self.target):
+            matrix[s][t] += 1
+        return matrix
+
+    def iterWalks(
+        self,
+        length: int,
+        forward: bool = True,
+        start: int | None = None,
+        end: int | None = None,
+    ) -> Iterator[tuple[int, ...]]:
+        """Generate the walks of a given positive length, as tuples of arrow
+        ids, from the vertex with id start to the one with id end (any vertex if
+        None). If forward is True, walks are in decreasing lexicographic order
+        of their arrow ids, read from the start, by a depth-first search from
+        the start. Otherwise they are in decreasing lexicographic order read from
+        the end, by a depth-first search from the end.
+
+        Branches of the search that cannot be completed are pruned, so every
+        step of the search leads to a walk."""
+        if forward:
+            adjacencyStart, adjacency, step = self.outStart, self.outArrows, self.target
+            root, leaf = start, end
+        else:
+            adjacencyStart, adjacency, step = self.inStart, self.inArrows, self.source
+            root, leaf = end, start
+
+        alive = self._reachable(leaf, length - 1, forward)
+
+        def choices(arrows: Iterable[int], remaining: int) -> list[int]:
+            ok = alive[remaining]
+            return [a for a in arrows if ok[step[a]]]
+
+        if root is None:
+            first = choices(range(len(step) - 1, -1, -1), length - 1)
+        else:
+            arrows = adjacency[adjacencyStart[root] : adjacencyStart[root + 1]]
+            first = choices(reversed(arrows), length - 1)
+
+        walk: list[int] = []
+        stack = [iter(first)]
+        while stack:
+            a = next(stack[-1], None)
+            if a is None:
+                stack.pop()
+                if walk:
+                    walk.pop()
+                continue
+            walk.append(a)
+            if len(walk) == length:
+                yield tuple(walk) if forward else tuple(reversed(walk))
+                walk.pop()
+            else:
+                u = step[a]
+                arrows = adjacency[adjacencyStart[u] : adjacencyStart[u + 1]]
+                stack.append(iter(choices(reversed(arrows), length - len(walk) - 1)))
+
+    def _reachable(
+        self, leaf: int | None, length: int, forward: bool = True
+    ) -> list[list[bool]]:
+        """Return the table whose entry [r][u], for 0 <= r <= length, tells
+        whether there is a walk of length r from the vertex with id u to the
+        one with id leaf (any vertex if None). If forward is False, walks are
+        followed backwards, from leaf to u."""
+        if forward:
+            adjacencyStart, adjacency, step = self.outStart, self.outArrows, self.target
+        else:
+            adjacencyStart, adjacency, step = self.inStart, self.inArrows, self.source
+        n = len(self.vertexLabels)
+        table = [[leaf is None or u == leaf for u in range(n)]]
+        for _ in range(length):
+            previous = table[-1]
+            table.append(
+                [
+                    any(
+                        previous[step[a]]
+                        for a in adjacency[adjacencyStart[u] : adjacencyStart[u + 1]]
+                    )
+                    for u in range(n)
+                ]
+            )
+        return table
+
+    def walksBetween(
+        self, i: int, j: int, length: int, meetInTheMiddle: bool = False
+    ) -> list[tuple[int, ...]]:
+        """Return the monomials (tuples of arrow labels) of the paths of length
+        between 1 and length from the vertex with id i to the one with id j, by
+        increasing length and then lexicographically by arrow labels.
+
+        Only prefixes that can still be completed to a path ending at j are
+        extended. With meetInTheMiddle, each path is instead split in two halves,
+        enumerated from i and into j respectively, which are joined by their
+        common vertex."""
+        if length < 1:
+            return []
+        reach = self._reachable(j, length, True)
+        if meetInTheMiddle:
+            return self._meetInTheMiddle(i, j, length, reach)
+
+        # within[r][u]: there is a walk of length at most r from u to j.
+        within = [reach[0]]
+        for row in reach[1:]:
+            within.append([a or b for a, b in zip(within[-1], row)])
+
+        labels, target = self.arrowLabels, self.target
+        outStart, outArrows = self.outStart, self.outArrows
+        result: list[tuple[int, ...]] = []
+        frontier: list[tuple[tuple[int, ...], int]] = [((), i)]
+        for degree in range(1, length + 1):
+            ok = within[length - degree]
+            frontier = [
+                (monomial + (labels[a],), target[a])
+                for monomial, end in frontier
+                for a in outArrows[outStart[end] : outStart[end + 1]]
+                if ok[target[a]]
+            ]
+            result.extend(monomial for monomial, end in frontier if end == j)
+        return result
+
+    def _meetInTheMiddle(
+        self, i: int, j: int, length: int, reach: list[list[bool]]
+    ) -> list[tuple[int, ...]]:
+        # A path of length L is split into a left half of length L // 2 out of
+        # i and a right half into j. A left walk of length d is kept if it can
+        # be completed to a path of length L >= 2d, a right walk of length e if
+        # it can be completed to a path of length L >= 2e - 1.
+        labels, index = self.arrowLabels, self.arrowIndex
+        source, target = self.source, self.target
+        reached = self._reachable(i, length, False)  # Walks out of i.
+
+        left = [[((), i)]]
+        for d in range(1, length // 2 + 1):
+            left.append(
+                [
+                    (monomial + (labels[a],), target[a])
+                    for monomial, end in left[-1]
+                    for a in self.outArrows[self.outStart[end] : self.outStart[end + 1]]
+                    if any(reach[r][target[a]] for r in range(d, length - d + 1))
+                ]
+            )
+        right = [[((), j)]]
+        for e in range(1, length - length // 2 + 1):
+            right.append(
+                [
+                    ((labels[a],) + monomial, source[a])
+                    for monomial, start in right[-1]
+                    for a in self.inArrows[
+                        self.inStart[start] : self.inStart[start + 1]
+                    ]
+                    if any(reached[r][source[a]] for r in range(e - 1, length - e + 1))
+                ]
+            )
+
+        result: list[tuple[int, ...]] = []
+        for total in range(1, length + 1):
+            h = total // 2
+            buckets: dict[int, list[tuple[int, ...]]] = {}
+            for monomial, start in right[total - h]:
+                buckets.setdefault(start, []).append(monomial)
+            for bucket in buckets.values():
+                bucket.sort(key=lambda monomial: [index[a] for a in monomial])
+            for prefix, end in left[h]:
+                result.extend(prefix + suffix for suffix in buckets.get(end, ()))
+        return result
+
+    def outgoingLabels(self, i: int) -> list[int]:
+        """Return the labels of the arrows outgoing at the vertex with id i."""
+        labels = self.arrowLabels
+        return [
+            labels[a] for a in self.outArrows[self.outStart[i] : self.outStart[i + 1]]
+        ]
+
+    def incomingLabels(self, i: int) -> list[int]:
+        """Return the labels of the arrows incoming at the vertex with id i."""
+        labels = self.arrowLabels
+        return [labels[a] for a in self.inArrows[self.inStart[i] : self.inStart[i + 1]]]
+
+    def walksFrom(
+        self, i: int, length: int, top: bool = False
+    ) -> list[tuple[tuple[int, ...], int]]:
+        """Return all pairs (monomial, j) where monomial is the tuple of arrow
+        labels of a path of length between 1 and length starting at the vertex
+        with id i and j is the id of its target. If top is True, only the paths
+        of length equal to length are returned."""
+        labels, target = self.arrowLabels, self.target
+        outStart, outArrows = self.outStart, self.outArrows
+
+        result: list[tuple[tuple[int, ...], int]] = []
+        frontier: list[tuple[tuple[int, ...], int]] = [((), i)]
+        for degree in range(length):
+            frontier = [
+                (monomial + (labels[a],), target[a])
+                for monomial, end in frontier
+                for a in outArrows[outStart[end] : outStart[end + 1]]
+            ]
+            if not top or degree == length - 1:
+                result.extend(frontier)
+        return result
+
+
+def _shards(compiled: _CompiledQuiver, workers: int) -> list[list[int]]:
+    """Split the arrows of a compiled quiver, by id, into groups of arrows with
+    the same source. A vertex with more than about len(arrows) / workers
+    outgoing arrows is split into one group per arrow."""
+    limit = max(1, len(compiled.arrowLabels) // workers)
+    outStart, outArrows = compiled.outStart, compiled.outArrows
+    shards = []
+    for i in range(len(compiled.vertexLabels)):
+        arrows = list(outArrows[outStart[i] : outStart[i + 1]])
+        if len(arrows) > limit:
+            shards.extend([a] for a in arrows)
+        elif arrows:
+            shards.append(arrows)
+    return shards
+
+
+# The quiver enumerated by a worker process of Quiver._parallelArrowIdeal, set
+# once per process by _initShardWorker.
+_shardQuiver: Quiver | None = None
+
+
+def _initShardWorker(quiver: Quiver, compiled: _CompiledQuiver) -> None:
+    """Install the quiver and its compiled form in a worker process, so that
+    tasks only carry shard descriptors."""
+    global _shardQuiver
+    quiver._compiledQuiver = compiled
+    _shardQuiver = quiver
+
+
+def _enumerateShard(
+    firstArrows: list[int], length: int, top: bool
+) -> tuple[list[int], array, array]:
+    """Enumerate the paths of the worker's quiver of length at most length
+    (exactly length if top) starting with one of the arrows with the given ids.
+    Return their sort keys in increasing order, the concatenation of their arrow
+    labels in the same order, and the offsets of each path in it."""
+    quiver = _shardQuiver
+    compiled = quiver._compiled()
+    labels, vertices = compiled.arrowLabels, compiled.vertexLabels
+    entries = []
+    for a in firstArrows:
+        first, end = (labels[a],), compiled.target[a]
+        walks = compiled.walksFrom(end, length - 1, top)
+        if not top or length == 1:
+            walks.insert(0, ((), end))
+        for monomial, last in walks:
+            path = _Path._unchecked(
+                vertices[compiled.source[a]], first + monomial, vertices[last], quiver
+            )
+            entries.append((quiver.order.key(path), path.monomial))
+    entries.sort()
+
+    arrows = array("l")
+    offsets = array("l", [0])
+    for _, monomial in entries:
+        arrows.extend(monomial)
+        offsets.append(len(arrows))
+    return [key for key, _ in entries], arrows, offsets
+
+
+def _compressedAdjacency(ends: array, n: int) -> tuple[array, array]:
+    """Given the array of endpoints (sources or targets) of the arrows of a
+    quiver with n vertices, return the pair (start, arrows) such that the
+    arrows with endpoint i are arrows[start[i]:start[i + 1]], in increasing
+    order."""
+    start = array("l", [0] * (n + 1))
+    for end in ends:
+        start[end + 1] += 1
+    for i in range(n):
+        start[i + 1] += start[i]
+
+    position = start[:-1]
+    arrows = array("l", [0] * len(ends))
+    for a, end in enumerate(ends):
+        arrows[position[end]] = a
+        position[end] += 1
+    return start, arrows
+
+
+def _assertArrowsInQuiver(monomial: Sequence[int], quiver: Quiver) -> None:
     """Helper function to verify that a path initialized to live in a
     given quiver has its arrows in that quiver and these arrows are
     composable."""
+    arrows = quiver._compiled().arrowIndex
     for i in range(len(monomial)):
-        assert monomial[i] in quiver.arrows, ValueError(
+        assert monomial[i] in arrows, ValueError(
             f"Arrow {monomial[i]} at position {i} does not belong to quiver {quiver}."
         )
         if i < len(monomial) - 1:
@@ -1,7 +1,16 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+import heapq
+from itertools import islice
+from divisor_index import DivisorIndex
+import linear_reduction
 import polynomial as poly
 import quiver
 from linalg import field
-from typing import Tuple
+from typing import Any, Callable, Iterable, Iterator, Tuple
 
 # Refactor? A rewriting rule is just a polynomial with a chosen leading
 # term. Since the order is chosen by the user, the leading term is deduced
@@ -20,11 +29,9 @@ class RewritingRule:
 
         # Check that rewriting rule is consistent with chosen order. Guarantees termination.
         for path in polynomial.support:
-            assert leading_term < path, ValueError(
-                f"""Cannot create rewriting rule!
+            assert leading_term < path, ValueError(f"""Cannot create rewriting rule!
                 Issue: {leading_term} < {path} in the {leading_term.quiver.order} order.
-                """
-            )
+                """)
 
         self.leading_term = leading_term
         self.polynomial = polynomial
@@ -37,77 +44,1304 @@ class RewritingRule:
         """Reduce all arrows that are divisible by the leading term of
         the rewriting rule once. Reduces the first occurrence of a divisor
         only."""
-        copy = polynomial._copy()
+        length = len(self.leading_term)
+        new_polynomial_list: list[Tuple[quiver._Path, field.FieldScalar]] = []
 
-        for i in range(len(copy.polynomial)):
-            term, scalar = copy.polynomial[i]
+        for term, scalar in polynomial.terms.items():
             start = term._find(self.leading_term)
-            if start != -1:
-                new_polynomial_list: list[Tuple[quiver._Path, field.FieldScalar]] = []
-                for arrow, coefficient in self.polynomial.polynomial:
+            if start == -1:
+                new_polynomial_list.append((term, scalar))
+            else:
+                for arrow, coefficient in self.polynomial.terms.items():
                     new_term = (
-                        term._replaceBy(arrow, start, len(self.leading_term)),
+                        term._replaceBy(arrow, start, length),
                         scalar * coefficient,
                     )
-                    new_polynomial_list += [new_term]
-
-                old_polynomial_list = copy.polynomial[:]
-                old_polynomial_list.pop(i)
-                # TODO: Maybe one can modify polynomial in place instead by allowing
-                # polynomials to consist of list of lists of paths, coeff.
-                new_polynomial = poly.Polynomial(new_polynomial_list)
-                copy = poly.Polynomial(old_polynomial_list) + new_polynomial
-        return copy
+                    new_polynomial_list.append(new_term)
+        return poly.Polynomial(new_polynomial_list)
 
     def reduceFully(self, polynomial: poly.Polynomial) -> poly.Polynomial:
         """Rewrites a polynomial until no path in its support is divisible by
         the leading term of the rewriting rule."""
-        new_poly = self.reduceOnce(polynomial)
-        old_poly = polynomial
-
-        while new_poly != old_poly:
-            old_poly = new_poly
-            new_poly = self.reduceOnce(old_poly)
-        return new_poly
+        return RewritingSystem([self]).normalForm(polynomial)
 
 
 class RewritingSystem:
-    """A rewriting system is initialized by a list of rewriting rules."""
+    """A rewriting system is initialized by a list of rewriting rules. Rules
+    must be added and removed through addRule and removeRule, which keep the
+    index of leading terms up to date."""
 
     def __init__(self, rules: list[RewritingRule]) -> None:
         self.rules = rules
+        self.index = DivisorIndex(rules)
+        # Normal forms of paths, valid for the version (number of changes of
+        # the rules) _memoVersion.
+        self._version = 0
+        self._memo: dict[quiver._Path, poly.Polynomial] = {}
+        self._memoVersion = 0
+
+    def __str__(self) -> str:
+        return "\n".join(str(rule) for rule in self.rules)
+
+    def addRule(self, rule: RewritingRule) -> None:
+        self.rules.append(rule)
+        self.index.add(rule)
+        self._version += 1
+
+    def removeRule(self, rule: RewritingRule) -> None:
+        self.rules.remove(rule)
+        self.index.remove(rule)
+        self._version += 1
+
+    def isConfluent(self) -> bool:
+        """Check that the S-polynomials of all overlaps and inclusions of leading
+        monomials of rules rewrite to zero."""
+        return all(
+            not self.normalForm(pair.sPolynomial()).terms
+            for rule1 in self.rules
+            for rule2 in self.rules
+            for pair in _criticalPairs(rule1, rule2)
+        )
+
+    def complete(
+        self,
+        strategy: PairSelectionStrategy | None = None,
+        criteria: bool = True,
+        batched: bool = False,
+        signature: bool = False,
+        workers: int | None = None,
+        chunkSize: int | None = None,
+    ) -> RewritingSystem:
+        """Return the reduced confluent rewriting system generating the same
+        ideal as self. See Completion, BatchedCompletion for batched,
+        SignatureCompletion for signature, which ignores the strategy, and
+        ParallelCompletion for workers and chunkSize."""
+        if signature:
+            return SignatureCompletion(self, criteria).run()
+        if workers is not None:
+            strategy = strategy or NormalStrategy()
+            return ParallelCompletion(
+                self, strategy, criteria, workers, chunkSize
+            ).run()
+        completion = BatchedCompletion if batched else Completion
+        return completion(self, strategy or NormalStrategy(), criteria).run()
+
+    def _findDivisor(self, path: quiver._Path) -> Tuple[RewritingRule, int] | None:
+        """Return a pair (rule, i) such that the leading term of rule appears in
+        path starting at position i, with i as small as possible, or None if
+        path is not divisible by any leading term."""
+        return self.index.leftmostMatch(path)
+
+    def normalForm(self, polynomial: poly.Polynomial) -> poly.Polynomial:
+        """Rewrite a polynomial with the rules of the system until no path in
+        its support is divisible by the leading term of a rule.
+
+        Terms are rewritten from the largest to the smallest. Since rewriting
+        a path only produces smaller paths, the largest pending path is final
+        once no rule applies to it. The pending terms are kept in a single
+        dictionary, indexed by a heap of sort keys, which is updated in place
+        by every rewriting step."""
+        return _rewrite(polynomial, self._findDivisor)
+
+    def normalForms(
+        self,
+        polynomials: Iterable[poly.Polynomial],
+        workers: int | None = None,
+        chunkSize: int = 256,
+    ) -> Iterator[poly.Polynomial]:
+        """Yield the normal forms of a stream of polynomials, in order.
+
+        Since the normal form is linear, it is computed as the combination of
+        the normal forms of the paths in the support, which are kept in a memo
+        table until the rules change. If workers > 1, the polynomials are sent
+        in chunks of chunkSize to a pool of that many processes, each holding
+        a copy of the system and its own memo table."""
+        if workers is not None and workers > 1 and self.rules:
+            yield from self._parallelNormalForms(polynomials, workers, chunkSize)
+            return
+        for polynomial in polynomials:
+            yield self._memoNormalForm(polynomial)
+
+    def _memoNormalForm(self, polynomial: poly.Polynomial) -> poly.Polynomial:
+        if self._memoVersion != self._version:
+            self._memo.clear()
+            self._memoVersion = self._version
+
+        memo = self._memo
+        terms: dict[quiver._Path, field.FieldScalar] = {}
+        for path, c in polynomial.terms.items():
+            normal_form = memo.get(path)
+            if normal_form is None:
+                monomial = poly.Polynomial._fromTerms({path: c._getFieldOne()})
+                normal_form = memo[path] = self.normalForm(monomial)
+            for other, d in normal_form.terms.items():
+                old = terms.get(other)
+                if old is None:
+                    terms[other] = c * d
+                else:
+                    new = old._addMul(c, d)
+                    if poly._isZero(new):
+                        del terms[other]
+                    else:
+                        terms[other] = new
+        return poly.Polynomial._fromTerms(terms)
+
+    def _parallelNormalForms(
+        self, polynomials: Iterable[poly.Polynomial], workers: int, chunkSize: int
+    ) -> Iterator[poly.Polynomial]:
+        q = self.rules[0].leading_term.quiver
+        changes = [(i, _encodeRule(rule)) for i, rule in enumerate(self.rules)]
+        iterator = iter(polynomials)
+        pending: deque = deque()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_initResident, initargs=(q, changes)
+        ) as executor:
+            while True:
+                # Keep two chunks per worker in flight.
+                while len(pending) < 2 * workers:
+                    chunk = [_encodePolynomial(p) for p in islice(iterator, chunkSize)]
+                    if not chunk:
+                        break
+                    pending.append(executor.submit(_normalFormChunk, chunk))
+                if not pending:
+                    return
+                for terms in pending.popleft().result():
+                    yield _decodePolynomial(q, terms)
+
+
+def _rewrite(
+    polynomial: poly.Polynomial,
+    findDivisor: Callable[[quiver._Path], Tuple[RewritingRule, int] | None],
+) -> poly.Polynomial:
+    """Rewrite the paths of a polynomial, from the largest to the smallest, with
+    the divisors (rule, start) returned by findDivisor, until it returns None
+    for every path. See RewritingSystem.normalForm."""
+    if not polynomial.terms:
+        return polynomial
+
+    pending = dict(polynomial.terms)
+    key = next(iter(pending)).quiver.order.key
+    heap = [(key(path), path) for path in pending]
+    heapq.heapify(heap)
+    result: list[Tuple[quiver._Path, field.FieldScalar]] = []
+
+    while heap:
+        _, path = heapq.heappop(heap)
+        scalar = pending.pop(path, None)
+        if scalar is None:  # Cancelled or already processed.
+            continue
+
+        match = findDivisor(path)
+        if match is None:
+            result.append((path, scalar))
+            continue
+
+        rule, start = match
+        prefix = path.monomial[:start]
+        suffix = path.monomial[start + len(rule.leading_term) :]
+        for term, coefficient in rule.polynomial.terms.items():
+            new_path = path.quiver._path(
+                path.source, prefix + term.monomial + suffix, path.target
+            )
+            old_scalar = pending.get(new_path)
+            if old_scalar is None:
+                pending[new_path] = scalar * coefficient
+                heapq.heappush(heap, (key(new_path), new_path))
+            else:
+                new_scalar = old_scalar._addMul(scalar, coefficient)
+                if poly._isZero(new_scalar):
+                    del pending[new_path]
+                else:
+                    pending[new_path] = new_scalar
+
+    normal_form = poly.Polynomial._fromTerms(dict(result))
+    normal_form._sorted = result
+    return normal_form
+
+
+def _prefixFunction(word: list) -> list[int]:
+    """Return the failure function of a word: entry i is the length of the
+    longest proper prefix of word[: i + 1] that is also a suffix of it."""
+    result = [0] * len(word)
+    k = 0
+    for i in range(1, len(word)):
+        while k and word[i] != word[k]:
+            k = result[k - 1]
+        if word[i] == word[k]:
+            k += 1
+        result[i] = k
+    return result
+
+
+def overlaps(rule1: RewritingRule, rule2: RewritingRule) -> list[int]:
+    """Return the lengths k, in decreasing order, of all overlaps of the leading
+    monomials m1 of rule1 and m2 of rule2, meaning that the last k arrows of m1
+    are the first k arrows of m2 and 0 < k < min(len(m1), len(m2)). Then
+    m1 * b = a * m2 for nontrivial paths a and b."""
+    m1 = rule1.leading_term.monomial
+    m2 = rule2.leading_term.monomial
+
+    # The borders of m2 # m1 are the prefixes of m2 that are suffixes of m1.
+    failure = _prefixFunction(list(m2) + [None] + list(m1))
+    result = []
+    k = failure[-1]
+    while k:
+        if k < len(m1) and k < len(m2):
+            result.append(k)
+        k = failure[k - 1]
+    return result
+
+
+def inclusions(rule1: RewritingRule, rule2: RewritingRule) -> list[int]:
+    """Return the positions i, in increasing order, such that the leading
+    monomial m2 of rule2 appears in the leading monomial m1 of rule1 starting
+    at position i, meaning that m1 = a * m2 * b with len(a) = i."""
+    m1 = rule1.leading_term.monomial
+    m2 = rule2.leading_term.monomial
+    if not m2 or len(m2) > len(m1):
+        return []
+
+    failure = _prefixFunction(list(m2) + [None] + list(m1))
+    return [
+        i - 2 * len(m2)
+        for i in range(2 * len(m2), len(failure))
+        if failure[i] == len(m2)
+    ]
 
 
 def rulesOverlap(rule1: RewritingRule, rule2: RewritingRule) -> bool:
     """Determine if the leading monomials m1 of rule1 and m2 of rule2 overlap,
     meaning that there are nontrivial monomials a and b such that m1 * b = a * m2."""
+    return bool(overlaps(rule1, rule2))
+
+
+def sPolynomial(
+    rule1: RewritingRule, rule2: RewritingRule, overlap: int | None = None
+) -> poly.Polynomial | None:
+    """Return the S-polynomial of the overlap of length overlap (by default the
+    maximal one) of the leading monomials of two rules, or None if they do not
+    overlap. If m1 * b = a * m2, this is the difference P1 * b - a * P2 of the
+    two ways of rewriting m1 * b."""
+    if overlap is None:
+        lengths = overlaps(rule1, rule2)
+        if not lengths:
+            return None
+        overlap = lengths[0]
+    position = len(rule1.leading_term) - overlap
+    return _CriticalPair(rule1, rule2, position).sPolynomial()
+
+
+class _CriticalPair:
+    """An ambiguity between two rules: a path W, called the word of the pair,
+    in which the leading monomial m1 of rule1 appears at position 0 and the
+    leading monomial m2 of rule2 appears at the given position. This is an
+    overlap if m2 ends after m1, and an inclusion otherwise. The sugar of the
+    pair is an estimate of its degree used by SugarStrategy."""
+
+    __slots__ = ("rule1", "rule2", "position", "word", "sugar")
+
+    def __init__(
+        self,
+        rule1: RewritingRule,
+        rule2: RewritingRule,
+        position: int,
+        sugar: int = 0,
+    ) -> None:
+        m1, m2 = rule1.leading_term, rule2.leading_term
+        self.rule1 = rule1
+        self.rule2 = rule2
+        self.position = position
+        self.sugar = sugar
+        if position + len(m2) > len(m1):
+            self.word = m1.quiver._path(
+                m1.source, m1.monomial + m2.monomial[len(m1) - position :], m2.target
+            )
+        else:
+            self.word = m1
+
+    def sPolynomial(self) -> poly.Polynomial:
+        """Return the difference of the rewritings of the word with rule1
+        and rule2."""
+        m1, m2 = self.rule1.leading_term, self.rule2.leading_term
+        first = _splice(self.word, 0, len(m1), self.rule1.polynomial)
+        second = _splice(
+            self.word, self.position, self.position + len(m2), self.rule2.polynomial
+        )
+        return first - second
+
+
+def _splice(
+    word: quiver._Path, start: int, end: int, polynomial: poly.Polynomial
+) -> poly.Polynomial:
+    """Replace the subpath word[start:end] by a polynomial of parallel paths."""
+    prefix = word.monomial[:start]
+    suffix = word.monomial[end:]
+    make = word.quiver._path
+    return poly.Polynomial._fromTerms(
+        {
+            make(word.source, prefix + path.monomial + suffix, word.target): c
+            for path, c in polynomial.terms.items()
+        }
+    )
+
+
+def _criticalPairs(rule1: RewritingRule, rule2: RewritingRule) -> list[_CriticalPair]:
+    """Return all overlaps of rule1 followed by rule2 and all inclusions of the
+    leading monomial of rule2 in the one of rule1."""
+    length = len(rule1.leading_term)
+    pairs = [_CriticalPair(rule1, rule2, length - k) for k in overlaps(rule1, rule2)]
+    if rule1 is not rule2:
+        pairs += [_CriticalPair(rule1, rule2, i) for i in inclusions(rule1, rule2)]
+    return pairs
+
+
+def _ruleFromPolynomial(polynomial: poly.Polynomial) -> RewritingRule:
+    """Return the rule LM(p) ---> LM(p) - p / LC(p) of a non-zero polynomial p."""
+    leading_term, coefficient = polynomial.LT()
+    inverse = ~coefficient
+    return RewritingRule(
+        leading_term,
+        poly.Polynomial._fromTerms(
+            {
+                path: -(c * inverse)
+                for path, c in polynomial.terms.items()
+                if path != leading_term
+            }
+        ),
+    )
+
+
+class PairSelectionStrategy(ABC):
+    """Order in which a completion processes its critical pairs: pairs with
+    smaller keys are processed first."""
+
+    @abstractmethod
+    def _pairKey(self, pair: _CriticalPair) -> Any:
+        pass
+
+    @abstractmethod
+    def __str__(self) -> str:
+        pass
+
+
+class NormalStrategy(PairSelectionStrategy):
+    """Normal strategy. Selects the pair whose word is smallest in the order of
+    the quiver; for graded orders this processes pairs degree by degree."""
+
+    def _pairKey(self, pair: _CriticalPair) -> Any:
+        return -pair.word.quiver.order.key(pair.word)
+
+    def __str__(self) -> str:
+        return "Normal"
+
+
+class DegreeStrategy(PairSelectionStrategy):
+    """Degree strategy. Selects a pair whose word has minimal length, and
+    among those the one that was created first."""
+
+    def _pairKey(self, pair: _CriticalPair) -> Any:
+        return len(pair.word)
+
+    def __str__(self) -> str:
+        return "Degree"
+
+
+class SugarStrategy(PairSelectionStrategy):
+    """Sugar strategy. Selects the pair of minimal sugar, the degree the pair
+    would have if all relations were made homogeneous, breaking ties with the
+    normal strategy. It avoids the degree drops of non-homogeneous relations
+    steering the completion."""
+
+    def _pairKey(self, pair: _CriticalPair) -> Any:
+        return (pair.sugar, -pair.word.quiver.order.key(pair.word))
+
+    def __str__(self) -> str:
+        return "Sugar"
+
+
+class Completion:
+    """Completion of a rewriting system to a reduced confluent one, following
+    Buchberger's algorithm for path algebras.
+
+    Critical pairs (overlaps of leading monomials) are processed in the order
+    given by the strategy. The normal form of each S-polynomial with respect to
+    the current rules, if non-zero, becomes a new rule. Rules whose leading
+    monomial is divisible by the leading monomial of a new rule are removed and
+    replaced by the normal form of the S-polynomial of this inclusion. The
+    procedure terminates if and only if the ideal generated by the rules has a
+    finite Gröbner basis for the order of the quiver, e.g. when the quotient
+    algebra is finite dimensional.
+
+    Unless criteria is False, pairs that are known to rewrite to zero are
+    discarded without reducing them. The number of pairs discarded by each
+    criterion is counted in self.statistics:
+        * disjoint: pairs of rules whose leading monomials do not overlap, for
+          which no critical pair is formed (always applied);
+        * monomial: pairs of rules with zero right hand side;
+        * chain: pairs whose word W contains the leading monomial of a rule
+          strictly inside, i.e. not as a prefix or suffix of W. Then W is
+          resolved by the critical pairs of that rule with rule1 and rule2,
+          whose words are strictly shorter (Gebauer-Möller chain criterion).
+    It also counts the pairs created, the pairs reduced and the reductions to
+    zero, and the inclusions reduced when a rule is superseded."""
+
+    def __init__(
+        self,
+        system: RewritingSystem,
+        strategy: PairSelectionStrategy = NormalStrategy(),
+        criteria: bool = True,
+    ) -> None:
+        self.system = RewritingSystem([])
+        self.strategy = strategy
+        self.criteria = criteria
+        self.statistics = {
+            "pairs": 0,
+            "disjoint": 0,
+            "monomial": 0,
+            "chain": 0,
+            "inclusions": 0,
+            "reduced": 0,
+            "zero": 0,
+        }
+        self._pairs: list[Tuple[Any, int, _CriticalPair]] = []
+        self._counter = 0
+        self._sugar: dict[RewritingRule, int] = {}
+        self._toInsert = [(rule, _sugarOf(rule)) for rule in system.rules[::-1]]
+
+    def run(self) -> RewritingSystem:
+        """Run the completion and return the reduced confluent system."""
+        self._insertPending()
+        while self._pairs:
+            self._processPair(heapq.heappop(self._pairs)[2])
+            self._insertPending()
+        return self._reduced()
+
+    def _processPair(self, pair: _CriticalPair) -> None:
+        if pair.rule1 not in self._sugar or pair.rule2 not in self._sugar:
+            return  # One of the rules has been superseded.
+        if self.criteria and self._hasInteriorDivisor(pair.word):
+            self.statistics["chain"] += 1
+            return
+        self.statistics["reduced"] += 1
+        if not self._insertRemainder(pair.sPolynomial(), pair.sugar):
+            self.statistics["zero"] += 1
+
+    def _insertRemainder(self, polynomial: poly.Polynomial, sugar: int) -> bool:
+        """Schedule the normal form of polynomial for insertion as a rule, if it
+        is non-zero. Return whether it is non-zero."""
+        remainder = self.system.normalForm(polynomial)
+        if remainder.terms:
+            self._toInsert.append((_ruleFromPolynomial(remainder), sugar))
+        return bool(remainder.terms)
+
+    def _insertPending(self) -> None:
+        while self._toInsert:
+            self._insert(*self._toInsert.pop())
+
+    def _insert(self, rule: RewritingRule, sugar: int) -> None:
+        """Add a rule to the system, or if its leading monomial is reducible,
+        schedule the remainder of its S-polynomial with the divisor."""
+        match = self.system._findDivisor(rule.leading_term)
+        if match is None:
+            self._addRule(rule, sugar)
+        else:
+            divisor, position = match
+            pair = self._pair(rule, divisor, position)
+            self.statistics["inclusions"] += 1
+            self._insertRemainder(pair.sPolynomial(), pair.sugar)
+
+    def _addRule(self, rule: RewritingRule, sugar: int) -> None:
+        others = []
+        for other in self.system.rules[:]:
+            if inclusions(other, rule):  # Other is superseded by rule.
+                self.system.removeRule(other)
+                self._toInsert.append((other, self._sugar.pop(other)))
+            else:
+                others.append(other)
+
+        self.system.addRule(rule)
+        self._sugar[rule] = sugar
+        self._pushPairs(rule, rule)
+        for other in others:
+            self._pushPairs(other, rule)
+            self._pushPairs(rule, other)
+
+    def _pair(
+        self, rule1: RewritingRule, rule2: RewritingRule, position: int
+    ) -> _CriticalPair:
+        """Return the critical pair of rule1 and rule2 at position, with sugar
+        computed from the sugar of the rules."""
+        length1, length2 = len(rule1.leading_term), len(rule2.leading_term)
+        extra1 = max(position + length2 - length1, 0)  # Length of m1 * b1 - m1.
+        extra2 = position + max(length1 - position - length2, 0)  # Of a2 m2 b2 - m2.
+        sugar = max(
+            self._sugar.get(rule1, length1) + extra1,
+            self._sugar.get(rule2, length2) + extra2,
+        )
+        return _CriticalPair(rule1, rule2, position, sugar)
+
+    def _pushPairs(self, rule1: RewritingRule, rule2: RewritingRule) -> None:
+        lengths = overlaps(rule1, rule2)
+        if not lengths:
+            self.statistics["disjoint"] += 1
+            return
+
+        trivial = not rule1.polynomial.terms and not rule2.polynomial.terms
+        for k in lengths:
+            self.statistics["pairs"] += 1
+            if self.criteria and trivial:
+                self.statistics["monomial"] += 1
+                continue
+            pair = self._pair(rule1, rule2, len(rule1.leading_term) - k)
+            if self.criteria and self._hasInteriorDivisor(pair.word):
+                self.statistics["chain"] += 1
+                continue
+            self._counter += 1
+            heapq.heappush(self._pairs, (self._pairKey(pair), self._counter, pair))
+
+    def _pairKey(self, pair: _CriticalPair) -> Any:
+        return self.strategy._pairKey(pair)
+
+    def _hasInteriorDivisor(self, word: quiver._Path) -> bool:
+        return _hasInteriorDivisor(self.system.index, word)
+
+    def _reduced(self) -> RewritingSystem:
+        """Return the rules with right hand sides in normal form, sorted by
+        decreasing leading monomial."""
+        rules = sorted(self.system.rules, key=lambda rule: rule.leading_term)
+        return RewritingSystem(
+            [
+                RewritingRule(
+                    rule.leading_term, self.system.normalForm(rule.polynomial)
+                )
+                for rule in rules
+            ]
+        )
+
+
+class BatchedCompletion(Completion):
+    """Completion processing critical pairs degree by degree, in the manner of
+    Faugère's F4 algorithm.
+
+    All pending pairs whose word has minimal length are selected at once. Their
+    S-polynomials are reduced together with the reducers a * (m - p) * b of
+    every reducible path reachable from their supports (symbolic
+    preprocessing), by a single linear self-reduction. The rows whose leading
+    monomials are not divisible by a leading monomial of the system are then
+    in normal form, and become the new rules. The strategy is only used to
+    order pairs of the same degree, and sugar is not used."""
+
+    def run(self) -> RewritingSystem:
+        """Run the completion and return the reduced confluent system."""
+        self._insertPending()
+        while self._pairs:
+            degree = min(len(pair.word) for _, _, pair in self._pairs)
+            batch = []
+            pending = []
+            for entry in self._pairs:
+                (batch if len(entry[2].word) == degree else pending).append(entry)
+            self._pairs = pending
+            heapq.heapify(self._pairs)
+
+            pairs = []
+            for _, _, pair in sorted(batch, key=lambda entry: entry[:2]):
+                if pair.rule1 not in self._sugar or pair.rule2 not in self._sugar:
+                    continue
+                if self.criteria and self._hasInteriorDivisor(pair.word):
+                    self.statistics["chain"] += 1
+                    continue
+                self.statistics["reduced"] += 1
+                pairs.append(pair)
+            self._reduceBatch(pairs, degree)
+            self._insertPending()
+        return self._reduced()
+
+    def _reduceBatch(self, pairs: list[_CriticalPair], degree: int) -> None:
+        """Schedule for insertion the rows of the echelon form of the
+        S-polynomials of pairs and their reducers which are irreducible with
+        respect to the system."""
+        rows = [pair.sPolynomial() for pair in pairs]
+        rows = [row for row in rows if row.terms]
+        if not rows:
+            return
+
+        one = next(iter(rows[0].terms.values()))._getFieldOne()
+        reducers = self._symbolicPreprocessing(rows, one)
+        reduced = linear_reduction.linearSelfReduce(reducers + rows)
+
+        added = 0
+        for row in reduced:
+            if self.system._findDivisor(row.LM()) is None:
+                self._toInsert.append((_ruleFromPolynomial(row), degree))
+                added += 1
+        self.statistics["zero"] += max(len(rows) - added, 0)
+
+    def _symbolicPreprocessing(
+        self, rows: list[poly.Polynomial], one: field.FieldScalar
+    ) -> list[poly.Polynomial]:
+        """Return a reducer a * (m - p) * b, with a m b = path, for every
+        reducible path appearing in rows or in the reducers themselves."""
+        reducers = []
+        seen = set()
+        paths = [path for row in rows for path in row.terms]
+        while paths:
+            path = paths.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            match = self.system._findDivisor(path)
+            if match is None:
+                continue
+            rule, start = match
+            end = start + len(rule.leading_term)
+            tail = _splice(path, start, end, rule.polynomial)
+            reducer = poly.Polynomial([(path, one)]) - tail
+            reducers.append(reducer)
+            paths.extend(tail.terms)
+        return reducers
+
+
+class ParallelCompletion(BatchedCompletion):
+    """Completion processing critical pairs degree by degree, as
+    BatchedCompletion, with the S-polynomials of each degree reduced by a pool
+    of worker processes.
+
+    All S-polynomials of a degree are rewritten to normal form with respect to
+    the same system, so they can be reduced independently: pairs are sent to
+    the workers in chunks of chunkSize pairs (by default, one chunk per
+    worker). Each worker keeps a copy of the system. The version of the copy
+    held by each worker is tracked, and a chunk only carries the rules added
+    and removed since then, instead of the whole system. The normal forms are
+    then merged by a linear self-reduction and become new rules, so the
+    result does not depend on the number of workers or the chunk size. With
+    at most one worker, normal forms are computed in this process."""
+
+    def __init__(
+        self,
+        system: RewritingSystem,
+        strategy: PairSelectionStrategy = NormalStrategy(),
+        criteria: bool = True,
+        workers: int | None = None,
+        chunkSize: int | None = None,
+    ) -> None:
+        super().__init__(system, strategy, criteria)
+        assert chunkSize is None or chunkSize > 0, ValueError(
+            "Chunk size must be positive."
+        )
+        self.workers = workers
+        self.chunkSize = chunkSize
+        # One single-process pool per worker, so that chunks can be sent to a
+        # worker whose version is known.
+        self._executors: list[ProcessPoolExecutor] = []
+        # Rules added and removed, as pairs (id, encoded rule or None for a
+        # removal), and the version (number of changes applied) of each worker
+        # once it has processed the chunks submitted to it.
+        self._changes: list[Tuple[int, Any]] = []
+        self._ids: dict[RewritingRule, int] = {}
+        self._versions: list[int] = []
+        self._next = 0
+
+    def run(self) -> RewritingSystem:
+        """Run the completion and return the reduced confluent system."""
+        if self.workers is None or self.workers < 2 or not self._toInsert:
+            return super().run()
+        q = self._toInsert[0][0].leading_term.quiver
+        with ExitStack() as stack:
+            self._executors = [
+                stack.enter_context(
+                    ProcessPoolExecutor(
+                        max_workers=1, initializer=_initResident, initargs=(q,)
+                    )
+                )
+                for _ in range(self.workers)
+            ]
+            self._versions = [0] * self.workers
+            try:
+                return super().run()
+            finally:
+                self._executors = []
+
+    def _reduceBatch(self, pairs: list[_CriticalPair], degree: int) -> None:
+        """Schedule for insertion the rows of the echelon form of the normal
+        forms of the S-polynomials of pairs."""
+        if not self._executors:
+            remainders = [self.system.normalForm(pair.sPolynomial()) for pair in pairs]
+        else:
+            remainders = self._parallelNormalForms(pairs)
+        rows = linear_reduction.linearSelfReduce(remainders)
+        for row in rows:
+            self._toInsert.append((_ruleFromPolynomial(row), degree))
+        self.statistics["zero"] += len(pairs) - len(rows)
+
+    def _parallelNormalForms(self, pairs: list[_CriticalPair]) -> list[poly.Polynomial]:
+        if not pairs:
+            return []
+        self._synchronize()
+        ids = self._ids
+        encoded = [(ids[pair.rule1], ids[pair.rule2], pair.position) for pair in pairs]
+        size = self.chunkSize or max(1, -(-len(encoded) // self.workers))
+        futures = []
+        for i in range(0, len(encoded), size):
+            # Chunks go to the workers in turn, across batches.
+            worker = self._next
+            self._next = (worker + 1) % self.workers
+            base = self._versions[worker]
+            futures.append(
+                self._executors[worker].submit(
+                    _reduceChunk, base, self._changes[base:], encoded[i : i + size]
+                )
+            )
+            self._versions[worker] = len(self._changes)
+
+        q = pairs[0].word.quiver
+        return [
+            _decodePolynomial(q, terms)
+            for future in futures
+            for terms in future.result()
+        ]
+
+    def _synchronize(self) -> None:
+        """Record the changes of the rules of the system since the last batch."""
+        current = set(self.system.rules)
+        for rule in [rule for rule in self._ids if rule not in current]:
+            self._changes.append((self._ids.pop(rule), None))
+        for rule in self.system.rules:
+            if rule not in self._ids:
+                self._ids[rule] = len(self._changes)
+                self._changes.append((self._ids[rule], _encodeRule(rule)))
+
+
+class _ResidentSystem:
+    """Copy of a rewriting system in a worker process, updated by the rules
+    added and removed since its version."""
+
+    def __init__(self, q: quiver.Quiver) -> None:
+        self.quiver = q
+        self.version = 0
+        self.rules: dict[int, RewritingRule] = {}
+        self.system = RewritingSystem([])
+
+    def update(self, base: int, changes: list[Tuple[int, Any]]) -> None:
+        """Apply the changes from version base on that are not applied yet."""
+        assert base <= self.version, ValueError("Missing changes.")
+        for i, encoded in changes[self.version - base :]:
+            if encoded is None:
+                self.system.removeRule(self.rules.pop(i))
+            else:
+                rule = _decodeRule(self.quiver, encoded)
+                self.rules[i] = rule
+                self.system.addRule(rule)
+        self.version = max(self.version, base + len(changes))
+
+
+_resident: _ResidentSystem | None = None
+
+
+def _initResident(q: quiver.Quiver, changes: list[Tuple[int, Any]] = ()) -> None:
+    global _resident
+    _resident = _ResidentSystem(q)
+    _resident.update(0, list(changes))
+
+
+def _reduceChunk(
+    base: int, changes: list[Tuple[int, Any]], pairs: list[Tuple[int, int, int]]
+) -> list[list]:
+    """Update the resident system with the changes from version base on, and
+    return the encoded normal forms of the S-polynomials of the pairs (id1, id2,
+    position)."""
+    _resident.update(base, changes)
+    rules, system = _resident.rules, _resident.system
+    results = []
+    for i, j, position in pairs:
+        pair = _CriticalPair(rules[i], rules[j], position)
+        results.append(_encodePolynomial(system.normalForm(pair.sPolynomial())))
+    return results
+
+
+def _normalFormChunk(polynomials: list[list]) -> list[list]:
+    """Return the encoded normal forms of encoded polynomials with respect to
+    the resident system."""
+    q, system = _resident.quiver, _resident.system
+    return [
+        _encodePolynomial(normal_form)
+        for normal_form in system.normalForms(
+            _decodePolynomial(q, terms) for terms in polynomials
+        )
+    ]
+
+
+def _encodePolynomial(polynomial: poly.Polynomial) -> list:
+    """Return the terms of a polynomial as triples (source, monomial, target)
+    with coefficients, which are pickled without the quiver."""
+    return [
+        ((path.source, path.monomial, path.target), c)
+        for path, c in polynomial.terms.items()
+    ]
+
+
+def _decodePolynomial(q: quiver.Quiver, terms: list) -> poly.Polynomial:
+    return poly.Polynomial._fromTerms({q._path(*path): c for path, c in terms})
+
+
+def _encodeRule(rule: RewritingRule) -> Tuple[Any, list]:
+    term = rule.leading_term
+    return (term.source, term.monomial, term.target), _encodePolynomial(rule.polynomial)
+
+
+def _decodeRule(q: quiver.Quiver, encoded: Tuple[Any, list]) -> RewritingRule:
+    leading_term, terms = encoded
+    return RewritingRule(q._path(*leading_term), _decodePolynomial(q, terms))
+
+
+class GradedCompletion(Completion):
+    """Completion truncated in degree, for ideals whose Gröbner basis may be
+    infinite.
+
+    Pending rules and critical pairs are processed by increasing length of
+    their leading monomial or word: degrees() completes degree after degree,
+    and never reduces a pair or inserts a rule above the current degree. The
+    strategy only orders pairs of the same length. For homogeneous rules, the
+    rules of the partial system of degree D are the rules with leading
+    monomial of length at most D of the reduced confluent system."""
+
+    def __init__(
+        self,
+        system: RewritingSystem,
+        strategy: PairSelectionStrategy = NormalStrategy(),
+        criteria: bool = True,
+    ) -> None:
+        super().__init__(system, strategy, criteria)
+        self.degree = -1  # Last degree completed.
+        self._deferred: list[Tuple[RewritingRule, int]] = []
+
+    def degrees(self, maxDegree: int | None = None) -> Iterator[RewritingSystem]:
+        """Complete the degrees after self.degree up to maxDegree, yielding the
+        partial reduced system after each degree. Without maxDegree, stop once
+        the system is confluent. Calling it again with a larger maxDegree
+        resumes the completion where it stopped."""
+        while maxDegree is None or self.degree < maxDegree:
+            if maxDegree is None and not (
+                self._toInsert or self._deferred or self._pairs
+            ):
+                return
+            self.degree += 1
+            # Rules that are still too long are deferred again by _insert.
+            self._toInsert += self._deferred
+            self._deferred = []
+            self._insertPending()
+            while self._pairs and len(self._pairs[0][2].word) <= self.degree:
+                self._processPair(heapq.heappop(self._pairs)[2])
+                self._insertPending()
+            yield self._reduced()
+
+    def run(self) -> RewritingSystem:
+        """Run the completion and return the reduced confluent system."""
+        for _ in self.degrees():
+            pass
+        return self._reduced()
+
+    def _insert(self, rule: RewritingRule, sugar: int) -> None:
+        if len(rule.leading_term) > self.degree:
+            self._deferred.append((rule, sugar))
+        else:
+            super()._insert(rule, sugar)
+
+    def _pairKey(self, pair: _CriticalPair) -> Any:
+        return (len(pair.word), self.strategy._pairKey(pair))
+
+
+# A signature (a, i, b) stands for the module monomial a * e_i * b of the free
+# bimodule with one basis element e_i per input rule, a and b being monomials.
+Signature = Tuple[Tuple[int, ...], int, Tuple[int, ...]]
+
+
+class SignatureCompletion:
+    """Signature-based completion of a rewriting system, in the manner of the
+    GVW and F5 algorithms adapted to two-sided ideals of path algebras.
+
+    Each rule g comes with the signature s(g) = a * e_i * b of a representation
+    of its polynomial as a combination of the input rules. Signatures are
+    compared by degree (len(a) + len(b) plus the degree of the i-th input
+    rule), then by i, then lexicographically by a + b, and then by len(a).
+    Critical pairs u * g * v - u' * g' * v' whose multiples have distinct
+    signatures are processed by increasing signature, the larger one. Their
+    S-polynomials are only rewritten by multiples of rules of smaller
+    signature (regular reductions), and are discarded if their leading
+    monomial is then divisible by a multiple of the same signature.
+
+    Unless criteria is False, pairs are discarded before any reduction if their
+    signature is divisible by the signature of a syzygy: of a reduction to
+    zero, of a pair of rules with zero right hand side (monomial), or of a
+    Koszul syzygy LM(f) * w * g - f * w * LM(g) of two rules. So are the pairs
+    with top multiple u * g * v such that a rule added after g has a signature
+    dividing u s(g) v (rewrite criterion), and the pairs discarded by the chain
+    criterion of Completion. A rule whose leading monomial is divisible by the
+    one of another rule only forms inclusions with the rules of minimal leading
+    monomials, and overlaps are only reduced between the latter (superseded).
+    The number of pairs discarded by each criterion is counted in
+    self.statistics, along with the pairs created, the inclusions and the
+    overlaps reduced, and the reductions of overlaps to zero.
+
+    The signature basis may be infinite even if the reduced confluent system is
+    finite. After each degree of signatures in which no new leading monomial
+    is found, the completion stops if the input rules and the rules found
+    rewrite to zero with respect to the reduced system of the latter, and if
+    the critical pairs of that system rewrite to zero, except those already
+    reduced to zero or to a rule and those discarded by the monomial and chain
+    criteria of Completion. The S-polynomials reduced by this test are counted
+    in self.statistics as pairs reduced, and the number of tests as checks. If
+    the pairs run out first and the test fails, the rules found are completed
+    by Completion. The result is the reduced confluent system, as for
+    Completion."""
+
+    def __init__(self, system: RewritingSystem, criteria: bool = True) -> None:
+        self.criteria = criteria
+        self.statistics = {
+            "pairs": 0,
+            "monomial": 0,
+            "singular": 0,
+            "syzygy": 0,
+            "rewritten": 0,
+            "superseded": 0,
+            "inclusions": 0,
+            "chain": 0,
+            "reduced": 0,
+            "zero": 0,
+            "checks": 0,
+        }
+        self._inputs = system.rules[:]
+        self._degrees = [_sugarOf(rule) for rule in self._inputs]
+        self._index = DivisorIndex()
+        self._signatures: dict[RewritingRule, Signature] = {}
+        # Rules and syzygy signatures by input rule, in order of addition.
+        self._rules: list[list[RewritingRule]] = [[] for _ in self._inputs]
+        self._syzygies: list[list[Signature]] = [[] for _ in self._inputs]
+        # Rules whose leading monomial is not divisible by another one, and the
+        # pairs (leading monomials, position) reduced to zero or to a rule.
+        self._minimal: set[RewritingRule] = set()
+        self._resolved: set[Tuple[quiver._Path, quiver._Path, int]] = set()
+        # Entries (key, counter, signature, top multiple, critical pair).
+        self._pairs: list[Tuple[Any, int, Signature, Any, Any]] = []
+        self._counter = 0
+
+    def run(self) -> RewritingSystem:
+        """Run the completion and return the reduced confluent system."""
+        for i, rule in enumerate(self._inputs):
+            self._push(((), i, ()), (rule, (), ()), None)
+
+        degree, grown = -1, False
+        while self._pairs:
+            key, _, signature, top, pair = heapq.heappop(self._pairs)
+            if key[0] > degree:
+                if not grown and degree >= max(self._degrees) and self._isComplete():
+                    return self._reduced()
+                degree, grown = key[0], False
+            if pair is not None and not (
+                pair.rule2 in self._minimal
+                and (
+                    pair.rule1 in self._minimal or pair.word is pair.rule1.leading_term
+                )
+            ):
+                self.statistics["superseded"] += 1
+                continue
+            if (
+                self.criteria
+                and pair is not None
+                and _hasInteriorDivisor(self._index, pair.word)
+            ):
+                self.statistics["chain"] += 1
+                continue
+            if self.criteria and self._isRedundant(signature, top):
+                continue
+
+            if pair is None:
+                rule = self._reduceInput(top[0], signature)
+            else:
+                rule = self._reduce(pair.sPolynomial(), signature, pair)
+            if rule is not None:
+                grown |= self._index.leftmostMatch(rule.leading_term) is None
+                self._addRule(rule, signature)
+        if self._isComplete():
+            return self._reduced()
+        return self._completeRemaining()
+
+    def _key(self, signature: Signature) -> Any:
+        left, i, right = signature
+        return (len(left) + len(right) + self._degrees[i], i, left + right, len(left))
+
+    def _push(self, signature: Signature, top: Any, pair: _CriticalPair | None) -> None:
+        self._counter += 1
+        entry = (self._key(signature), self._counter, signature, top, pair)
+        heapq.heappush(self._pairs, entry)
+
+    def _multiple(
+        self, rule: RewritingRule, left: Tuple[int, ...], right: Tuple[int, ...]
+    ) -> Signature:
+        """Return the signature of left * rule * right."""
+        a, i, b = self._signatures[rule]
+        return (left + a, i, b + right)
+
+    def _divisors(self, path: quiver._Path) -> Iterator[Tuple[RewritingRule, int, Any]]:
+        """Yield the triples (rule, start, key) for the occurrences of leading
+        monomials in path, key being the one of the signature of the multiple
+        of rule with leading monomial path."""
+        for start, rule in self._index.occurrences(path):
+            end = start + len(rule.leading_term)
+            multiple = self._multiple(rule, path.monomial[:start], path.monomial[end:])
+            yield rule, start, self._key(multiple)
+
+    def _regularDivisor(
+        self, path: quiver._Path, bound: Any
+    ) -> Tuple[RewritingRule, int] | None:
+        for rule, start, key in self._divisors(path):
+            if key < bound:
+                return rule, start
+        return None
+
+    def _reduce(
+        self,
+        polynomial: poly.Polynomial,
+        signature: Signature,
+        pair: _CriticalPair | None = None,
+    ) -> RewritingRule | None:
+        """Return the rule of the regular reduction of a polynomial of the given
+        signature, or None if it reduces to zero or is singularly reducible.
+        If polynomial is the S-polynomial of a pair, the reduction is counted in
+        self.statistics and, unless singular, the pair is recorded as resolved."""
+        overlap = pair is not None and pair.word is not pair.rule1.leading_term
+        if pair is not None:
+            self.statistics["reduced" if overlap else "inclusions"] += 1
+        bound = self._key(signature)
+        remainder = _rewrite(polynomial, lambda path: self._regularDivisor(path, bound))
+        if not remainder.terms:
+            self.statistics["zero"] += overlap
+            if pair is not None:
+                self._resolved.add(_pairKey(pair))
+            self._syzygies[signature[1]].append(signature)
+            return None
+        if any(key == bound for _, _, key in self._divisors(remainder.LM())):
+            self.statistics["singular"] += 1
+            return None
+        if pair is not None:
+            self._resolved.add(_pairKey(pair))
+        return _ruleFromPolynomial(remainder)
+
+    def _reduceInput(
+        self, rule: RewritingRule, signature: Signature
+    ) -> RewritingRule | None:
+        """Return the regular reduction of an input rule, of signature e_i."""
+        bound = self._key(signature)
+        match = self._regularDivisor(rule.leading_term, bound)
+        if match is not None:
+            divisor, start = match
+            pair = _CriticalPair(rule, divisor, start)
+            return self._reduce(pair.sPolynomial(), signature)
+        tail = _rewrite(rule.polynomial, lambda path: self._regularDivisor(path, bound))
+        return RewritingRule(rule.leading_term, tail)
+
+    def _addRule(self, rule: RewritingRule, signature: Signature) -> None:
+        minimal = self._index.leftmostMatch(rule.leading_term) is None
+        self._index.add(rule)
+        self._signatures[rule] = signature
+        self._rules[signature[1]].append(rule)
+        if not minimal:
+            # Only the inclusions of minimal leading monomials in the one of rule.
+            for other in self._minimal:
+                for position in inclusions(rule, other):
+                    self._pushPair(_CriticalPair(rule, other, position))
+            return
+        superseded = {other for other in self._minimal if inclusions(other, rule)}
+        self._minimal -= superseded
+        self._minimal.add(rule)
+        pairs = _criticalPairs(rule, rule)
+        for other in superseded:
+            pairs += [_CriticalPair(other, rule, i) for i in inclusions(other, rule)]
+        for other in self._minimal - {rule}:
+            pairs += _criticalPairs(rule, other) + _criticalPairs(other, rule)
+        for pair in pairs:
+            self._pushPair(pair)
+
+    def _pushPair(self, pair: _CriticalPair) -> None:
+        """Push a critical pair with the larger signature of its two multiples,
+        unless they have the same signature."""
+        self.statistics["pairs"] += 1
+        word = pair.word.monomial
+        length1, length2 = len(pair.rule1.leading_term), len(pair.rule2.leading_term)
+        first = (pair.rule1, (), word[length1:])
+        second = (pair.rule2, word[: pair.position], word[pair.position + length2 :])
+        signature1, signature2 = self._multiple(*first), self._multiple(*second)
+        if signature1 == signature2:
+            self.statistics["singular"] += 1
+            return
+        if self._key(signature1) < self._key(signature2):
+            signature1, first = signature2, second
+        if self.criteria and not (
+            pair.rule1.polynomial.terms or pair.rule2.polynomial.terms
+        ):
+            # The S-polynomial is zero: a syzygy of the larger signature.
+            self.statistics["monomial"] += 1
+            self._syzygies[signature1[1]].append(signature1)
+        else:
+            self._push(signature1, first, pair)
+
+    def _isRedundant(self, signature: Signature, top: Any) -> bool:
+        """Check the syzygy and rewrite criteria for a pair of the given
+        signature with top multiple (rule, left, right)."""
+        left, i, right = signature
+        if any(_divides(syzygy, signature) for syzygy in self._syzygies[i]):
+            self.statistics["syzygy"] += 1
+            return True
+
+        rule = top[0]
+        for other in reversed(self._rules[i]):
+            if _divides(self._signatures[other], signature):
+                if other is not rule:
+                    self.statistics["rewritten"] += 1
+                    return True
+                break
+
+        for g in self._rules[i]:
+            if not _divides(self._signatures[g], signature):
+                continue
+            a, _, b = self._signatures[g]
+            m = g.leading_term.monomial
+            u, v = left[: len(left) - len(a)], right[len(b) :]
+            # Koszul syzygies LM(f) * w * g - f * w * LM(g), with f on the left
+            # and on the right.
+            for f, start in self._occurrences(u):
+                w = u[start + len(f.leading_term) :]
+                f_w = f.leading_term.monomial + w
+                if self._key(self._multiple(g, f_w, ())) > self._key(
+                    self._multiple(f, (), w + m)
+                ):
+                    self.statistics["syzygy"] += 1
+                    return True
+            for f, start in self._occurrences(v):
+                w = v[:start]
+                w_f = w + f.leading_term.monomial
+                if self._key(self._multiple(g, (), w_f)) > self._key(
+                    self._multiple(f, m + w, ())
+                ):
+                    self.statistics["syzygy"] += 1
+                    return True
+        return False
+
+    def _occurrences(
+        self, monomial: Tuple[int, ...]
+    ) -> Iterator[Tuple[RewritingRule, int]]:
+        """Yield the pairs (rule, start) such that the leading monomial of rule
+        appears in a non-trivial monomial starting at position start."""
+        if monomial:
+            q = self._inputs[0].leading_term.quiver
+            path = q._path(q.source[monomial[0]], monomial, q.target[monomial[-1]])
+            for start, rule in self._index.occurrences(path):
+                yield rule, start
+
+    def _isComplete(self) -> bool:
+        """Check that the reduced system of the rules found so far is a Gröbner
+        basis of the ideal of the input rules.
+
+        The input rules and the rules found, which are in that ideal, must
+        rewrite to zero with respect to the reduced system. Then a pair reduced
+        by the completion has an S-polynomial u * g * v + ... + r, with
+        u * LM(g) * v smaller than the word of the pair and r zero or a rule,
+        which also holds with the rules of the reduced system instead, so only
+        the other pairs of the reduced system need to rewrite to zero. For
+        inhomogeneous inputs, pairs of larger signature may still lower the
+        degree of leading monomials, so this does not follow from the
+        signatures processed so far."""
+        self.statistics["checks"] += 1
+        system = self._reduced()
+        rules = self._inputs + [rule for rules in self._rules for rule in rules]
+        return all(_rewritesToZero(system, rule) for rule in rules) and (
+            self._isConfluent(system)
+        )
+
+    def _isConfluent(self, system: RewritingSystem) -> bool:
+        """RewritingSystem.isConfluent for the pairs that are not resolved,
+        skipping the pairs discarded by the monomial and chain criteria of
+        Completion unless criteria is False."""
+        for rule1 in system.rules:
+            for rule2 in system.rules:
+                trivial = not rule1.polynomial.terms and not rule2.polynomial.terms
+                if self.criteria and trivial:
+                    continue
+                for pair in _criticalPairs(rule1, rule2):
+                    if _pairKey(pair) in self._resolved:
+                        continue
+                    if self.criteria and _hasInteriorDivisor(system.index, pair.word):
+                        continue
+                    self.statistics["reduced"] += 1
+                    if system.normalForm(pair.sPolynomial()).terms:
+                        return False
+                    self.statistics["zero"] += 1
+        return True
+
+    def _completeRemaining(self) -> RewritingSystem:
+        """Complete the input and the rules found so far with Completion, and
+        add its statistics to the ones of self."""
+        rules = self._reduced().rules + self._inputs
+        completion = Completion(RewritingSystem(rules), criteria=self.criteria)
+        completed = completion.run()
+        for key in ["inclusions", "reduced", "zero"]:
+            self.statistics[key] += completion.statistics[key]
+        return completed
 
-    m1 = rule1.leading_term  # x1 x2 x3 ... xm
-    m2 = rule2.leading_term  # y1 y2 y3 ... yn
+    def _reduced(self) -> RewritingSystem:
+        """Return the reduced system of the rules with minimal leading monomials,
+        sorted by decreasing leading monomial."""
+        minimal = RewritingSystem([])
+        rules = [rule for rules in self._rules for rule in rules]
+        for rule in sorted(rules, key=lambda rule: len(rule.leading_term)):
+            if minimal._findDivisor(rule.leading_term) is None:
+                minimal.addRule(rule)
+        rules = sorted(minimal.rules, key=lambda rule: rule.leading_term)
+        return RewritingSystem(
+            [
+                RewritingRule(rule.leading_term, minimal.normalForm(rule.polynomial))
+                for rule in rules
+            ]
+        )
 
-    # TODO: Complete.
 
-    return True
+def _pairKey(pair: _CriticalPair) -> Tuple[quiver._Path, quiver._Path, int]:
+    return pair.rule1.leading_term, pair.rule2.leading_term, pair.position
 
 
-def sPolynomial(rule1: RewritingRule, rule2: RewritingRule) -> poly.Polynomial | None:
+def _rewritesToZero(system: RewritingSystem, rule: RewritingRule) -> bool:
+    """Check whether LM(rule) - rule.polynomial rewrites to zero with respect
+    to system."""
+    match = system._findDivisor(rule.leading_term)
+    if match is None:
+        return False
+    divisor, start = match
+    end = start + len(divisor.leading_term)
+    rewritten = _splice(rule.leading_term, start, end, divisor.polynomial)
+    return system.normalForm(rewritten) == system.normalForm(rule.polynomial)
 
-    return None
 
-    # TODO:
-    # Given a pair of rewriting rules, one can compute a maximalOverlap
-    # This maximalOverlap gives an sPolynomial.
+def _hasInteriorDivisor(index: DivisorIndex, word: quiver._Path) -> bool:
+    """Check whether the leading monomial of a rule of index appears in word,
+    neither as a prefix nor as a suffix."""
+    length = len(word)
+    return any(
+        0 < start and start + len(rule.leading_term) < length
+        for start, rule in index.occurrences(word)
+    )
 
-    # TODO:
-    # A rewriting system has to be linearly self reduced before initialization.
 
-    # TODO:
-    # A polynomial can be reduced fully with respect to a rewriting system.
+def _divides(divisor: Signature, signature: Signature) -> bool:
+    """Check whether signature = u * divisor * v for monomials u and v."""
+    a, i, b = divisor
+    left, j, right = signature
+    return (
+        i == j
+        and len(a) <= len(left)
+        and left[len(left) - len(a) :] == a
+        and right[: len(b)] == b
+    )
 
-    # TODO:
-    # A rewriting system is confluent if all of its sPolynomials for all maximal
-    # overlaps rewrite to zero.
 
-    # TODO:
-    # A rewriting system can be completed to a confluent one (for fin. dim. algebras)
-    # by adding all non-zero normal forms of sPolynomials as new rewriting rules.
+def _sugarOf(rule: RewritingRule) -> int:
+    """Return the maximal length of a path in a rule."""
+    return max([len(rule.leading_term)] + [len(path) for path in rule.polynomial.terms])
@@ -0,0 +1,60 @@
+import unittest
+import random
+import quiver
+import linear_reduction
+from polynomial import Polynomial
+from linalg.Fp import GF
+from array_polynomial import ArrayPolynomial, np
+
+TEST_QUIVER = quiver.Quiver(q0=[0], q1=[1, 2], s={1: 0, 2: 0}, t={1: 0, 2: 0})
+P = 101
+
+
+# Helper.
+def randomPolynomial(generator: random.Random, size: int) -> Polynomial:
+    F = GF(P).scalars
+    paths = TEST_QUIVER.arrowIdeal(4) + TEST_QUIVER.arrowIdeal(3)
+    return Polynomial(
+        [(path, F(generator.randrange(P))) for path in generator.sample(paths, size)]
+    )
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestArrayPolynomial(unittest.TestCase):
+    def setUp(self):
+        generator = random.Random(0)
+        self.ps = [randomPolynomial(generator, 8) for _ in range(6)]
+        self.arrays = [
+            ArrayPolynomial.fromPolynomial(p, TEST_QUIVER, P) for p in self.ps
+        ]
+
+    def test_conversion(self):
+        for p, a in zip(self.ps, self.arrays):
+            self.assertEqual(a.toPolynomial(), p)
+            self.assertEqual(a.support, p.support)
+            self.assertEqual(a.LT(), p.LT())
+            for path in p.support:
+                self.assertEqual(a.coefficient(path), p.coefficient(path))
+
+    def test_arithmetic(self):
+        F = GF(P).scalars
+        for p, a in zip(self.ps, self.arrays):
+            for q, b in zip(self.ps, self.arrays):
+                self.assertEqual((a + b).toPolynomial(), p + q)
+                self.assertEqual((a - b).toPolynomial(), p - q)
+                self.assertEqual(a._subMultiple(b, F(7)).toPolynomial(), p - q * F(7))
+                self.assertEqual(
+                    a._linearReduceWithRespectTo(b).toPolynomial(),
+                    p._linearReduceWithRespectTo(q),
+                )
+            self.assertEqual((a * F(5)).toPolynomial(), p * F(5))
+            self.assertEqual((-a).toPolynomial(), -p)
+            self.assertEqual(a._makeMonic().toPolynomial(), p._makeMonic())
+            self.assertEqual(len(a - a), 0)
+
+    def test_linear_self_reduction(self):
+        reduced = linear_reduction.linearSelfReduce(self.arrays)
+        self.assertEqual(
+            [a.toPolynomial() for a in reduced],
+            linear_reduction.linearSelfReduce(self.ps),
+        )
@@ -0,0 +1,82 @@
+import unittest
+import random
+import rewriting
+import quiver
+import polynomial
+from divisor_index import DivisorIndex
+
+TEST_QUIVER = quiver.Quiver(
+    q0=[0, 1],
+    q1=[3, 2, 1],
+    s={3: 1, 1: 0, 2: 1},
+    t={3: 1, 1: 1, 2: 0},
+)
+
+
+# Helper.
+def monomialRule(source: int, monomial: list[int], target: int):
+    """Rewriting rule sending a path to zero."""
+    path = TEST_QUIVER.createPath(source, monomial, target)
+    return rewriting.RewritingRule(path, polynomial.Polynomial([]))
+
+
+def naiveOccurrences(path, rules):
+    result = []
+    for rule in rules:
+        divisor = rule.leading_term.monomial
+        for i in range(len(path) - len(divisor) + 1):
+            if path.monomial[i : i + len(divisor)] == divisor:
+                result.append((i, rule))
+    return result
+
+
+class TestDivisorIndex(unittest.TestCase):
+    # Q is the following quiver.
+    #      0 <────z──────╮
+    #      ╰──────y────> 1 <─╮
+    #                    ╰─x─╯
+
+    def setUp(self):
+        self.xx = monomialRule(1, [3, 3], 1)
+        self.xxz = monomialRule(1, [3, 3, 2], 0)
+        self.zy = monomialRule(1, [2, 1], 1)
+        self.xzyx = monomialRule(1, [3, 2, 1, 3], 1)
+
+    def test_occurrences(self):
+        index = DivisorIndex([self.xx, self.xxz, self.zy, self.xzyx])
+        path = TEST_QUIVER.createPath(1, [3, 3, 3, 2, 1, 3, 3, 2], 0)
+        self.assertEqual(
+            sorted(index.occurrences(path), key=lambda o: (o[0], id(o[1]))),
+            sorted(
+                naiveOccurrences(path, [self.xx, self.xxz, self.zy, self.xzyx]),
+                key=lambda o: (o[0], id(o[1])),
+            ),
+        )
+
+    def test_leftmost_and_priority_match(self):
+        index = DivisorIndex([self.zy, self.xxz])
+        path = TEST_QUIVER.createPath(1, [3, 3, 2, 1, 3], 1)
+        self.assertEqual(index.leftmostMatch(path), (self.xxz, 0))
+        self.assertEqual(index.priorityMatch(path), (self.zy, 2))
+        self.assertIsNone(index.leftmostMatch(TEST_QUIVER.createPath(1, [3], 1)))
+
+    def test_incremental_updates(self):
+        rules = [self.xx, self.xxz, self.zy, self.xzyx]
+        paths = TEST_QUIVER.arrowIdeal(6, top=True)
+        generator = random.Random(0)
+
+        index = DivisorIndex()
+        active = []
+        for _ in range(20):
+            rule = generator.choice(rules)
+            if rule in active:
+                index.remove(rule)
+                active.remove(rule)
+            else:
+                index.add(rule)
+                active.append(rule)
+
+            for path in paths:
+                found = {(i, id(rule)) for i, rule in index.occurrences(path)}
+                expected = {(i, id(rule)) for i, rule in naiveOccurrences(path, active)}
+                self.assertEqual(found, expected)
@@ -0,0 +1,98 @@
+import unittest
+import pickle
+import quiver
+import rewriting
+import linear_reduction
+from polynomial import Polynomial
+from linalg.Fp import GF, isPrime
+from linalg.Q import Rational
+
+TEST_QUIVER = quiver.Quiver(q0=[0], q1=[1, 2], s={1: 0, 2: 0}, t={1: 0, 2: 0})
+
+
+class TestPrimeField(unittest.TestCase):
+    def test_arithmetic(self):
+        F = GF(7)
+        a, b = F.scalars(3), F.scalars(5)
+        self.assertEqual(a + b, F.scalars(1))
+        self.assertEqual(a - b, F.scalars(5))
+        self.assertEqual(a * b, F.scalars(1))
+        self.assertEqual(-a, F.scalars(4))
+        self.assertEqual(~a, b)
+        self.assertEqual(a / b, F.scalars(2))
+        self.assertEqual(a**6, F.getOne())
+        self.assertEqual(sum([a, b, a]), F.scalars(4))
+        self.assertEqual(F.scalars(-1), F.scalars(6))
+        self.assertIsInstance(a + b, F.scalars)
+        self.assertFalse(F.getZero())
+        self.assertEqual(str(a), "3")
+
+    def test_inverses(self):
+        for p in [2, 3, 101, 65521, 2147483647]:
+            F = GF(p)
+            for value in {1, p // 2 or 1, p - 1}:
+                x = F.scalars(value)
+                self.assertEqual(x * ~x, F.getOne())
+
+    def test_characteristic(self):
+        self.assertTrue(isPrime(2147483647))
+        self.assertFalse(isPrime(2147483649))
+        self.assertEqual(GF(5), GF(5))
+        self.assertIs(GF(5).scalars, GF(5).scalars)
+        self.assertNotEqual(GF(5), GF(7))
+        with self.assertRaises(AssertionError):
+            GF(6)
+        with self.assertRaises(AssertionError):
+            GF(2**31 + 11)
+        with self.assertRaises(AssertionError):
+            ~GF(5).getZero()
+
+    def test_pickle(self):
+        for p in [13, 1000003]:
+            x = GF(p).scalars(10)
+            y = pickle.loads(pickle.dumps(x))
+            self.assertEqual(y, x)
+            self.assertIs(type(y), GF(p).scalars)
+
+    def test_polynomials(self):
+        F = GF(5).scalars
+        x = TEST_QUIVER.createPath(0, [1], 0)
+        y = TEST_QUIVER.createPath(0, [2], 0)
+        p = Polynomial([(x, F(2)), (y, F(1))])
+        q = Polynomial([(x, F(3)), (y, F(4))])
+        self.assertEqual((p + q).support, [])
+        self.assertEqual(
+            linear_reduction.linearSelfReduce([p, p * F(3) + Polynomial([(x, F(1))])]),
+            [Polynomial([(y, F(1))]), Polynomial([(x, F(1))])],
+        )
+
+    def test_completion(self):
+        # In k<x, y> with x > y: x^2 -> xy - yx, y^3 -> 2 yx, over QQ and GF(101).
+        def rules(scalar):
+            def P(*terms):
+                return Polynomial(
+                    [
+                        (TEST_QUIVER.createPath(0, list(m), 0), scalar(c))
+                        for m, c in terms
+                    ]
+                )
+
+            return rewriting.RewritingSystem(
+                [
+                    rewriting.RewritingRule(
+                        TEST_QUIVER.createPath(0, [2, 2], 0),
+                        P(([2, 1], 1), ([1, 2], -1)),
+                    ),
+                    rewriting.RewritingRule(
+                        TEST_QUIVER.createPath(0, [1, 1, 1], 0), P(([2, 1], 2))
+                    ),
+                ]
+            )
+
+        overQ = rules(Rational).complete()
+        overF = rules(GF(101).scalars).complete()
+        self.assertTrue(overF.isConfluent())
+        self.assertEqual(
+            [rule.leading_term for rule in overF.rules],
+            [rule.leading_term for rule in overQ.rules],
+        )
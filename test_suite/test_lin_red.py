@@ -1,4 +1,5 @@
 import unittest
+import random
 import quiver
 from polynomial import Polynomial
 from linalg.Q import Rational
@@ -50,3 +51,38 @@ class TestLinearReduction(unittest.TestCase):
         new3 = X(3) + X(2) * Rational(1, 13) + X(1) * Rational(6, 13)
 
         self.assertEqual(ys, [new1, new2, new3])
+
+    def test_echelon_form_is_incremental(self):
+        generator = random.Random(0)
+        xs = [
+            sum(
+                [X(n) * Rational(generator.randint(-3, 3)) for n in range(1, 9)],
+                X(generator.randint(1, 8)),
+            )
+            for _ in range(6)
+        ]
+        expected = linear_reduction.linearSelfReduce(xs)
+        self.assertTrue(linear_reduction.isLinearlySelfReduced(expected))
+        self.assertFalse(linear_reduction.isLinearlySelfReduced(xs))
+
+        for _ in range(5):
+            generator.shuffle(xs)
+            echelon = linear_reduction.EchelonForm()
+            added = [echelon.add(x) for x in xs]
+            self.assertEqual(echelon.rows(), expected)
+            rows = [row for row in added if row is not None]
+            self.assertEqual(len(rows), len(echelon))
+            for x in xs:
+                self.assertEqual(echelon.reduce(x).support, [])
+
+    def test_echelon_form_maximal_leading_term(self):
+        # Two polynomials have the maximal leading term x^5, but only one row
+        # keeps it: the other one is reduced below it.
+        poly1 = X(4) + X(2)
+        poly2 = X(5) * Rational(1, 7) + X(3)
+        poly3 = X(5) - X(4)
+        echelon = linear_reduction.EchelonForm([poly1, poly2, poly3])
+        self.assertEqual(
+            echelon.rows(),
+            [X(5) + X(2), X(4) + X(2), X(3) + X(2) * Rational(-1, 7)],
+        )
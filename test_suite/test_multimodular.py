@@ -0,0 +1,60 @@
+import unittest
+import quiver
+import rewriting
+import linear_reduction
+import multimodular
+from polynomial import Polynomial
+from linalg.Q import Rational
+
+TEST_QUIVER = quiver.Quiver(q0=[0], q1=[1, 2], s={1: 0, 2: 0}, t={1: 0, 2: 0})
+
+
+# Helper.
+def P(*terms):
+    return Polynomial(
+        [(TEST_QUIVER.createPath(0, list(m), 0), Rational(*c)) for m, c in terms]
+    )
+
+
+class TestMultimodular(unittest.TestCase):
+    # Path algebra is k<x, y>, with x = α₁ and y = α₂.
+
+    def test_rational_reconstruction(self):
+        m = 2147483647 * 2147483629
+        for c in [Rational(3, 7), Rational(-22, 9), Rational(0), Rational(123456)]:
+            residue = c.numerator * pow(c.denominator, -1, m) % m
+            self.assertEqual(multimodular.rationalReconstruction(residue, m), c)
+        self.assertIsNone(multimodular.rationalReconstruction(m // 3, 101))
+
+    def test_completion(self):
+        # y^2 -> 3/7 yx - 5 xy, x^3 -> 2/9 yx + 1/4 x.
+        system = rewriting.RewritingSystem(
+            [
+                rewriting.RewritingRule(
+                    TEST_QUIVER.createPath(0, [2, 2], 0),
+                    P(([2, 1], (3, 7)), ([1, 2], (-5,))),
+                ),
+                rewriting.RewritingRule(
+                    TEST_QUIVER.createPath(0, [1, 1, 1], 0),
+                    P(([2, 1], (2, 9)), ([1], (1, 4))),
+                ),
+            ]
+        )
+        completed = multimodular.completeMultimodular(system)
+        self.assertEqual(str(completed), str(system.complete()))
+        self.assertEqual(
+            str(multimodular.completeMultimodular(system, batched=True)),
+            str(completed),
+        )
+
+    def test_linear_self_reduction(self):
+        ps = [
+            P(([1, 1, 2], (1, 3)), ([2], (2,)), ([1], (5, 7))),
+            P(([1, 1, 2], (1,)), ([2, 1], (2, 3))),
+            P(([2, 1], (1, 11)), ([1], (1,)), ([2], (3,))),
+            P(([2, 1], (2, 11)), ([1], (2,)), ([2], (6,))),
+        ]
+        self.assertEqual(
+            multimodular.linearSelfReduceMultimodular(ps),
+            linear_reduction.linearSelfReduce(ps),
+        )
@@ -0,0 +1,41 @@
+import unittest
+import quiver
+from path_array import PathArray, np
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestPathArray(unittest.TestCase):
+    # Q is the following quiver.
+    #      0 <────2──────╮
+    #      ╰──────1────> 1 <─╮
+    #                    ╰─0─╯
+
+    def setUp(self):
+        self.quiver = quiver.Quiver(
+            q0=[0, 1],
+            q1=[0, 1, 2],
+            s={0: 1, 1: 0, 2: 1},
+            t={0: 1, 1: 1, 2: 0},
+        )
+
+    def test_paths_of_length(self):
+        for length in range(7):
+            paths = self.quiver.pathArray(length)
+            self.assertEqual(paths.length, length)
+            self.assertEqual(
+                sorted(paths, key=self.quiver.order.key),
+                sorted(
+                    self.quiver.arrowIdeal(length, top=True),
+                    key=self.quiver.order.key,
+                ),
+            )
+
+    def test_lazy_rows(self):
+        paths = self.quiver.pathArray(3, vertices=[0])
+        self.assertEqual(len(paths), len(self.quiver.allPathsOutOf(0, 3)) - 3)
+        self.assertEqual(paths[0], self.quiver.createPath(0, [1, 0, 0], 1))
+        self.assertEqual(paths[-1], self.quiver.createPath(0, [1, 2, 1], 1))
+        self.assertIsInstance(paths[1:], PathArray)
+        self.assertEqual(list(paths[1:]), list(paths)[1:])
+        self.assertEqual(paths.monomials().tolist()[0], [1, 0, 0])
+        self.assertEqual(paths.arrows.dtype, np.int32)
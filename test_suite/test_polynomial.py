@@ -57,6 +57,60 @@ class TestPolynomials(unittest.TestCase):
         for e in idempotents:
             self.assertEqual(e, e * e)
 
+    def test_coefficient_lookup(self):
+        path1 = quiver._Path(0, [1, 2, 1, 2], 0, self.quiver)
+        path2 = quiver._Path(0, [1, 2], 0, self.quiver)
+        poly1 = polynomial.Polynomial([(path1, Rational(1, 7))])
+        poly2 = polynomial.Polynomial([(path2, Rational(2)), (path1, Rational(-1, 7))])
+        poly3 = poly1 + poly2
+        self.assertEqual(poly3.coefficient(path2), Rational(2))
+        self.assertIsNone(poly3.coefficient(path1))
+        self.assertEqual(poly3.support, [path2])
+        self.assertEqual(poly1.support, [path1])  # Operands are left untouched.
+
+    def test_subtraction(self):
+        p1 = self.quiver.createPath(0, [1, 2, 1, 2], 0)
+        p2 = self.quiver.createPath(0, [1, 2], 0)
+        poly1 = polynomial.Polynomial([(p1, Rational(1)), (p2, Rational(1))])
+        poly2 = polynomial.Polynomial([(p2, Rational(3))])
+        self.assertEqual(
+            poly2 - poly1,
+            polynomial.Polynomial([(p1, Rational(-1)), (p2, Rational(2))]),
+        )
+        self.assertEqual((poly1 - poly1).support, [])
+
+    def test_in_place_subtraction(self):
+        p1 = self.quiver.createPath(0, [1, 2, 1, 2], 0)
+        p2 = self.quiver.createPath(0, [1, 2], 0)
+        p3 = self.quiver.createPath(1, [3, 3], 1)
+        poly1 = polynomial.Polynomial([(p1, Rational(1)), (p2, Rational(1))])
+        poly2 = polynomial.Polynomial([(p2, Rational(1, 2)), (p3, Rational(1))])
+        self.assertEqual(poly1.LM(), p1)
+
+        copy = poly1._copy()
+        result = copy._isubMultiple(poly2, Rational(2))
+        expected = polynomial.Polynomial([(p1, Rational(1)), (p3, Rational(-2))])
+        self.assertIs(result, copy)
+        self.assertEqual(copy, expected)
+        self.assertEqual(hash(copy), hash(expected))
+        self.assertEqual(copy.support, expected.support)
+        self.assertEqual(poly1.support, [p1, p2])
+
+    def test_equal_polynomials_hash_equal(self):
+        p1 = self.quiver.createPath(0, [1, 2, 1, 2], 0)
+        p2 = self.quiver.createPath(0, [1, 2], 0)
+        p3 = self.quiver.createPath(1, [3, 3], 1)
+        poly1 = polynomial.Polynomial([(p1, Rational(1)), (p2, Rational(2))])
+        poly2 = polynomial.Polynomial([(p2, Rational(2)), (p1, Rational(1))])
+        poly3 = polynomial.Polynomial([(p3, Rational(1))])
+        poly4 = (poly1 + poly3) - poly3
+
+        self.assertEqual(poly1, poly2)
+        self.assertEqual(poly1, poly4)
+        self.assertEqual(hash(poly1), hash(poly4))
+        self.assertEqual(len({poly1, poly2, poly3, poly4}), 2)
+        self.assertNotEqual(poly1, poly1 + poly3)
+
     def test_leading_coefficient(self):
         p1 = self.quiver.createPath(0, [1, 2, 1, 2], 0)
         p2 = self.quiver.createPath(0, [1, 2], 0)
@@ -67,21 +121,3 @@ class TestPolynomials(unittest.TestCase):
         q2 = self.quiver.createPath(0, [1, 3, 3, 2], 0)
         poly2 = polynomial.Polynomial([(q1, Rational(1, 7)), (q2, Rational(-1, 23))])
         self.assertEqual(poly2.LC(), Rational(-1, 23))
-
-    def test_filter_max_LT(self):
-        p1 = self.quiver.createPath(0, [1, 2, 1, 2], 0)
-        p2 = self.quiver.createPath(0, [1, 2], 0)
-        poly1 = polynomial.Polynomial([(p1, Rational(1)), (p2, Rational(1))])
-
-        q1 = self.quiver.createPath(0, [1, 2, 1, 2], 0)
-        q2 = self.quiver.createPath(0, [1, 3, 3, 2], 0)
-        poly2 = polynomial.Polynomial([(q1, Rational(1, 7)), (q2, Rational(1))])
-
-        r1 = self.quiver.createPath(0, [1, 2], 0)
-        r2 = self.quiver.createPath(0, [1, 3, 3, 2], 0)
-        poly3 = polynomial.Polynomial([(r1, Rational(1)), (r2, Rational(-1))])
-
-        ps = [poly1, poly2, poly3]
-        max, oth = polynomial._filterPolynomialsMaximumLT(ps)
-
-        self.assertEqual((max, oth), ([poly2, poly3], [poly1]))
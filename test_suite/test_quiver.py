@@ -1,5 +1,7 @@
 import unittest
+import pickle
 import quiver
+import hilbert
 import specialquivers
 
 
@@ -50,9 +52,208 @@ class TestPathClass(unittest.TestCase):
         find = self.quiver.createPath(1, [0, 0], 1)
         self.assertEqual(find_in._find(find), 2)
 
+    def test_paths_are_hashable(self):
+        paths = {self.xzyz, self.quiver.createPath(1, [0, 2, 1, 2], 0), self.x}
+        self.assertEqual(len(paths), 2)
+        self.assertIsInstance(self.xzyz.monomial, tuple)
+        self.assertFalse(hasattr(self.xzyz, "__dict__"))
+
+    def test_interned_paths(self):
+        Q = quiver.Quiver(
+            q0=[0, 1],
+            q1=[0, 1, 2],
+            s={0: 1, 1: 0, 2: 1},
+            t={0: 1, 1: 1, 2: 0},
+            internPaths=True,
+        )
+        x = Q.createPath(1, [0], 1)
+        z = Q.createPath(1, [2], 0)
+        self.assertIs(x + z, Q.createPath(1, [0, 2], 0))
+        self.assertIs(Q.arrowIdeal(1)[0], Q.createPath(1, [2], 0))
+
+    def test_opposite_is_cached(self):
+        self.assertIs(~self.quiver, ~self.quiver)
+        self.assertIs(~~self.quiver, self.quiver)
+
+    def test_compiled_adjacency(self):
+        compiled = self.quiver._compiled()
+        self.assertEqual(compiled.outgoingLabels(compiled.vertexIndex[1]), [0, 2])
+        self.assertEqual(compiled.incomingLabels(compiled.vertexIndex[1]), [0, 1])
+        self.assertEqual(compiled.outgoingLabels(compiled.vertexIndex[0]), [1])
+
+    def test_path_counts(self):
+        counts = self.quiver.pathCounts(6)
+        self.assertEqual(counts[0], {(0, 0): 1, (1, 1): 1})
+        for k in range(1, 7):
+            expected: dict = {}
+            for path in self.quiver.arrowIdeal(k, top=True):
+                pair = (path.source, path.target)
+                expected[pair] = expected.get(pair, 0) + 1
+            self.assertEqual(counts[k], expected)
+
+    def test_hilbert_series(self):
+        # The adjacency matrix has characteristic polynomial x^2 - x - 1.
+        numerator, denominator = self.quiver.hilbertSeries()
+        self.assertEqual(denominator, [1, -1, -1])
+        self.assertEqual(
+            hilbert.seriesExpansion(numerator, denominator, 8),
+            [sum(c.values()) for c in self.quiver.pathCounts(8)],
+        )
+        numerator, denominator = self.quiver.hilbertSeries(sources=[1], targets=[0])
+        self.assertEqual(
+            hilbert.seriesExpansion(numerator, denominator, 8),
+            [c.get((1, 0), 0) for c in self.quiver.pathCounts(8)],
+        )
+
+    def test_paths_from_to(self):
+        paths = self.quiver.pathsFromTo(1, 0, 3)
+        expected = [
+            self.quiver.createPath(1, [2], 0),
+            self.quiver.createPath(1, [0, 2], 0),
+            self.quiver.createPath(1, [0, 0, 2], 0),
+            self.quiver.createPath(1, [2, 1, 2], 0),
+        ]
+        self.assertEqual(sorted(paths), sorted(expected))
+        self.assertEqual(self.quiver.pathsFromTo(1, 0, 3, meetInTheMiddle=True), paths)
+
+    def test_paths_from_to_all_lengths(self):
+        for v in self.quiver.nodes:
+            for w in self.quiver.nodes:
+                for length in range(7):
+                    expected = [
+                        path
+                        for path in self.quiver.allPathsOutOf(v, length)
+                        if path.target == w
+                    ]
+                    if length == 0:
+                        expected = expected if v == w else []
+                    for meet in [False, True]:
+                        self.assertEqual(
+                            self.quiver.pathsFromTo(v, w, length, meet), expected
+                        )
+
+    def test_all_paths_into(self):
+        paths = self.quiver.allPathsInto(0, 2)
+        expected = [
+            self.z,
+            self.quiver.createPath(1, [0, 2], 0),
+            self.quiver.createPath(0, [1, 2], 0),
+        ]
+        self.assertEqual(sorted(paths), sorted(expected))
+
+
+class TestPathOrders(unittest.TestCase):
+    def _quiver(self, order: quiver.PathOrder) -> quiver.Quiver:
+        return quiver.Quiver(
+            q0=[0, 1],
+            q1=[0, 1, 2],
+            s={0: 1, 1: 0, 2: 1},
+            t={0: 1, 1: 1, 2: 0},
+            order=order,
+        )
+
+    def test_graded_lex_keys(self):
+        Q = self._quiver(quiver.GradedLex())
+        paths = Q.arrowIdeal(4)
+        expected = sorted(paths, key=lambda p: (-len(p), [-a for a in p.monomial]))
+        self.assertEqual(paths, expected)
+        self.assertEqual(len(set(Q.order.key(p) for p in paths)), len(paths))
+
+    def test_graded_rev_lex_keys(self):
+        Q = self._quiver(quiver.GradedRevLex())
+        paths = Q.arrowIdeal(4)
+        expected = sorted(
+            paths, key=lambda p: (-len(p), [-a for a in p.monomial[::-1]])
+        )
+        self.assertEqual(paths, expected)
+
+    def test_key_is_cached(self):
+        Q = self._quiver(quiver.GradedLex())
+        path = Q.createPath(1, [0, 2, 1], 1)
+        self.assertIsNone(path._key)
+        self.assertEqual(Q.order.key(path), path._key)
+
+    def test_stationary_paths(self):
+        Q = self._quiver(quiver.GradedLex())
+        e0, e1 = Q.arrowIdeal(0)
+        self.assertTrue(e0 < e1)
+        self.assertTrue(Q.createPath(0, [1], 1) < e0)
+
+    def test_parallel_arrow_ideal(self):
+        for order in [quiver.GradedLex(), quiver.GradedRevLex()]:
+            Q = self._quiver(order)
+            for top in [False, True]:
+                self.assertEqual(Q.arrowIdeal(5, top, workers=2), Q.arrowIdeal(5, top))
+
+    def test_pickling_drops_caches(self):
+        Q = quiver.Quiver(
+            q0=[0],
+            q1=[1],
+            s={1: 0},
+            t={1: 0},
+            order=quiver.GradedRevLex(),
+            internPaths=True,
+        )
+        Q.arrowIdeal(3)
+        ~Q
+        copy = pickle.loads(pickle.dumps(Q))
+        self.assertEqual(copy, Q)
+        self.assertIsNone(copy._compiledQuiver)
+        self.assertIsNone(copy._opposite)
+        self.assertIsNotNone(copy._internTable)
+        self.assertEqual(
+            copy.arrowIdeal(3), [copy.createPath(0, [1] * n, 0) for n in (3, 2, 1)]
+        )
+
+    def test_lazy_enumeration(self):
+        class Permuted(quiver.GradedLex):  # Lexicographic for 0 < 2 < 1.
+            _lexDirection = None  # Enumerated by the sorted fallback.
+
+            def _computeKey(self, path):
+                digits = "".join(str(2 * a % 3) for a in path.monomial)
+                return -len(path) * 10**6 - int(digits or "0")
+
+        for order in [quiver.GradedLex(), quiver.GradedRevLex(), Permuted()]:
+            Q = self._quiver(order)
+            self.assertEqual(list(Q.iterArrowIdeal(5)), Q.arrowIdeal(5))
+            self.assertEqual(
+                list(Q.iterArrowIdeal(5, top=True)), Q.arrowIdeal(5, top=True)
+            )
+            self.assertEqual(list(Q.iterArrowIdeal(0)), Q.arrowIdeal(0))
+            for v in Q.nodes:
+                self.assertEqual(
+                    list(Q.iterPathsOutOf(v, 4)),
+                    sorted(Q.allPathsOutOf(v, 4), key=order.key),
+                )
+                self.assertEqual(
+                    list(Q.iterPathsInto(v, 4)),
+                    sorted(Q.allPathsInto(v, 4), key=order.key),
+                )
+                for w in Q.nodes:
+                    self.assertEqual(
+                        list(Q.iterPathsFromTo(v, w, 4)),
+                        sorted(Q.pathsFromTo(v, w, 4), key=order.key),
+                    )
+
+    def test_lazy_enumeration_is_lazy(self):
+        Q = self._quiver(quiver.GradedLex())
+        paths = Q.iterArrowIdeal(60, top=True)
+        self.assertEqual(next(paths), Q.createPath(1, [2] + [1, 2] * 29 + [1], 1))
+
 
 class TestA5(unittest.TestCase):
     def test_number_of_arrows_A5(self):
         Q = specialquivers.createDynkinA(10)
         for k in range(1, 10):
             self.assertEqual(len(Q.arrowIdeal(k, top=True)), 10 - k)
+
+    def test_arrow_ideal_contains_all_lengths(self):
+        Q = specialquivers.createDynkinA(5)
+        self.assertEqual(len(Q.arrowIdeal(3)), 4 + 3 + 2)
+
+    def test_hilbert_series_A5(self):
+        # kQ is finite dimensional: the Hilbert series is a polynomial.
+        Q = specialquivers.createDynkinA(5)
+        numerator, denominator = Q.hilbertSeries()
+        self.assertEqual(denominator, [1])
+        self.assertEqual(numerator, [5, 4, 3, 2, 1])
@@ -0,0 +1,31 @@
+import unittest
+import pickle
+from linalg.Q import QQ, Rational
+
+
+class TestRational(unittest.TestCase):
+    def test_normalization(self):
+        self.assertEqual(Rational(6, -4), Rational(-3, 2))
+        self.assertEqual(Rational(0, -5), Rational(0))
+        self.assertEqual(Rational(-6, -4).denominator, 2)
+        self.assertEqual(~Rational(-3, 4), Rational(-4, 3))
+        self.assertEqual((~Rational(-3, 4)).denominator, 3)
+
+    def test_arithmetic(self):
+        a, b, c = Rational(1, 6), Rational(1, 3), Rational(9, 4)
+        self.assertEqual(a + b, Rational(1, 2))
+        self.assertEqual(a - b, Rational(-1, 6))
+        self.assertEqual(b * c, Rational(3, 4))
+        self.assertEqual(a / b, Rational(1, 2))
+        self.assertEqual(b - b, Rational(0))
+        self.assertEqual(a._addMul(b, c), a + b * c)
+        self.assertEqual(a._subMul(b, c), a - b * c)
+        self.assertEqual(Rational(1, 2)._subMul(b, Rational(3, 2)), Rational(0))
+
+    def test_zero_and_one(self):
+        x = Rational(5, 7)
+        self.assertIs(x._getFieldZero(), QQ().getZero())
+        self.assertIs(x._getFieldOne(), QQ().getOne())
+        self.assertFalse(Rational(0))
+        self.assertTrue(x)
+        self.assertEqual(pickle.loads(pickle.dumps(x)), x)
@@ -12,6 +12,22 @@ TEST_QUIVER = quiver.Quiver(
     # Default order GradedLex
 )
 
+# The free algebra k<x, y> on one vertex, with x = 2 > y = 1.
+FREE_QUIVER = quiver.Quiver(q0=[0], q1=[1, 2], s={1: 0, 2: 0}, t={1: 0, 2: 0})
+
+
+# Helpers.
+def P(*terms):
+    """Return the polynomial of FREE_QUIVER with terms (monomial, integer)."""
+    return polynomial.Polynomial(
+        [(FREE_QUIVER.createPath(0, list(m), 0), Rational(c)) for m, c in terms]
+    )
+
+
+def R(monomial, tail):
+    """Return the rule of FREE_QUIVER rewriting a monomial to a polynomial."""
+    return rewriting.RewritingRule(FREE_QUIVER.createPath(0, monomial, 0), tail)
+
 
 class TestRewriting(unittest.TestCase):
     # Q is the following quiver.
@@ -26,6 +42,10 @@ class TestRewriting(unittest.TestCase):
         path = self.quiver.createPath(1, [2, 1], 1)
         lower_terms = polynomial.Polynomial([(path, Rational(1))])
         self.rule = rewriting.RewritingRule(leading_term, lower_terms)
+        # In k<x, y>: x^2 -> xy - yx, y^3 -> 2 yx.
+        self.freeSystem = rewriting.RewritingSystem(
+            [R([2, 2], P(([2, 1], 1), ([1, 2], -1))), R([1, 1, 1], P(([2, 1], 2)))]
+        )
 
     def test_replacing(self):
         aaa = self.quiver.createPath(1, [3, 3, 3], 1)
@@ -89,6 +109,329 @@ class TestRewriting(unittest.TestCase):
         full_reduced = self.rule.reduceFully(to_reduce)
         self.assertEqual(full_reduced, expected)
 
+    def test_normal_form(self):
+        # Rules x^2 -> zy and yz -> e0 (the stationary path at 0).
+        e0 = self.quiver.createPath(0, [], 0)
+        second_rule = rewriting.RewritingRule(
+            self.quiver.createPath(0, [1, 2], 0),
+            polynomial.Polynomial([(e0, Rational(1))]),
+        )
+        system = rewriting.RewritingSystem([self.rule, second_rule])
+
+        # x^3 - 2 zyzy + yx^2z ---> zyx - 2 zy + yzyz ---> zyx - 2 zy + e0.
+        to_reduce = polynomial.Polynomial(
+            [
+                (self.quiver.createPath(1, [3, 3, 3], 1), Rational(1)),
+                (self.quiver.createPath(1, [2, 1, 2, 1], 1), Rational(-2)),
+                (self.quiver.createPath(0, [1, 3, 3, 2], 0), Rational(1)),
+            ]
+        )
+        expected = polynomial.Polynomial(
+            [
+                (self.quiver.createPath(1, [2, 1, 3], 1), Rational(1)),
+                (self.quiver.createPath(1, [2, 1], 1), Rational(-2)),
+                (e0, Rational(1)),
+            ]
+        )
+        normal_form = system.normalForm(to_reduce)
+        self.assertEqual(normal_form, expected)
+        self.assertEqual(normal_form.support, expected.support)
+
+    def test_normal_forms(self):
+        # The rule x^2 -> zy, and yz -> 0.
+        yz = rewriting.RewritingRule(
+            self.quiver.createPath(0, [1, 2], 0), polynomial.Polynomial([])
+        )
+        system = rewriting.RewritingSystem([self.rule, yz])
+        paths = self.quiver.arrowIdeal(4)
+        polynomials = [
+            polynomial.Polynomial(
+                [
+                    (path, Rational(i + j))
+                    for j, path in enumerate(paths[i : i + 5])
+                    if path.source == paths[i].source and path.target == paths[i].target
+                ]
+            )
+            for i in range(len(paths))
+        ]
+        expected = [system.normalForm(p) for p in polynomials]
+        self.assertEqual(list(system.normalForms(polynomials)), expected)
+        self.assertTrue(system._memo)
+        self.assertEqual(
+            list(system.normalForms(iter(polynomials), workers=2, chunkSize=3)),
+            expected,
+        )
+
+        # Changing the rules invalidates the memo table.
+        system.removeRule(yz)
+        self.assertEqual(
+            list(system.normalForms(polynomials)),
+            [system.normalForm(p) for p in polynomials],
+        )
+
+    def test_overlaps(self):
+        # x^2 overlaps itself once; xzyx overlaps x^2 on the left and right.
+        xzyx = rewriting.RewritingRule(
+            self.quiver.createPath(1, [3, 2, 1, 3], 1), polynomial.Polynomial([])
+        )
+        self.assertEqual(rewriting.overlaps(self.rule, self.rule), [1])
+        self.assertEqual(rewriting.overlaps(xzyx, self.rule), [1])
+        self.assertEqual(rewriting.overlaps(self.rule, xzyx), [1])
+        self.assertEqual(rewriting.overlaps(xzyx, xzyx), [1])
+        self.assertTrue(rewriting.rulesOverlap(self.rule, xzyx))
+        self.assertEqual(rewriting.inclusions(xzyx, self.rule), [])
+
+        zy = rewriting.RewritingRule(
+            self.quiver.createPath(1, [2, 1], 1), polynomial.Polynomial([])
+        )
+        self.assertFalse(rewriting.rulesOverlap(zy, self.rule))
+        self.assertEqual(rewriting.inclusions(xzyx, zy), [1])
+
+    def test_s_polynomial(self):
+        # x^2 * x = x * x^2 rewrites to zyx and xzy.
+        expected = polynomial.Polynomial(
+            [
+                (self.quiver.createPath(1, [2, 1, 3], 1), Rational(1)),
+                (self.quiver.createPath(1, [3, 2, 1], 1), Rational(-1)),
+            ]
+        )
+        self.assertEqual(rewriting.sPolynomial(self.rule, self.rule), expected)
+
+    def test_completion(self):
+        # Complete x^2 -> zy, yz -> 0.
+        yz = rewriting.RewritingRule(
+            self.quiver.createPath(0, [1, 2], 0), polynomial.Polynomial([])
+        )
+        system = rewriting.RewritingSystem([self.rule, yz])
+        self.assertFalse(system.isConfluent())
+
+        completed = system.complete()
+        self.assertTrue(completed.isConfluent())
+        self.assertEqual(
+            [str(rule) for rule in completed.rules],
+            [
+                str(self.quiver.createPath(1, [2, 1, 3, 2], 0)) + " ---> 0",
+                str(self.quiver.createPath(1, [3, 2, 1], 1))
+                + " ---> "
+                + str(self.quiver.createPath(1, [2, 1, 3], 1)),
+                str(self.rule),
+                str(yz),
+            ],
+        )
+
+    def test_completion_interreduces(self):
+        completed = self.freeSystem.complete()
+        self.assertTrue(completed.isConfluent())
+        self.assertEqual(len(completed.rules), 5)
+        for rule in self.freeSystem.rules:
+            relation = P((rule.leading_term.monomial, 1)) - rule.polynomial
+            self.assertEqual(completed.normalForm(relation).support, [])
+        for rule in completed.rules:  # The system is reduced.
+            others = rewriting.RewritingSystem(
+                [other for other in completed.rules if other is not rule]
+            )
+            self.assertIsNone(others._findDivisor(rule.leading_term))
+            self.assertEqual(completed.normalForm(rule.polynomial), rule.polynomial)
+
+    def test_completion_strategies(self):
+        # In k<x, y, z>: xy -> z, yz -> x, zx -> y, completed with each strategy
+        # and with and without criteria.
+        Q = quiver.Quiver(
+            q0=[0], q1=[1, 2, 3], s={1: 0, 2: 0, 3: 0}, t={1: 0, 2: 0, 3: 0}
+        )
+
+        def rule(monomial, other):
+            return rewriting.RewritingRule(
+                Q.createPath(0, monomial, 0),
+                polynomial.Polynomial([(Q.createPath(0, other, 0), Rational(1))]),
+            )
+
+        system = rewriting.RewritingSystem(
+            [rule([3, 2], [1]), rule([2, 1], [3]), rule([1, 3], [2])]
+        )
+        expected = str(system.complete(criteria=False))
+        for strategy in [
+            rewriting.NormalStrategy(),
+            rewriting.DegreeStrategy(),
+            rewriting.SugarStrategy(),
+        ]:
+            for criteria in [True, False]:
+                completion = rewriting.Completion(system, strategy, criteria)
+                self.assertEqual(str(completion.run()), expected)
+                statistics = completion.statistics
+                self.assertLessEqual(statistics["reduced"], statistics["pairs"])
+                self.assertLessEqual(statistics["zero"], statistics["reduced"])
+                if not criteria:
+                    self.assertEqual(statistics["chain"], 0)
+
+    def test_batched_completion(self):
+        # Same systems as test_completion and test_completion_interreduces.
+        yz = rewriting.RewritingRule(
+            self.quiver.createPath(0, [1, 2], 0), polynomial.Polynomial([])
+        )
+        system = rewriting.RewritingSystem([self.rule, yz])
+        self.assertEqual(str(system.complete(batched=True)), str(system.complete()))
+
+        system = self.freeSystem
+        completion = rewriting.BatchedCompletion(system)
+        completed = completion.run()
+        self.assertEqual(str(completed), str(system.complete()))
+        self.assertTrue(completed.isConfluent())
+        self.assertGreater(completion.statistics["reduced"], 0)
+
+    def test_graded_completion(self):
+        # yxy -> xyx has an infinite Gröbner basis: one rule of degree 3, and
+        # then one rule in each degree from 5 on.
+        system = rewriting.RewritingSystem([R([2, 1, 2], P(([1, 2, 1], 1)))])
+        completion = rewriting.GradedCompletion(system)
+        sizes = [len(partial.rules) for partial in completion.degrees(6)]
+        self.assertEqual(sizes, [0, 0, 0, 1, 1, 2, 3])
+        self.assertEqual(completion.degree, 6)
+        self.assertTrue(all(len(pair.word) > 6 for _, _, pair in completion._pairs))
+
+        # Raising the degree resumes the completion.
+        partial = list(completion.degrees(8))
+        self.assertEqual(len(partial), 2)
+        fresh = list(rewriting.GradedCompletion(system).degrees(8))[-1]
+        self.assertEqual(str(partial[-1]), str(fresh))
+        truncated = [rule for rule in fresh.rules if len(rule.leading_term) <= 6]
+        self.assertEqual(
+            str(rewriting.RewritingSystem(truncated)),
+            str(list(rewriting.GradedCompletion(system).degrees(6))[-1]),
+        )
+
+        # Finite Gröbner bases are computed completely.
+        yz = rewriting.RewritingRule(
+            self.quiver.createPath(0, [1, 2], 0), polynomial.Polynomial([])
+        )
+        system = rewriting.RewritingSystem([self.rule, yz])
+        self.assertEqual(
+            str(rewriting.GradedCompletion(system).run()), str(system.complete())
+        )
+
+    def test_signature_completion(self):
+        yz = rewriting.RewritingRule(
+            self.quiver.createPath(0, [1, 2], 0), polynomial.Polynomial([])
+        )
+        system = rewriting.RewritingSystem([self.rule, yz])
+        self.assertEqual(str(system.complete(signature=True)), str(system.complete()))
+
+        system = self.freeSystem
+        completion = rewriting.SignatureCompletion(system)
+        completed = completion.run()
+        self.assertEqual(str(completed), str(system.complete()))
+        self.assertTrue(completed.isConfluent())
+
+        # The criteria discard pairs that would reduce to zero.
+        plain = rewriting.SignatureCompletion(system, criteria=False)
+        self.assertEqual(str(plain.run()), str(completed))
+        self.assertGreater(completion.statistics["syzygy"], 0)
+        self.assertLess(completion.statistics["zero"], plain.statistics["zero"])
+        self.assertLess(completion.statistics["reduced"], plain.statistics["reduced"])
+
+    def test_signature_completion_statistics(self):
+        # In k<x, y>: x^2 -> yx - xy, xy^2 -> -1/2 y^3, homogeneous. The
+        # signatures save reductions to zero over the classic completion.
+        system = rewriting.RewritingSystem(
+            [
+                R([2, 2], P(([1, 2], 1), ([2, 1], -1))),
+                R([2, 1, 1], P(([1, 1, 1], -1)) * Rational(1, 2)),
+            ]
+        )
+        classic = rewriting.Completion(system)
+        completion = rewriting.SignatureCompletion(system)
+        self.assertEqual(str(completion.run()), str(classic.run()))
+        self.assertEqual(completion.statistics["checks"], 1)
+        self.assertLessEqual(
+            completion.statistics["reduced"], classic.statistics["reduced"]
+        )
+        self.assertLess(completion.statistics["zero"], classic.statistics["zero"])
+
+    def test_signature_completion_inhomogeneous(self):
+        # The rules y^3 -> -y and yxy -> -1/2 y^2 - x generate the ideal (x, y),
+        # but the rules found in low signature degrees, y -> 0 alone, are
+        # confluent before an S-polynomial of larger signature drops to x.
+        system = rewriting.RewritingSystem(
+            [
+                R([1, 1, 1], P(([1], -1))),
+                R([1, 2, 1], P(([1, 1], -1), ([2], -2)) * Rational(1, 2)),
+            ]
+        )
+        expected = str(system.complete())
+        self.assertEqual(len(system.complete().rules), 2)
+        for criteria in [True, False]:
+            completed = system.complete(signature=True, criteria=criteria)
+            self.assertEqual(str(completed), expected)
+            for rule in system.rules:
+                relation = P((rule.leading_term.monomial, 1)) - rule.polynomial
+                self.assertEqual(completed.normalForm(relation).support, [])
+
+    def test_parallel_completion(self):
+        system = self.freeSystem
+        expected = str(system.complete())
+        self.assertEqual(str(system.complete(workers=1)), expected)
+        completion = rewriting.ParallelCompletion(system, workers=2, chunkSize=1)
+        self.assertEqual(str(completion.run()), expected)
+        self.assertEqual(max(completion._versions), len(completion._changes))
+
+    def test_parallel_completion_empty_degree(self):
+        # Every pending pair of the last degrees is discarded, so that their
+        # batches have no pair to reduce.
+        system = rewriting.RewritingSystem(
+            [
+                R([1, 1, 1], P(([2, 1], -1))),
+                R([2, 2, 2], P(([2, 2, 1], 2), ([1, 1], 1))),
+            ]
+        )
+        expected = str(system.complete())
+        self.assertEqual(str(system.complete(workers=2)), expected)
+
+    def test_resident_system_updates(self):
+        yz = rewriting.RewritingRule(
+            self.quiver.createPath(0, [1, 2], 0), polynomial.Polynomial([])
+        )
+        resident = rewriting._ResidentSystem(self.quiver)
+        changes = [
+            (0, rewriting._encodeRule(self.rule)),
+            (1, rewriting._encodeRule(yz)),
+        ]
+        resident.update(0, changes[:1])
+        # Changes already applied are skipped.
+        resident.update(0, changes)
+        self.assertEqual(
+            str(resident.system), str(rewriting.RewritingSystem([self.rule, yz]))
+        )
+        resident.update(2, [(0, None)])
+        self.assertEqual(resident.version, 3)
+        self.assertEqual(str(resident.system), str(yz))
+        with self.assertRaises(AssertionError):
+            resident.update(5, [])
+
+    def test_chain_criterion(self):
+        # Monomial relations are resolved without reducing any pair.
+        xx = rewriting.RewritingRule(
+            self.quiver.createPath(1, [3, 3], 1), polynomial.Polynomial([])
+        )
+        completion = rewriting.Completion(rewriting.RewritingSystem([xx]))
+        self.assertEqual(str(completion.run()), str(rewriting.RewritingSystem([xx])))
+        self.assertEqual(completion.statistics["monomial"], 1)
+        self.assertEqual(completion.statistics["reduced"], 0)
+
+        # For x^3 -> zy, the overlap x^5 of length 1 contains x^3 inside.
+        xxx = rewriting.RewritingRule(
+            self.quiver.createPath(1, [3, 3, 3], 1),
+            polynomial.Polynomial(
+                [(self.quiver.createPath(1, [2, 1], 1), Rational(1))]
+            ),
+        )
+        system = rewriting.RewritingSystem([xxx])
+        completion = rewriting.Completion(system)
+        self.assertEqual(str(completion.run()), str(system.complete(criteria=False)))
+        self.assertEqual(completion.statistics["chain"], 1)
+        self.assertLess(
+            completion.statistics["reduced"], completion.statistics["pairs"]
+        )
+
     def test_left_divisors(self):
         path = self.quiver.createPath(1, [2, 1, 2, 1, 2, 1], 1)
 
@@ -0,0 +1,73 @@
+import unittest
+import quiver
+import polynomial
+import rewriting
+import hilbert
+from ufnarovski import NormalWordAutomaton
+from linalg.Q import Rational
+
+TEST_QUIVER = quiver.Quiver(q0=[0], q1=[1, 2], s={1: 0, 2: 0}, t={1: 0, 2: 0})
+
+
+# Helpers.
+def P(*terms):
+    return polynomial.Polynomial(
+        [(TEST_QUIVER.createPath(0, list(m), 0), Rational(c)) for m, c in terms]
+    )
+
+
+def rule(monomial, *terms):
+    return rewriting.RewritingRule(TEST_QUIVER.createPath(0, monomial, 0), P(*terms))
+
+
+def countNormalWords(system, length):
+    return [
+        sum(
+            1
+            for path in TEST_QUIVER.arrowIdeal(k, top=True)
+            if system._findDivisor(path) is None
+        )
+        for k in range(length + 1)
+    ]
+
+
+class TestNormalWordAutomaton(unittest.TestCase):
+    # Path algebra is k<x, y>, with x = α₁ and y = α₂.
+
+    def test_finite_dimensional(self):
+        # y^2 -> yx - xy, x^3 -> 2 yx.
+        system = rewriting.RewritingSystem(
+            [rule([2, 2], ([2, 1], 1), ([1, 2], -1)), rule([1, 1, 1], ([2, 1], 2))]
+        ).complete()
+        automaton = NormalWordAutomaton(system, TEST_QUIVER)
+        self.assertTrue(automaton.isFiniteDimensional())
+        self.assertEqual(automaton.dimensions(6), countNormalWords(system, 6))
+        self.assertEqual(automaton.hilbertSeries(), ([1, 2, 3, 1], [1]))
+        self.assertEqual(
+            sorted(automaton.normalWords(2), key=TEST_QUIVER.order.key),
+            [
+                path
+                for path in TEST_QUIVER.arrowIdeal(2, top=True)
+                if system._findDivisor(path) is None
+            ],
+        )
+
+    def test_infinite_dimensional(self):
+        # yx -> xy: the commutative polynomial ring k[x, y].
+        system = rewriting.RewritingSystem([rule([2, 1], ([1, 2], 1))])
+        automaton = NormalWordAutomaton(system, TEST_QUIVER)
+        self.assertFalse(automaton.isFiniteDimensional())
+        self.assertEqual(automaton.dimensions(5), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(automaton.hilbertSeries(), ([1], [1, -2, 1]))
+
+    def test_overlapping_leading_terms(self):
+        # Monomial relations x^2 = 0 and yxy = 0.
+        system = rewriting.RewritingSystem([rule([1, 1]), rule([2, 1, 2])])
+        automaton = NormalWordAutomaton(system, TEST_QUIVER)
+        self.assertFalse(automaton.isFiniteDimensional())
+        self.assertEqual(automaton.dimensions(7), countNormalWords(system, 7))
+        numerator, denominator = automaton.hilbertSeries()
+        self.assertEqual(
+            hilbert.seriesExpansion(numerator, denominator, 7),
+            countNormalWords(system, 7),
+        )
@@ -0,0 +1,143 @@
+from __future__ import annotations
+from typing import Tuple
+import hilbert
+import quiver
+from rewriting import RewritingSystem
+
+# The normal words of a rewriting system are the paths that contain no leading
+# term of a rule. They are recognized by the Aho-Corasick automaton of the
+# leading terms, run along the arrows of the quiver: a state is a vertex with
+# the longest suffix of the word read so far that is a prefix of a leading term,
+# and a word is normal as long as no state reports a match. If the system is
+# confluent, the normal words form a basis of the quotient of the path algebra
+# by the ideal of the rules, so its dimensions are counts of walks in the
+# automaton (the Ufnarovski graph).
+
+
+class NormalWordAutomaton:
+    """Finite automaton whose walks from the initial states are the normal
+    words of a rewriting system over a quiver. States are numbered from 0; the
+    initial ones, one per vertex, correspond to the stationary paths. There is
+    no state at a vertex whose stationary path is a leading term."""
+
+    def __init__(self, system: RewritingSystem, q: quiver.Quiver) -> None:
+        index = system.index
+        compiled = q._compiled()
+        root = index._root
+        forbidden = {v for v, rules in index._stationary.items() if rules}
+
+        self.quiver = q
+        self.initial: list[int] = []
+        # States are pairs (vertex id, trie node).
+        self._states: list[Tuple[int, object]] = []
+        # transitions[s] lists pairs (arrow id, next state).
+        self.transitions: list[list[Tuple[int, int]]] = []
+        numbers: dict[Tuple[int, int], int] = {}
+
+        def state(vertex: int, node) -> int:
+            key = (vertex, id(node))
+            number = numbers.get(key)
+            if number is None:
+                number = numbers[key] = len(self._states)
+                self._states.append((vertex, node))
+                self.transitions.append([])
+            return number
+
+        for i, v in enumerate(compiled.vertexLabels):
+            if v not in forbidden:
+                self.initial.append(state(i, root))
+
+        labels = compiled.arrowLabels
+        outStart, outArrows, target = (
+            compiled.outStart,
+            compiled.outArrows,
+            compiled.target,
+        )
+        s = 0
+        while s < len(self._states):  # Breadth-first search of the states.
+            vertex, node = self._states[s]
+            for a in outArrows[outStart[vertex] : outStart[vertex + 1]]:
+                end = target[a]
+                if compiled.vertexLabels[end] in forbidden:
+                    continue
+                child = index._goto(node, labels[a])
+                if child.rules or index._output(child) is not None:
+                    continue  # A leading term ends here.
+                self.transitions[s].append((a, state(end, child)))
+            s += 1
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def adjacencyMatrix(self) -> list[list[int]]:
+        """Return the matrix of numbers of transitions between states."""
+        n = len(self._states)
+        matrix = [[0] * n for _ in range(n)]
+        for s, transitions in enumerate(self.transitions):
+            for _, t in transitions:
+                matrix[s][t] += 1
+        return matrix
+
+    def dimensions(self, length: int) -> list[int]:
+        """Return the numbers of normal words of each length 0, ..., length."""
+        counts = {s: 1 for s in self.initial}
+        result = []
+        for degree in range(length + 1):
+            if degree:
+                new: dict[int, int] = {}
+                for s, count in counts.items():
+                    for _, t in self.transitions[s]:
+                        new[t] = new.get(t, 0) + count
+                counts = new
+            result.append(sum(counts.values()))
+        return result
+
+    def isFiniteDimensional(self) -> bool:
+        """Check whether there are finitely many normal words, i.e. whether no
+        cycle of the automaton is reachable from an initial state."""
+        WHITE, GREY, BLACK = 0, 1, 2
+        colour = [WHITE] * len(self._states)
+        for initial in self.initial:
+            if colour[initial] != WHITE:
+                continue
+            colour[initial] = GREY
+            stack = [(initial, iter(self.transitions[initial]))]
+            while stack:
+                s, transitions = stack[-1]
+                for _, t in transitions:
+                    if colour[t] == GREY:
+                        return False
+                    if colour[t] == WHITE:
+                        colour[t] = GREY
+                        stack.append((t, iter(self.transitions[t])))
+                        break
+                else:
+                    colour[s] = BLACK
+                    stack.pop()
+        return True
+
+    def hilbertSeries(self) -> Tuple[list[int], list[int]]:
+        """Return the generating function of the numbers of normal words of
+        each length as a pair of integer polynomials (numerator, denominator),
+        listed by increasing degree. The fraction is not reduced."""
+        n = len(self._states)
+        left = [0] * n
+        for s in self.initial:
+            left[s] = 1
+        return hilbert.walkSeries(self.adjacencyMatrix(), left, [1] * n)
+
+    def normalWords(self, length: int) -> list[quiver._Path]:
+        """Return the normal words of the given length."""
+        compiled = self.quiver._compiled()
+        labels, vertices = compiled.arrowLabels, compiled.vertexLabels
+        walks = [(self._states[s][0], (), s) for s in self.initial]
+        for _ in range(length):
+            walks = [
+                (start, monomial + (labels[a],), t)
+                for start, monomial, s in walks
+                for a, t in self.transitions[s]
+            ]
+        return [
+            self.quiver._path(vertices[start], monomial, vertices[self._states[s][0]])
+            for start, monomial, s in walks
+        ]